@@ -0,0 +1,7 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Latency benchmarks of the solve functions.
+
+Run `python -m benchmarks --help` from the repository root for usage.
+"""
@@ -0,0 +1,10 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Entry point of `python -m benchmarks`."""
+
+import sys
+
+from .solve import main
+
+sys.exit(main())
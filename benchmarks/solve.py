@@ -0,0 +1,330 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Latency benchmark of every public `solve_*` function.
+
+The parameter grids are the validated case groups of the test suite (`tests/test_*/.../test_<module>.py`), so every
+method, distribution and alternative covered by the tests, including the exact and t-based paths, is benchmarked.
+
+For each function the benchmark records:
+
+- the wall-clock time per solve, as percentiles over the grid (the fastest of `--repeat` runs is kept per case);
+- the number of evaluations of the module's objective (`_power`, `_precision` or `_distance`) per solve;
+- the number of cases that raised, or were skipped because the case does not provide a required parameter.
+
+Usage, from the repository root:
+
+    python -m benchmarks --output bench.json
+    python -m benchmarks --filter proportion.single --compare benchmarks/baseline.json
+
+The exit status is 1 if `--compare` flags a regression: a median time above the baseline by more than `--tolerance`
+(and `--min-delta` microseconds), more evaluations per solve, or more errors than in the baseline. Timings depend on
+the machine, so regenerate `benchmarks/baseline.json` with `--output` on the machine used for the comparison.
+"""
+
+import argparse
+import importlib
+import inspect
+import json
+import platform
+import sys
+import time
+import warnings
+
+from collections.abc import Callable
+from collections.abc import Iterator
+from dataclasses import asdict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import numpy as np
+import scipy
+
+import pystatpower
+
+from pystatpower._distributions import _ppf_cache_clear
+from pystatpower.exceptions import SolutionNotFoundError
+
+MODULES = [
+    "correlation.ci",
+    "correlation.inequality",
+    "mean.single.ci",
+    "mean.single.inequality",
+    "mean.single.noninferiority",
+    "mean.single.superiority",
+    "mean.independent.ci",
+    "mean.independent.inequality",
+    "mean.independent.noninferiority",
+    "mean.independent.superiority",
+    "proportion.single.ci",
+    "proportion.single.inequality",
+    "proportion.single.noninferiority",
+    "proportion.single.superiority",
+    "proportion.single.equivalence",
+    "proportion.independent.ci",
+    "proportion.independent.inequality",
+    "proportion.independent.noninferiority",
+    "proportion.independent.superiority",
+    "misc.observe_at_least_one_event",
+]
+
+OBJECTIVES = ("_power", "_precision", "_distance")
+
+PERCENTILES = (50, 90, 99)
+
+COUNTERPARTS = {
+    "mean": "null_mean",
+    "null_mean": "mean",
+    "treatment_mean": "reference_mean",
+    "reference_mean": "treatment_mean",
+    "proportion": "null_proportion",
+    "null_proportion": "proportion",
+    "treatment_proportion": "reference_proportion",
+    "reference_proportion": "treatment_proportion",
+    "correlation": "null_correlation",
+    "null_correlation": "correlation",
+}
+
+
+def _test_module_name(module: str) -> str:
+    """Return the name of the test module of a module, e.g. `tests.test_mean.test_single.test_inequality`."""
+    return "tests." + ".".join(f"test_{part}" for part in module.split("."))
+
+
+def _cases(module: str) -> list[dict[str, Any]]:
+    """Return the parameter grid of a module, taken from the case group of its test module."""
+    test_module = importlib.import_module(_test_module_name(module))
+    return [{k: v for k, v in asdict(case).items() if v is not None} for case in test_module.case_group]
+
+
+def _with_derived_params(case: dict[str, Any], target: str) -> dict[str, Any]:
+    """Add the parameters the tests derive from a case, namely the `ratio` of sample sizes and the search `direction`."""
+    case = dict(case)
+    if "ratio" not in case and {"treatment_size", "reference_size"} <= case.keys():
+        case["ratio"] = case["treatment_size"] / case["reference_size"]
+    if "direction" not in case:
+        value, counterpart = case.get(target), case.get(COUNTERPARTS.get(target), 0)
+        greater = value is None or value > counterpart
+        case["direction"] = "greater" if greater else "less"
+    return case
+
+
+def _solve_functions(module: ModuleType) -> Iterator[tuple[str, Callable[..., Any]]]:
+    """Yield the public solve functions of a module."""
+    for name, func in inspect.getmembers(module, inspect.isfunction):
+        if name.startswith("solve_") and func.__module__ == module.__name__:
+            yield name, func
+
+
+class _Counter:
+    """Count the calls of the objective of a module, by temporarily replacing the module global."""
+
+    def __init__(self, module: ModuleType) -> None:
+        self.module = module
+        self.name = next((name for name in OBJECTIVES if hasattr(module, name)), None)
+        self.count = 0
+
+    def __enter__(self) -> "_Counter":
+        if self.name is not None:
+            self.original = getattr(self.module, self.name)
+
+            def counted(*args: Any, **kwargs: Any) -> Any:
+                self.count += 1
+                return self.original(*args, **kwargs)
+
+            setattr(self.module, self.name, counted)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self.name is not None:
+            setattr(self.module, self.name, self.original)
+
+
+def _summarize(times_ns: list[int], evaluations: list[int], errors: int, skipped: int) -> dict[str, Any]:
+    """Summarize the measurements of one function."""
+    summary: dict[str, Any] = {"cases": len(times_ns), "errors": errors, "skipped": skipped}
+    if times_ns:
+        times_us = np.asarray(times_ns) / 1e3
+        summary["time_us"] = {f"p{q}": float(np.percentile(times_us, q)) for q in PERCENTILES}
+        summary["time_us"]["mean"] = float(times_us.mean())
+        summary["evaluations"] = {"mean": float(np.mean(evaluations)), "max": int(np.max(evaluations))}
+    return summary
+
+
+def benchmark_function(
+    module: ModuleType,
+    func: Callable[..., Any],
+    cases: list[dict[str, Any]],
+    *,
+    repeat: int = 1,
+) -> dict[str, Any]:
+    """Benchmark a solve function over a parameter grid.
+
+    Args:
+        module:
+            The module defining `func`, whose objective is counted.
+        func:
+            The solve function.
+        cases:
+            The parameter grid. Parameters not accepted by `func` are dropped from each case.
+        repeat:
+            Number of runs per case. The fastest one is recorded.
+
+    Returns:
+        The summary of the measurements.
+    """
+    signature = inspect.signature(func)
+    required = {name for name, param in signature.parameters.items() if param.default is inspect.Parameter.empty}
+
+    times_ns, evaluations = [], []
+    errors = skipped = 0
+    _ppf_cache_clear()
+    target = func.__name__.removeprefix("solve_")
+    for case in cases:
+        kwargs = {k: v for k, v in _with_derived_params(case, target).items() if k in signature.parameters}
+        if not required <= kwargs.keys():
+            skipped += 1
+            continue
+
+        best, count = None, 0
+        for _ in range(repeat):
+            with _Counter(module) as counter, warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                start = time.perf_counter_ns()
+                try:
+                    func(**kwargs)
+                except (ValueError, RuntimeError, ArithmeticError, SolutionNotFoundError):
+                    errors += 1
+                    break
+                elapsed = time.perf_counter_ns() - start
+            best, count = elapsed if best is None else min(best, elapsed), counter.count
+        else:
+            times_ns.append(best)
+            evaluations.append(count)
+
+    return _summarize(times_ns, evaluations, errors, skipped)
+
+
+def run(*, pattern: str = "", repeat: int = 1, max_cases: int | None = None) -> dict[str, Any]:
+    """Benchmark every public solve function whose qualified name contains `pattern`.
+
+    Args:
+        pattern:
+            Substring filter on the qualified name, e.g. `'proportion.single'` or `'solve_size'`.
+        repeat:
+            Number of runs per case.
+        max_cases:
+            Maximum number of cases per function. The grid is subsampled evenly if it is larger.
+
+    Returns:
+        The benchmark report, with the environment under `'meta'` and the summaries under `'results'`.
+    """
+    results = {}
+    for module_name in MODULES:
+        module = importlib.import_module(f"pystatpower.{module_name}")
+        cases = _cases(module_name)
+        if max_cases is not None and len(cases) > max_cases:
+            cases = [cases[i] for i in np.linspace(0, len(cases) - 1, max_cases).astype(int)]
+        for name, func in _solve_functions(module):
+            qualname = f"{module_name}.{name}"
+            if pattern in qualname:
+                results[qualname] = benchmark_function(module, func, cases, repeat=repeat)
+
+    meta = {
+        "pystatpower": pystatpower.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "max_cases": max_cases,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = 0.5,
+    min_delta_us: float = 10.0,
+) -> list[str]:
+    """Compare a report against a baseline report.
+
+    Args:
+        report:
+            The current report.
+        baseline:
+            The baseline report.
+        tolerance:
+            Relative increase of the median time tolerated before a regression is flagged.
+        min_delta_us:
+            Absolute increase of the median time, in microseconds, below which no regression is flagged, as timings
+            of a few microseconds are dominated by noise.
+
+    Returns:
+        A description of every regression found.
+    """
+    regressions = []
+    for name, current in report["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None or "time_us" not in previous or "time_us" not in current:
+            continue
+
+        ratio = current["time_us"]["p50"] / previous["time_us"]["p50"]
+        if ratio > 1 + tolerance and current["time_us"]["p50"] - previous["time_us"]["p50"] > min_delta_us:
+            regressions.append(f"{name}: median time {ratio:.2f}x the baseline")
+        if current["evaluations"]["mean"] > previous["evaluations"]["mean"] + 1e-9:
+            regressions.append(
+                f"{name}: {current['evaluations']['mean']:.1f} evaluations per solve, "
+                f"baseline {previous['evaluations']['mean']:.1f}"
+            )
+        if current["errors"] > previous["errors"]:
+            regressions.append(f"{name}: {current['errors']} errors, baseline {previous['errors']}")
+    return regressions
+
+
+def _print_table(report: dict[str, Any]) -> None:
+    """Print the report as a table."""
+    header = f"{'function':<58} {'cases':>6} {'err':>4} {'p50 µs':>10} {'p90 µs':>10} {'p99 µs':>10} {'evals':>7}"
+    print(header)
+    print("-" * len(header))
+    for name, summary in report["results"].items():
+        if "time_us" not in summary:
+            print(f"{name:<58} {summary['cases']:>6} {summary['errors']:>4}")
+            continue
+        t = summary["time_us"]
+        print(
+            f"{name:<58} {summary['cases']:>6} {summary['errors']:>4} "
+            f"{t['p50']:>10.1f} {t['p90']:>10.1f} {t['p99']:>10.1f} {summary['evaluations']['mean']:>7.1f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run functions whose qualified name contains this")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the fastest one is kept")
+    parser.add_argument("--max-cases", type=int, default=None, help="maximum number of cases per function")
+    parser.add_argument("--output", type=Path, default=None, help="write the JSON report to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="tolerated relative increase of median time")
+    parser.add_argument("--min-delta", type=float, default=10.0, help="tolerated absolute increase of median time, µs")
+    args = parser.parse_args(argv)
+
+    report = run(pattern=args.filter, repeat=args.repeat, max_cases=args.max_cases)
+    _print_table(report)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, tolerance=args.tolerance, min_delta_us=args.min_delta)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
@@ -6,18 +6,52 @@
 Documentation is available in the docstrings and online at https://pystatpower.readthedocs.io/.
 """
 
-from importlib.metadata import version
+from typing import TYPE_CHECKING
+from typing import Any
 
-from . import correlation
-from . import mean
-from . import misc
-from . import proportion
+from ._lazy import _attach
 
-__version__ = version("pystatpower")
+if TYPE_CHECKING:
+    from . import aio
+    from . import batch
+    from . import cache
+    from . import cli
+    from . import correlation
+    from . import diagnostics
+    from . import mean
+    from . import misc
+    from . import proportion
+    from . import serve
+    from . import simulation
+    from . import tables
 
 __all__ = [
     "correlation",
     "mean",
     "proportion",
     "misc",
+    "batch",
+    "diagnostics",
+    "tables",
+    "cache",
+    "aio",
+    "serve",
+    "cli",
+    "simulation",
 ]
+
+_getattr, _dir = _attach(__name__, __all__)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        from importlib.metadata import version
+
+        globals()["__version__"] = version("pystatpower")
+        return globals()["__version__"]
+
+    return _getattr(name)
+
+
+def __dir__() -> list[str]:
+    return sorted({*_dir(), "__version__"})
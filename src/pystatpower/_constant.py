@@ -1,11 +1,24 @@
 # Copyright (C) 2024-present The Package Authors
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-# 定义一些常数
+# 定义一些常数，求解函数的搜索范围、容差和迭代次数均由此处统一配置
 
 
-# 样本量下限，即便计算出的样本量小于这个值，也返回这个值
+# 样本量下限，即能够估计标准差的最小样本量
 LOWER_LIMIT_OF_SAMPLE_SIZE = 2
 
 # 样本量搜索上限
-SAMPLE_SIZE_SEARCH_MAX = 1000000
+SAMPLE_SIZE_SEARCH_MAX = 1e12
+
+# 两独立样本率精确检验的样本量搜索上限（较小一组），其拒绝域的计算量随两组样本量之积增长
+EXACT_SAMPLE_SIZE_SEARCH_MAX = 2000
+
+# 求根时搜索区间向无穷方向扩展的上限（绝对值）
+ROOT_SEARCH_MAX = 1e12
+
+# 求根的绝对容差与相对容差
+ROOT_XTOL = 2e-12
+ROOT_RTOL = 8.881784197001252e-16
+
+# 求根的最大迭代次数，同时也是搜索区间的最大扩展次数
+ROOT_MAXITER = 100
@@ -0,0 +1,176 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""A module containing fast quantile and distribution functions of the distributions used by the tests.
+
+Critical values such as `norm.ppf(1 - alpha / 2)` depend only on the significance level (and the degrees of freedom),
+yet they are recomputed in every iteration of a root solve. The quantile functions in this module memoize scalar
+calls in a bounded, thread-safe LRU cache keyed by `(distribution, quantile, *parameters)`. Array inputs are passed
+to SciPy directly, since they rarely repeat.
+
+The noncentral t distribution function `_nct_cdf` dominates the cost of the t-test power functions, and is evaluated
+with the underlying `scipy.special.nctdtr` ufunc rather than through `scipy.stats.nct`.
+
+The power and precision functions call SciPy's distributions only through this module, so that the time spent in them
+is accounted for by `diagnostics.record()`.
+"""
+
+import math
+
+from functools import lru_cache
+from typing import Literal
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+from scipy.integrate import quad
+from scipy.special import gammaln
+from scipy.special import nctdtr
+from scipy.stats import beta
+from scipy.stats import binom
+from scipy.stats import chi
+from scipy.stats import f
+from scipy.stats import norm
+from scipy.stats import t
+
+from ._math_utils import _all_scalar
+from ._math_utils import _scalar_or_array
+from .diagnostics import _timed
+
+_DISTRIBUTIONS = {"norm": norm, "t": t, "binom": binom}
+
+_CACHE_MAXSIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_MAXSIZE)
+def _cached_ppf(dist: Literal["norm", "t", "binom"], q: float, *params: float) -> float:
+    """Calculate a scalar quantile, memoized on all arguments."""
+    return float(_DISTRIBUTIONS[dist].ppf(q, *params))
+
+
+@_timed
+def _ppf(dist: Literal["norm", "t", "binom"], q: ArrayLike, *params: ArrayLike) -> float | np.ndarray:
+    """Calculate the quantile of a distribution, using the cache if all arguments are scalars."""
+    if _all_scalar(q, *params):
+        return _cached_ppf(dist, float(q), *(float(param) for param in params))
+    return _DISTRIBUTIONS[dist].ppf(q, *params)
+
+
+def _norm_ppf(q: ArrayLike) -> float | np.ndarray:
+    """Calculate the quantile of the standard normal distribution."""
+    return _ppf("norm", q)
+
+
+def _t_ppf(q: ArrayLike, df: ArrayLike) -> float | np.ndarray:
+    """Calculate the quantile of the Student's t distribution."""
+    return _ppf("t", q, df)
+
+
+def _binom_ppf(q: ArrayLike, n: ArrayLike, p: ArrayLike) -> float | np.ndarray:
+    """Calculate the quantile of the binomial distribution."""
+    return _ppf("binom", q, n, p)
+
+
+@_timed
+def _norm_cdf(x: ArrayLike) -> float | np.ndarray:
+    """Calculate the distribution function of the standard normal distribution."""
+    return norm.cdf(x)
+
+
+@_timed
+def _binom_cdf(k: ArrayLike, n: ArrayLike, p: ArrayLike) -> float | np.ndarray:
+    """Calculate the distribution function of the binomial distribution."""
+    return binom.cdf(k, n, p)
+
+
+@_timed
+def _binom_pmf(k: ArrayLike, n: ArrayLike, p: ArrayLike) -> float | np.ndarray:
+    """Calculate the probability mass function of the binomial distribution."""
+    return binom.pmf(k, n, p)
+
+
+@_timed
+def _binom_pmfs(n: int, p: ArrayLike) -> np.ndarray:
+    """Calculate the probabilities of all counts from 0 to `n` of the binomial distribution, at each proportion `p`.
+
+    The probabilities are computed in log space from the binomial coefficients, shared by all proportions, which is an
+    order of magnitude faster than `binom.pmf` for the matrices of the exact tests of two proportions.
+
+    Returns:
+        An array with the shape of `p` plus a last axis of length `n + 1`.
+    """
+    k = np.arange(n + 1)
+    p = np.asarray(p, dtype=float)[..., np.newaxis]
+    log_coef = gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_pmf = log_coef + np.where(k > 0, k * np.log(p), 0) + np.where(k < n, (n - k) * np.log1p(-p), 0)
+    return np.exp(log_pmf)
+
+
+@_timed
+def _beta_ppf(q: ArrayLike, a: ArrayLike, b: ArrayLike) -> float | np.ndarray:
+    """Calculate the quantile of the beta distribution, without caching as the shape parameters rarely repeat."""
+    return beta.ppf(q, a, b)
+
+
+@_timed
+def _f_ppf(q: ArrayLike, dfn: ArrayLike, dfd: ArrayLike) -> float | np.ndarray:
+    """Calculate the quantile of the F distribution, without caching as the degrees of freedom rarely repeat."""
+    return f.ppf(q, dfn, dfd)
+
+
+def _nct_cdf_quad(x: float, df: float, nc: float) -> float:
+    """Calculate the noncentral t distribution function by numerical integration.
+
+    If `T = (Z + nc) / sqrt(V / df)` with `Z ~ N(0, 1)` and `V ~ χ²(df)`, then `P(T <= x) = E[Φ(x S / sqrt(df) - nc)]`
+    where `S = sqrt(V)` follows the chi distribution with `df` degrees of freedom.
+    """
+    if not (df > 0 and math.isfinite(x) and math.isfinite(nc)):
+        return math.nan
+
+    def integrand(s: float) -> float:
+        return norm.cdf(x * s / math.sqrt(df) - nc) * chi.pdf(s, df)
+
+    return min(max(quad(integrand, 0, math.inf, epsabs=1e-13, epsrel=1e-12)[0], 0.0), 1.0)
+
+
+@_timed
+def _nct_cdf(x: ArrayLike, df: ArrayLike, nc: ArrayLike) -> float | np.ndarray:
+    """Calculate the distribution function of the noncentral t distribution.
+
+    The `scipy.special.nctdtr` ufunc (Boost's implementation) is called directly, which skips the argument checking and
+    dispatch of `scipy.stats.nct.cdf` and is about 8 times faster for scalar arguments, with identical results.
+
+    `nctdtr` returns NaN far in the tail opposite to the noncentrality, e.g. for small `x` and large positive `nc`
+    (https://github.com/scipy/scipy/issues/25470). Such values are recomputed from the reflection
+    `F(x; df, nc) = 1 - F(-x; df, -nc)`, which is accurate to about 1e-16 in absolute terms, and the few values still
+    NaN, with `df` below 2, by numerical integration with an absolute error below 1e-12.
+    """
+    if _all_scalar(x, df, nc):
+        cdf = float(nctdtr(df, nc, x))
+        if math.isnan(cdf):
+            cdf = 1 - float(nctdtr(df, -nc, -x))
+        if math.isnan(cdf):
+            cdf = _nct_cdf_quad(float(x), float(df), float(nc))
+        return cdf
+
+    x, df, nc = np.broadcast_arrays(
+        np.asarray(x, dtype=float), np.asarray(df, dtype=float), np.asarray(nc, dtype=float)
+    )
+    cdf = nctdtr(df, nc, x)
+    nan = np.isnan(cdf)
+    if np.any(nan):
+        cdf[nan] = 1 - nctdtr(df[nan], -nc[nan], -x[nan])
+        for i in np.flatnonzero(np.isnan(cdf)):
+            cdf.flat[i] = _nct_cdf_quad(x.flat[i], df.flat[i], nc.flat[i])
+    return _scalar_or_array(cdf)
+
+
+def _ppf_cache_info() -> tuple[int, int, int | None, int]:
+    """Return the statistics of the quantile cache, as a named tuple `(hits, misses, maxsize, currsize)`."""
+    return _cached_ppf.cache_info()
+
+
+def _ppf_cache_clear() -> None:
+    """Clear the quantile cache and its statistics."""
+    _cached_ppf.cache_clear()
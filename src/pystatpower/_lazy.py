@@ -0,0 +1,41 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""A module containing the lazy loading of subpackages and submodules (PEP 562)."""
+
+import importlib
+import sys
+
+from collections.abc import Callable
+from types import ModuleType
+
+
+def _attach(package: str, submodules: list[str]) -> tuple[Callable[[str], ModuleType], Callable[[], list[str]]]:
+    """Create the module-level `__getattr__` and `__dir__` of a package whose submodules are loaded on first access.
+
+    Importing a package then costs nothing beyond its `__init__` module, and the submodules, together with SciPy and
+    NumPy, are only imported once one of them is actually used.
+
+    Args:
+        package:
+            The `__name__` of the package.
+        submodules:
+            Names of the submodules to be loaded lazily.
+
+    Returns:
+        The `__getattr__` and `__dir__` functions of the package.
+    """
+
+    def getattr_(name: str) -> ModuleType:
+        if name in submodules:
+            module = importlib.import_module(f"{package}.{name}")
+            setattr(sys.modules[package], name, module)
+            return module
+
+        msg = f"module {package!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def dir_() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *submodules})
+
+    return getattr_, dir_
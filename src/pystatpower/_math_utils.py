@@ -7,9 +7,32 @@ from math import inf
 from math import sqrt
 from typing import TypeAlias
 
+import numpy as np
+
+from numpy.typing import ArrayLike
+
 Domain: TypeAlias = tuple[float, float]
 
 
+def _asarray(x: ArrayLike | None, /) -> float | np.ndarray | None:
+    """Convert an array-like input to a float array, leaving scalars and None untouched."""
+    if x is None or np.ndim(x) == 0:
+        return x
+    return np.asarray(x, dtype=float)
+
+
+def _all_scalar(*xs: ArrayLike | None) -> bool:
+    """Return whether all inputs are scalars (or None)."""
+    return all(np.ndim(x) == 0 for x in xs)
+
+
+def _scalar_or_array(x: ArrayLike, /) -> float | np.ndarray:
+    """Return a Python float for 0-d input, otherwise a float array."""
+    if np.ndim(x) == 0:
+        return float(x)
+    return np.asarray(x, dtype=float)
+
+
 def _domain_square_root_of_quad(a: float, b: float, c: float, /) -> Domain | tuple[Domain, Domain] | float | None:
     r"""Solve the domain of the function f(x) = \sqrt{ax^2+bx+c} (a ≠ 0)."""
     delta = b**2 - 4 * a * c
@@ -0,0 +1,627 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""A module containing root-finding routines shared by the solve functions."""
+
+from collections.abc import Callable
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from math import ceil
+from math import floor
+from math import inf
+from math import isfinite
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+from scipy.optimize import brentq
+
+from ._constant import ROOT_MAXITER
+from ._constant import ROOT_RTOL
+from ._constant import ROOT_SEARCH_MAX
+from ._constant import ROOT_XTOL
+from ._constant import SAMPLE_SIZE_SEARCH_MAX
+from .diagnostics import _record_search
+from .exceptions import SolutionNotFoundError
+
+
+@dataclass
+class _Slot:
+    """An outermost search of a solve within a sweep.
+
+    Attributes:
+        guess:
+            The solution extrapolated from the previous solves, or `None` if there is none yet.
+        step:
+            The expected distance from `guess` to the solution, or `None` if unknown.
+        root:
+            The solution found by the search, set by the search itself.
+    """
+
+    guess: float | None = None
+    step: float | None = None
+    root: float | None = None
+
+
+class _Continuation:
+    """The state of a sweep over one parameter of a solve function.
+
+    The solves of a sweep run the same sequence of searches, whose solutions move smoothly with the swept parameter.
+    The solutions of the outermost searches of the last two solves are kept, in the order of the searches, and each
+    search of the next solve starts from their linear extrapolation. Searches nested within another search, e.g. the
+    confidence limits evaluated within a sample size search, are not continued, as their number varies between solves.
+
+    Attributes:
+        position:
+            The value of the swept parameter in the current solve.
+        solutions:
+            The solutions of the outermost searches of the current solve that succeeded, by their order in the solve.
+        memo:
+            A cache shared by the solves of the sweep, e.g. for the rejection regions of exact tests, which do not
+            depend on the swept parameter.
+    """
+
+    def __init__(self) -> None:
+        self.position = 0.0
+        self.solutions: dict[int, float] = {}
+        self.memo: dict[tuple[object, ...], object] = {}
+        self._history: list[list[tuple[float, float]]] = []
+        self._index = 0
+        self._depth = 0
+
+    def advance(self, position: float) -> None:
+        """Start the next solve of the sweep, at `position` of the swept parameter."""
+        self.position, self._index = position, 0
+        self.solutions = {}
+
+    def seed(self, guesses: list[float]) -> None:
+        """Start the outermost searches of the next solve from `guesses`, in the order of the searches.
+
+        The history of the previous solves is discarded. A guess that is not finite leaves its search unguided.
+        """
+        self._history = [[(self.position, guess)] if isfinite(guess) else [] for guess in guesses]
+
+    @contextmanager
+    def search(self) -> Generator[_Slot | None, None, None]:
+        """Enter a search, yielding its slot if it is an outermost search."""
+        if self._depth > 0:
+            yield None
+            return
+
+        index = self._index
+        self._index += 1
+        if index == len(self._history):
+            self._history.append([])
+        history = self._history[index]
+
+        slot = _Slot()
+        if len(history) == 1 or (len(history) == 2 and history[0][0] == history[1][0]):
+            slot.guess = history[-1][1]
+        elif len(history) == 2:
+            (p0, r0), (p1, r1) = history
+            slot.guess = r1 + (r1 - r0) / (p1 - p0) * (self.position - p1)
+            slot.step = abs(slot.guess - r1) / 4 or None
+
+        self._depth += 1
+        try:
+            yield slot
+        finally:
+            self._depth -= 1
+        if slot.root is not None:
+            history[:] = [*history[-1:], (self.position, slot.root)]
+            self.solutions[index] = slot.root
+
+
+_continuation: ContextVar[_Continuation | None] = ContextVar("_continuation", default=None)
+
+
+@contextmanager
+def _continue(state: _Continuation) -> Generator[_Continuation, None, None]:
+    """Continue the searches of the solves made within the block from the previous solves of the sweep `state`."""
+    token = _continuation.set(state)
+    try:
+        yield state
+    finally:
+        _continuation.reset(token)
+
+
+@contextmanager
+def _search() -> Generator[_Slot | None, None, None]:
+    """Enter a search, yielding its slot within a sweep, or `None` outside of a sweep and for nested searches."""
+    state = _continuation.get()
+    if state is None:
+        yield None
+    else:
+        with state.search() as slot:
+            yield slot
+
+
+def _chandrupatla(
+    f: Callable[..., np.ndarray],
+    a: ArrayLike,
+    b: ArrayLike,
+    *,
+    args: tuple[ArrayLike, ...] = (),
+    xtol: float = ROOT_XTOL,
+    rtol: float = ROOT_RTOL,
+    maxiter: int = ROOT_MAXITER,
+    strict: bool = True,
+) -> np.ndarray:
+    """Find the roots of many scalar functions at once, using Chandrupatla's method.
+
+    Every element is an independent root-finding problem on the bracket `[a, b]`. All elements are advanced together,
+    and in each iteration `f` is called once with the trial points and the matching `args` of the elements that have
+    not yet converged, so the cost is a few dozen vectorized evaluations rather than a few dozen per element.
+
+    Args:
+        f:
+            A vectorized function called as `f(x, *args)`, returning an array with the same shape as `x`.
+        a:
+            Lower end of the brackets.
+        b:
+            Upper end of the brackets.
+        args:
+            Extra arguments passed to `f`. They are broadcast with `a` and `b`, and sliced to the active elements.
+        xtol:
+            Absolute tolerance of the roots.
+        rtol:
+            Relative tolerance of the roots.
+        maxiter:
+            Maximum number of iterations.
+        strict:
+            Whether to raise if any element cannot be solved. Otherwise, the roots of those elements are `NaN`, and the
+            other elements are still solved.
+
+    Returns:
+        The roots, with the broadcast shape of `a`, `b` and `args`.
+
+    Raises:
+        SolutionNotFoundError: If `strict` is true and, for any element, `f(a)` and `f(b)` have the same sign, `f` is
+            `NaN`, or the iteration does not converge within `maxiter` iterations.
+    """
+    a, b, *args = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float), *args)
+    shape = a.shape
+    x1, x2 = a.ravel().copy(), b.ravel().copy()
+    args = [np.ravel(arg) for arg in args]
+
+    f1 = np.asarray(f(x1, *args), dtype=float)
+    f2 = np.asarray(f(x2, *args), dtype=float)
+    unbracketed = (np.sign(f1) * np.sign(f2) > 0) | np.isnan(f1) | np.isnan(f2)
+    if strict and np.any(unbracketed):
+        msg = "The function values at the bracket ends must have opposite signs for every element."
+        raise SolutionNotFoundError(msg)
+
+    x3, f3 = x2.copy(), f2.copy()
+    root = np.where(unbracketed, np.nan, np.where(f1 == 0, x1, x2))
+    active = np.flatnonzero((f1 != 0) & (f2 != 0) & ~unbracketed)
+    t = np.full(x1.shape, 0.5)
+
+    for _ in range(maxiter):
+        if active.size == 0:
+            return root.reshape(shape)
+
+        i = active
+        xt = x1[i] + t[i] * (x2[i] - x1[i])
+        ft = np.asarray(f(xt, *(arg[i] for arg in args)), dtype=float)
+        nan = np.isnan(ft)
+        if np.any(nan):
+            if strict:
+                msg = "The function value is NaN; the solver cannot continue."
+                raise SolutionNotFoundError(msg)
+            root[i[nan]] = np.nan
+            active, xt, ft = i[~nan], xt[~nan], ft[~nan]
+            i = active
+            if i.size == 0:
+                continue
+
+        same = np.sign(ft) == np.sign(f1[i])
+        x3[i] = np.where(same, x1[i], x2[i])
+        f3[i] = np.where(same, f1[i], f2[i])
+        x2[i] = np.where(same, x2[i], x1[i])
+        f2[i] = np.where(same, f2[i], f1[i])
+        x1[i], f1[i] = xt, ft
+
+        xa, xb, xc, fa, fb, fc = x1[i], x2[i], x3[i], f1[i], f2[i], f3[i]
+        better = np.abs(fa) < np.abs(fb)
+        xm = np.where(better, xa, xb)
+        fm = np.where(better, fa, fb)
+        tol = 2 * rtol * np.abs(xm) + xtol
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tl = tol / np.abs(xb - xa)
+        done = (tl > 0.5) | (fm == 0)
+        root[i] = xm
+
+        # Use inverse quadratic interpolation when it is safe to do so, otherwise fall back to bisection.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xi = (xa - xb) / (xc - xb)
+            phi = (fa - fb) / (fc - fb)
+            iqi = (phi**2 < xi) & ((1 - phi) ** 2 < 1 - xi)
+            t_iqi = fa / (fb - fa) * fc / (fb - fc)
+            t_iqi += (xc - xa) / (xb - xa) * fa / (fc - fa) * fb / (fc - fb)
+        t[i] = np.clip(np.where(iqi, t_iqi, 0.5), np.minimum(tl, 0.5), np.maximum(1 - tl, 0.5))
+
+        active = i[~done]
+
+    if active.size == 0 or not strict:
+        root[active] = np.nan
+        return root.reshape(shape)
+
+    msg = f"Failed to converge within {maxiter} iterations."
+    raise SolutionNotFoundError(msg)
+
+
+def _min_sizes(
+    f: Callable[..., np.ndarray],
+    lb: float,
+    ub: float = SAMPLE_SIZE_SEARCH_MAX,
+    *,
+    args: tuple[ArrayLike, ...] = (),
+) -> np.ndarray:
+    """Find the smallest integer sample sizes at which many monotone functions reach zero, all at once.
+
+    This is the vectorized counterpart of `_min_size`, with the same search range and result for every element. The
+    elements already solved at the lower end return it, and the others are bracketed by the search range and solved
+    together by `_chandrupatla` on a logarithmic scale, where power curves are far closer to linear than on the
+    original scale. The continuous roots are then rounded up, and checked on the integers.
+
+    It backs the `solve_size` functions accepting array-likes, i.e. those of `mean.single.inequality`,
+    `proportion.independent.inequality` and `correlation.inequality`. The other `solve_size` functions only accept
+    scalars, and solve them with `_min_size`.
+
+    Args:
+        f:
+            A vectorized function called as `f(size, *args)`, increasing in the sample size.
+        lb:
+            Lower end of the search range. The smallest integer considered is `ceil(lb)`.
+        ub:
+            Upper end of the search range. The largest integer considered is `floor(ub)`. Defaults to
+            `SAMPLE_SIZE_SEARCH_MAX`.
+        args:
+            Extra arguments passed to `f`, broadcast against each other.
+
+    Returns:
+        The smallest integer sample sizes at which `f` reaches zero, as a float array with the broadcast shape of
+        `args`. The elements for which `f` does not reach zero within the search range are `NaN`.
+    """
+    lo, hi = ceil(lb), floor(ub)
+    args = tuple(np.ravel(arg) for arg in np.broadcast_arrays(*(np.asarray(arg, dtype=float) for arg in args)))
+    shape = np.broadcast_shapes(*(np.shape(arg) for arg in args)) if args else ()
+    evaluations = 0
+
+    def solved(size: np.ndarray, index: np.ndarray) -> np.ndarray:
+        nonlocal evaluations
+        evaluations += 1
+        return np.asarray(f(size, *(arg[index] for arg in args)), dtype=float) >= 0
+
+    def g(u: np.ndarray, *args: np.ndarray) -> np.ndarray:
+        nonlocal evaluations
+        evaluations += 1
+        return f(np.exp(u), *args)
+
+    count = int(np.prod(shape))
+    sizes = np.full(count, np.nan)
+    index = np.arange(count)
+    at_lb = solved(np.full(count, float(lo)), index)
+    sizes[at_lb] = lo
+    index = index[~at_lb]
+    index = index[solved(np.full(index.size, float(hi)), index)]
+
+    iterations = 0
+    if index.size > 0:
+        roots = _chandrupatla(
+            g, np.log(lo), np.log(hi), args=tuple(arg[index] for arg in args), xtol=1e-14, rtol=1e-14, strict=False
+        )
+        iterations = max(evaluations - 4, 0)
+        index, roots = index[~np.isnan(roots)], roots[~np.isnan(roots)]
+        size = np.clip(np.ceil(np.exp(roots)), lo + 1, hi)
+
+        # The continuous roots are only exact to within the tolerance, so their ceilings may be one off.
+        for _ in range(ROOT_MAXITER):
+            below, here = solved(size - 1, index), solved(size, index)
+            step = np.where(below, -1, np.where(here, 0, 1))
+            if not np.any(step):
+                break
+            size = np.clip(size + step, lo + 1, hi)
+        sizes[index] = size
+
+    _record_search((lo, hi), evaluations, iterations)
+    return sizes.reshape(shape)
+
+
+def _as_sizes(sizes: np.ndarray) -> np.ndarray:
+    """Return sample sizes as an integer array, unless some of them are `NaN`, which only a float array can hold."""
+    return sizes if np.any(np.isnan(sizes)) else sizes.astype(int)
+
+
+def _min_size(
+    f: Callable[[int], float],
+    lb: float,
+    ub: float = SAMPLE_SIZE_SEARCH_MAX,
+    *,
+    guess: float | None = None,
+    decreasing: bool = False,
+) -> int:
+    """Find the smallest integer sample size at which the monotone function `f` reaches zero.
+
+    The search runs on the integers directly, rather than converging to a continuous root that is then rounded up, and
+    stops as soon as the smallest sample size is isolated. Starting from `guess`, the bracket is widened with
+    exponentially growing steps until `f` changes sign, and then halved until its ends are adjacent integers. A good
+    guess thus costs a handful of evaluations of `f`, and a search from the lower end about twice the number of bits of
+    the solution. `f` is only evaluated at integers.
+
+    Within a sweep, a missing `guess` is replaced by the extrapolation of the previous solutions, see `_Continuation`.
+
+    Args:
+        f:
+            A monotone function of the sample size.
+        lb:
+            Lower end of the search range. The smallest integer considered is `ceil(lb)`.
+        ub:
+            Upper end of the search range. The largest integer considered is `floor(ub)`. Defaults to
+            `SAMPLE_SIZE_SEARCH_MAX`.
+        guess:
+            An approximation of the solution. If omitted, the search starts from the lower end.
+        decreasing:
+            Whether `f` is decreasing, in which case the smallest sample size with `f(size) <= 0` is returned, instead
+            of the smallest one with `f(size) >= 0`.
+
+    Returns:
+        The smallest integer sample size within the search range at which `f` reaches zero.
+
+    Raises:
+        SolutionNotFoundError: If `f` does not reach zero within the search range.
+    """
+    with _search() as slot:
+        if slot is not None and guess is None:
+            guess = slot.guess
+
+        lo, hi = ceil(lb), floor(ub)
+        evaluations = 0
+
+        def solved(size: int) -> bool:
+            nonlocal evaluations
+            evaluations += 1
+            value = f(size)
+            return value <= 0 if decreasing else value >= 0
+
+        x = lo if guess is None or not isfinite(guess) else min(max(ceil(guess), lo), hi)
+        step = 1
+        if solved(x):
+            # `lo - 1` stands for the unsolved end below the search range, which is never evaluated.
+            a, b = max(x - step, lo - 1), x
+            while a >= lo and solved(a):
+                step *= 2
+                a, b = max(a - step, lo - 1), a
+        else:
+            a, b = x, min(x + step, hi)
+            while not solved(b):
+                if b >= hi:
+                    _record_search((lo, hi), evaluations, 0)
+                    msg = f"No sample size within [{lo}, {hi}] satisfies the requirement."
+                    raise SolutionNotFoundError(msg)
+                step *= 2
+                a, b = b, min(b + step, hi)
+
+        bracket, iterations = (a, b), 0
+        while b - a > 1:
+            m = (a + b) // 2
+            if solved(m):
+                b = m
+            else:
+                a = m
+            iterations += 1
+        _record_search(bracket, evaluations, iterations)
+        if slot is not None:
+            slot.root = b
+        return b
+
+
+def _root(
+    f: Callable[[float], float],
+    lb: float = -inf,
+    ub: float = inf,
+    *,
+    start: float | None = None,
+    step: float | None = None,
+) -> float:
+    """Find the root of the monotone function `f` within `(lb, ub)`.
+
+    This is the root finder of all the solve functions other than the sample size searches. If both ends are finite and
+    no `start` is given, `f` is solved on `[lb, ub]` directly. Otherwise the search starts at `start`, or at the finite
+    end, and the bracket is widened until `f` changes sign with steps of `step`, `2 * step`, `4 * step`, ..., up to
+    `ROOT_SEARCH_MAX` towards an infinite end, and up to half the remaining distance towards a finite end, so that the
+    end itself is never evaluated. With a `step` on the natural scale of the problem, e.g. the standard error for a
+    mean, the bracket is found within a few evaluations. It is then solved with `scipy.optimize.brentq`, reusing the
+    values at its ends. The tolerances and the number of iterations are those of `pystatpower._constant`.
+
+    Within a sweep, `start` and `step` are replaced by the extrapolation of the previous solutions, see `_Continuation`.
+
+    Args:
+        f:
+            A monotone function.
+        lb:
+            Lower end of the search range.
+        ub:
+            Upper end of the search range.
+        start:
+            The starting point of the search, within the search range.
+        step:
+            The first step of the search. Defaults to `abs(start)`, or 1 if that is zero.
+
+    Returns:
+        The root of `f`.
+
+    Raises:
+        SolutionNotFoundError: If `f` does not change sign within the search range, or the solver does not converge.
+    """
+    with _search() as slot:
+        if slot is not None and slot.guess is not None and lb < slot.guess < ub:
+            start, step = slot.guess, slot.step
+
+        values: dict[float, float] = {}
+
+        def g(x: float) -> float:
+            if x not in values:
+                values[x] = f(x)
+            return values[x]
+
+        if start is None and isfinite(lb) and isfinite(ub):
+            a, b = lb, ub
+        else:
+            if start is None:
+                start = lb if isfinite(lb) else ub if isfinite(ub) else 0.0
+            if step is None:
+                step = abs(start) or 1.0
+            bracket = _expand(g, lb, ub, float(start), float(step))
+            if bracket is None:
+                _record_search((lb, ub), len(values), 0)
+                msg = f"The function does not change sign within ({lb}, {ub})."
+                raise SolutionNotFoundError(msg)
+            a, b = bracket
+
+        if a == b:
+            root = a
+            _record_search((a, b), len(values), 0)
+        else:
+            try:
+                root, result = brentq(g, a, b, xtol=ROOT_XTOL, rtol=ROOT_RTOL, maxiter=ROOT_MAXITER, full_output=True)
+            except (ValueError, RuntimeError) as e:
+                _record_search((a, b), len(values), 0)
+                msg = f"Failed to find a root within [{a}, {b}]: {e}"
+                raise SolutionNotFoundError(msg) from e
+            _record_search((a, b), len(values), result.iterations)
+
+        if slot is not None:
+            slot.root = root
+    return root
+
+
+def _expand(
+    f: Callable[[float], float],
+    lb: float,
+    ub: float,
+    start: float,
+    step: float,
+) -> tuple[float, float] | None:
+    """Widen a bracket from `start` until `f` changes sign, as described in `_root`.
+
+    Returns:
+        The bracket, which is `(x, x)` if `f(x)` is exactly zero, or `None` if `f` does not change sign within the
+        search range.
+    """
+    f0 = f(start)
+    if f0 == 0:
+        return start, start
+
+    lo = hi = start
+    for i in range(ROOT_MAXITER):
+        moved = False
+        if hi < ub:
+            x = min(start + step * 2**i, hi + (ub - hi) / 2 if isfinite(ub) else ROOT_SEARCH_MAX)
+            if x > hi:
+                fx = f(x)
+                if fx == 0:
+                    return x, x
+                if fx * f0 < 0:
+                    return hi, x
+                hi, moved = x, True
+        if lo > lb:
+            x = max(start - step * 2**i, lo - (lo - lb) / 2 if isfinite(lb) else -ROOT_SEARCH_MAX)
+            if x < lo:
+                fx = f(x)
+                if fx == 0:
+                    return x, x
+                if fx * f0 < 0:
+                    return x, lo
+                lo, moved = x, True
+        if not moved:
+            break
+    return None
+
+
+def _min_cost_sizes(
+    f: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    treatment_cost: float,
+    reference_cost: float,
+    lb: float,
+) -> tuple[int, int]:
+    """Find the integer sample sizes of two groups that minimize the total cost at which `f` reaches zero.
+
+    `f(treatment_size, reference_size)` must be vectorized and increasing in both sizes. The balanced design bounds the
+    cost, and thus both sizes. Within these bounds, the continuous treatment size required for each of a grid of
+    reference sizes is solved in one vectorized search, and the grid is narrowed around the cheapest design, until it
+    covers few enough reference sizes to evaluate all of them. The cheapest integer design is then confirmed with an
+    integer search started from its continuous solution.
+
+    Args:
+        f:
+            A vectorized function of the treatment and reference sample sizes, increasing in both.
+        treatment_cost:
+            Cost per subject in the treatment group.
+        reference_cost:
+            Cost per subject in the reference group.
+        lb:
+            The smallest sample size of each group.
+
+    Returns:
+        The sample sizes of the treatment and reference groups. Among the designs of minimal cost, the balanced one is
+        preferred, and otherwise the one with the smallest reference size.
+
+    Raises:
+        SolutionNotFoundError: If even the balanced design does not reach zero within `SAMPLE_SIZE_SEARCH_MAX`.
+    """
+    balanced = _min_size(lambda size: f(size, size), lb)
+    budget = (treatment_cost + reference_cost) * balanced
+    treatment_max = budget / treatment_cost
+    evaluations = 0
+
+    def treatment_sizes(reference_size: np.ndarray) -> np.ndarray:
+        """The continuous treatment sizes required with each reference size, `inf` if above `treatment_max`."""
+        nonlocal evaluations
+
+        def g(u: np.ndarray, reference_size: np.ndarray) -> np.ndarray:
+            nonlocal evaluations
+            evaluations += 1
+            return f(np.exp(u), reference_size)
+
+        size = np.full(reference_size.shape, np.inf)
+        evaluations += 2
+        reached_lb = f(np.full(reference_size.shape, lb), reference_size) >= 0
+        reachable = f(np.full(reference_size.shape, treatment_max), reference_size) >= 0
+        size[reached_lb] = lb
+        todo = reachable & ~reached_lb
+        if np.any(todo):
+            roots = _chandrupatla(g, np.log(lb), np.log(treatment_max), args=(reference_size[todo],), xtol=1e-14)
+            size[todo] = np.exp(roots)
+        return size
+
+    lo, hi = float(lb), budget / reference_cost
+    while True:
+        if hi - lo <= 1024:
+            reference_size = np.arange(ceil(lo), floor(hi) + 1, dtype=float)
+            treatment_size = np.ceil(treatment_sizes(reference_size))
+            # The continuous sizes are only exact to within the tolerance, so their ceilings may be one off.
+            finite = np.isfinite(treatment_size)
+            lower = np.maximum(treatment_size[finite] - 1, ceil(lb))
+            evaluations += 2
+            treatment_size[finite] = np.where(f(lower, reference_size[finite]) >= 0, lower, treatment_size[finite])
+            short = f(treatment_size[finite], reference_size[finite]) < 0
+            treatment_size[finite] += short
+            cost = treatment_cost * treatment_size + reference_cost * reference_size
+            k = int(np.argmin(cost))
+            break
+        reference_size = np.geomspace(lo, hi, 65)
+        cost = treatment_cost * treatment_sizes(reference_size) + reference_cost * reference_size
+        k = int(np.argmin(cost))
+        lo, hi = reference_size[max(k - 1, 0)], reference_size[min(k + 1, reference_size.size - 1)]
+    _record_search((lb, budget / reference_cost), evaluations, 0)
+
+    if not cost[k] < budget:
+        return balanced, balanced
+    reference = int(reference_size[k])
+    treatment = _min_size(lambda size: f(size, reference), lb, guess=treatment_size[k])
+    if treatment_cost * treatment + reference_cost * reference >= budget:
+        return balanced, balanced
+    return treatment, reference
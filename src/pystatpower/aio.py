@@ -0,0 +1,292 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Awaitable versions of the solve functions, for asyncio applications.
+
+A solve function may run for up to seconds, e.g. with score confidence intervals or exact tests, which would block the
+event loop if it were called directly. Here, every `solve_*` and `power_curve` function of the package is available
+under the same qualified name as a coroutine function, which runs the solve on a pool of worker processes:
+
+```python
+import asyncio
+from pystatpower import aio
+
+
+async def main():
+    size = await aio.mean.independent.inequality.solve_size(diff=1, treatment_std=2, reference_std=2)
+    power = await aio.solve("proportion.single.inequality.solve_power", proportion=0.6, null_proportion=0.5, size=50)
+
+
+asyncio.run(main())
+```
+
+At most `max_workers` solves run at once; the other calls wait in the event loop, where cancelling them, e.g. on a
+timeout, removes them before they start. A solve that has already started cannot be interrupted, so it finishes in
+the background and its result is discarded.
+
+Concurrent calls of the same function with the same scalar arguments share one solve: all of them receive its result.
+The shared solve is only cancelled once all of its callers are.
+
+The module-level coroutine functions use a default `Solver` with a pool of one worker process per CPU, created on first
+use. Another `Solver` can be created for other bounds, or to run the solves in threads.
+"""
+
+import asyncio
+import inspect
+import os
+
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Mapping
+from concurrent.futures import BrokenExecutor
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from functools import partial
+from functools import wraps
+from types import TracebackType
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from .batch import _name
+from .batch import _resolve
+from .cache import _canonical
+
+_SUBPACKAGES = ("correlation", "mean", "misc", "proportion")
+
+
+def _call(function: str, params: Mapping[str, Any]) -> Any:
+    """Call a solve function by its qualified name, in a worker."""
+    return _resolve(function)(**params)
+
+
+@cache
+def _defaults(func: Callable[..., Any]) -> dict[str, Any]:
+    """Return the default values of the parameters of a function."""
+    params = inspect.signature(func).parameters
+    return {name: param.default for name, param in params.items() if param.default is not param.empty}
+
+
+def _key(function: str, params: Mapping[str, Any]) -> tuple[Any, ...] | None:
+    """Return the key identifying the calls that can share a solve, or `None` if an argument is not a scalar."""
+    params = _defaults(_resolve(function)) | dict(params)
+    try:
+        return function, tuple(sorted((name, _canonical(value)) for name, value in params.items()))
+    except TypeError:
+        return None
+
+
+@dataclass
+class _Shared:
+    """A solve shared by concurrent calls."""
+
+    task: asyncio.Task[Any]
+    callers: int = 0
+
+
+class Solver:
+    """Runs solve functions on a bounded pool of workers, from asyncio.
+
+    A solver can be shared by several event loops, e.g. successive `asyncio.run` calls. It is an asynchronous context
+    manager, which shuts its pool down on exit.
+
+    Attributes:
+        max_workers:
+            Maximum number of solves running at once.
+    """
+
+    def __init__(self, *, max_workers: int | None = None, processes: bool = True) -> None:
+        """Initialize the solver. The pool of workers is only started on the first call.
+
+        Args:
+            max_workers:
+                Maximum number of solves running at once. Defaults to the number of CPUs.
+            processes:
+                Whether to run the solves in worker processes, or in threads of the current process. Threads avoid
+                starting processes, but solves mostly hold the global interpreter lock, so they do not run in parallel.
+
+        Raises:
+            ValueError: If `max_workers` is not a positive integer.
+        """
+        max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        if max_workers < 1:
+            msg = "'max_workers' must be a positive integer."
+            raise ValueError(msg)
+
+        self.max_workers = max_workers
+        self._processes = processes
+        self._executor: Executor | None = None
+        self._slots: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+        self._shared: dict[tuple[Any, ...], _Shared] = {}
+
+    def _pool(self) -> Executor:
+        """Return the pool of workers, starting it if needed."""
+        if self._executor is None:
+            pool = ProcessPoolExecutor if self._processes else ThreadPoolExecutor
+            self._executor = pool(max_workers=self.max_workers)
+        return self._executor
+
+    async def _run(self, function: str, params: Mapping[str, Any]) -> Any:
+        """Run a solve once a worker is free."""
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_workers)
+        async with slots:
+            pool = self._pool()
+            try:
+                return await loop.run_in_executor(pool, partial(_call, function, params))
+            except BrokenExecutor:
+                # A worker process died, e.g. killed for lack of memory, so start a new pool for the next calls.
+                if self._executor is pool:
+                    self._executor = None
+                raise
+
+    async def solve(self, function: str | Callable[..., Any], /, *, timeout: float | None = None, **params: Any) -> Any:
+        """Solve a function on the pool of workers.
+
+        Args:
+            function:
+                The function, or its qualified name relative to the package, e.g. `'mean.single.inequality.solve_size'`.
+            timeout:
+                Maximum time to wait for the result, in seconds. `None` means no limit.
+            **params:
+                The keyword arguments of the function.
+
+        Returns:
+            The return value of the function.
+
+        Raises:
+            ValueError: If `function` is not a function of the package.
+            TimeoutError: If the result is not available within `timeout`.
+        """
+        name = _name(function)
+        _resolve(name)
+        loop = asyncio.get_running_loop()
+
+        key = _key(name, params)
+        shared = self._shared.get(key) if key is not None else None
+        if shared is None or shared.task.get_loop() is not loop:
+            shared = _Shared(loop.create_task(self._run(name, params)))
+            if key is not None:
+                self._shared[key] = shared
+                shared.task.add_done_callback(partial(self._release, key, shared))
+
+        shared.callers += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(shared.task), timeout)
+        except asyncio.TimeoutError as e:
+            # A `TimeoutError` raised by the solve itself is not a timeout of the call.
+            if shared.task.done():
+                raise
+            # Before Python 3.11, `asyncio.TimeoutError` is not the built-in `TimeoutError`.
+            msg = f"'{name}' did not return within {timeout} seconds."
+            raise TimeoutError(msg) from e
+        finally:
+            shared.callers -= 1
+            if shared.callers == 0 and not shared.task.done():
+                shared.task.cancel()
+
+    def _release(self, key: tuple[Any, ...], shared: _Shared, _: asyncio.Task[Any]) -> None:
+        """Forget a shared solve once it is done, so that later calls start a new one."""
+        if self._shared.get(key) is shared:
+            del self._shared[key]
+
+    def close(self) -> None:
+        """Shut the pool of workers down, without waiting for the running solves. A new pool starts on the next call."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "Solver":
+        """Return the solver."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut the pool of workers down."""
+        self.close()
+
+
+_default: Solver | None = None
+
+
+def _solver() -> Solver:
+    """Return the default solver, creating it if needed."""
+    global _default
+    if _default is None:
+        _default = Solver()
+    return _default
+
+
+async def solve(function: str | Callable[..., Any], /, *, timeout: float | None = None, **params: Any) -> Any:
+    """Solve a function on the pool of worker processes of the default solver.
+
+    See `Solver.solve`.
+    """
+    return await _solver().solve(function, timeout=timeout, **params)
+
+
+def shutdown() -> None:
+    """Shut the pool of worker processes of the default solver down."""
+    if _default is not None:
+        _default.close()
+
+
+def wrap(function: str | Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """Return the awaitable version of a solve function, running on the default solver.
+
+    Args:
+        function:
+            The function, or its qualified name relative to the package, e.g. `'mean.single.inequality.solve_size'`.
+
+    Returns:
+        A coroutine function with the keyword arguments of the function, and an additional `timeout`.
+
+    Raises:
+        ValueError: If `function` is not a function of the package.
+    """
+    name = _name(function)
+    func = _resolve(name)
+
+    @wraps(func)
+    async def wrapper(*, timeout: float | None = None, **params: Any) -> Any:
+        return await solve(name, timeout=timeout, **params)
+
+    return wrapper
+
+
+class _Namespace:
+    """The awaitable versions of the functions of a subpackage or module, by attribute access."""
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        path = f"{self._path}.{name}"
+        if not name.startswith(("solve_", "power_curve")):
+            return _Namespace(path)
+        try:
+            return wrap(path)
+        except ValueError as e:
+            raise AttributeError(str(e)) from None
+
+    def __repr__(self) -> str:
+        return f"<awaitable functions of {__package__}.{self._path}>"
+
+
+def __getattr__(name: str) -> _Namespace:
+    if name in _SUBPACKAGES:
+        return _Namespace(name)
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
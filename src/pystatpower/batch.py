@@ -0,0 +1,371 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Batch evaluation of the solve functions over tables of scenarios.
+
+A scenario is a mapping from parameter names to values, i.e. the keyword arguments of one call. A table of scenarios
+is either a sequence of such mappings, or a mapping from parameter names to equally long columns.
+
+The function to evaluate is given as a callable, or as its qualified name relative to the package, e.g.
+`'mean.single.inequality.solve_size'`.
+
+Scenarios are evaluated in micro-batches. Within a batch, the scenarios that differ only in parameters accepting
+array-likes (e.g. `diff` and `std`, but not `alternative`) are evaluated in one vectorized call of the function. Of
+the `solve_size` functions, only those of `mean.single.inequality`, `proportion.independent.inequality` and
+`correlation.inequality` accept array-likes; the scenarios of the others are evaluated one call each.
+
+A sweep over the values of a single parameter, e.g. the sample size for `diff = 0.1, 0.11, ..., 1.0`, is better run
+with `sweep`, which solves the values in increasing order and starts each search from the solutions for the previous
+values.
+"""
+
+import importlib
+import inspect
+import os
+
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import cache
+from functools import partial
+from itertools import islice
+from math import ceil
+from math import isnan
+from numbers import Real
+from typing import Any
+from typing import get_args
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from ._solver import _Continuation
+from ._solver import _continue
+from .exceptions import SolutionNotFoundError
+
+CAPTURED_ERRORS = (SolutionNotFoundError, ValueError, ArithmeticError, RuntimeError)
+"""Exceptions captured per scenario. Any other exception, e.g. a `TypeError` for a misspelled parameter, aborts the
+batch."""
+
+
+@dataclass(frozen=True)
+class Result:
+    """The outcome of one scenario.
+
+    Attributes:
+        value:
+            The return value of the function, or `None` if it raised.
+        error:
+            The exception raised by the function, or `None` if it succeeded.
+    """
+
+    value: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the function succeeded."""
+        return self.error is None
+
+
+def _name(function: str | Callable[..., Any]) -> str:
+    """Return the qualified name of a function relative to the package, which can be sent to worker processes."""
+    if isinstance(function, str):
+        return function
+    module = function.__module__.removeprefix(f"{__package__}.")
+    return f"{module}.{function.__name__}"
+
+
+def _resolve(function: str) -> Callable[..., Any]:
+    """Resolve a qualified name such as `'mean.single.inequality.solve_size'` to the function."""
+    module_name, _, name = function.rpartition(".")
+    try:
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        func = getattr(module, name)
+    except (ImportError, AttributeError, ValueError):
+        func = None
+    if not name.startswith(("solve_", "power_curve")) or not callable(func):
+        msg = f"'{function}' is not a function of {__package__}, such as 'mean.single.inequality.solve_size'."
+        raise ValueError(msg)
+    return func
+
+
+def _rows(scenarios: Iterable[Mapping[str, Any]] | Mapping[str, Sequence[Any]]) -> Iterable[Mapping[str, Any]]:
+    """Iterate over the scenarios of a table, given either row-wise or column-wise."""
+    if not isinstance(scenarios, Mapping):
+        return scenarios
+
+    lengths = {len(column) for column in scenarios.values()}
+    if len(lengths) > 1:
+        msg = "All columns of the scenario table must have the same length."
+        raise ValueError(msg)
+    keys = list(scenarios)
+    return (dict(zip(keys, values, strict=True)) for values in zip(*scenarios.values(), strict=True))
+
+
+def _solve_row(func: Callable[..., Any], row: Mapping[str, Any]) -> Result:
+    """Evaluate one scenario, capturing the expected exceptions."""
+    try:
+        return Result(value=func(**row))
+    except CAPTURED_ERRORS as e:
+        return Result(error=e)
+
+
+@cache
+def _array_params(func: Callable[..., Any]) -> frozenset[str]:
+    """Return the names of the parameters of a function annotated as accepting array-likes."""
+    array_like = set(get_args(ArrayLike))
+    params = inspect.signature(func).parameters
+    return frozenset(name for name, param in params.items() if array_like <= set(get_args(param.annotation)))
+
+
+@cache
+def _returns_int(func: Callable[..., Any]) -> bool:
+    """Return whether a function is annotated as returning an integer for scalar arguments, or a tuple of them."""
+    returns = get_args(inspect.signature(func).return_annotation)
+    return int in returns or tuple[int, int] in returns
+
+
+def _group_key(row: Mapping[str, Any], array_params: frozenset[str]) -> tuple[Any, ...] | None:
+    """Return the key shared by the scenarios that can be evaluated together, or `None` if there is none."""
+    stacked = tuple(sorted(k for k, v in row.items() if k in array_params and isinstance(v, Real)))
+    if not stacked:
+        return None
+    key = stacked, tuple(sorted((k, v) for k, v in row.items() if k not in stacked))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _solve_group(
+    func: Callable[..., Any],
+    rows: list[Mapping[str, Any]],
+    stacked: tuple[str, ...],
+    fallback: Callable[[Callable[..., Any], list[Mapping[str, Any]]], list[Result]] | None = None,
+) -> list[Result]:
+    """Evaluate scenarios differing only in the `stacked` parameters, in one vectorized call if possible.
+
+    If the vectorized call fails, the scenarios are evaluated by `fallback`, which defaults to one call each.
+    """
+    kwargs = dict(rows[0]) | {name: np.array([row[name] for row in rows], dtype=float) for name in stacked}
+    try:
+        value = func(**kwargs)
+        # A tuple of arrays, e.g. the sample sizes of both groups, is split into one tuple per scenario.
+        columns = [np.ravel(v).tolist() for v in value] if isinstance(value, tuple) else [np.ravel(value).tolist()]
+    except (*CAPTURED_ERRORS, TypeError):
+        columns = None
+    if columns is None or any(len(column) != len(rows) for column in columns):
+        # The vectorized call failed for some of the scenarios, so isolate them by falling back to one call each.
+        if fallback is not None:
+            return fallback(func, rows)
+        return [_solve_row(func, row) for row in rows]
+
+    results = []
+    as_int = _returns_int(func)
+    for row, values in zip(rows, zip(*columns, strict=True), strict=True):
+        if any(isinstance(v, float) and isnan(v) for v in values):
+            # The elements without a solution are NaN, so solve them again alone for the error explaining why.
+            results.append(_solve_row(func, row))
+            continue
+        # The array is a float array if any element is NaN, but the others are returned as a scalar call would.
+        if as_int:
+            values = tuple(int(v) for v in values)
+        results.append(Result(value=values if isinstance(value, tuple) else values[0]))
+    return results
+
+
+def _solve_batch(func: Callable[..., Any], rows: list[Mapping[str, Any]]) -> list[Result]:
+    """Evaluate a micro-batch of scenarios, grouping those that can share a vectorized call."""
+    array_params = _array_params(func)
+    results: list[Result | None] = [None] * len(rows)
+    groups: dict[tuple[Any, ...], list[int]] = {}
+    for i, row in enumerate(rows):
+        key = _group_key(row, array_params)
+        if key is None:
+            results[i] = _solve_row(func, row)
+        else:
+            groups.setdefault(key, []).append(i)
+
+    for (stacked, _), indices in groups.items():
+        group = [rows[i] for i in indices]
+        if len(group) == 1:
+            group_results = [_solve_row(func, group[0])]
+        else:
+            group_results = _solve_group(func, group, stacked)
+        for i, result in zip(indices, group_results, strict=True):
+            results[i] = result
+    return results
+
+
+def _solve_chunk(function: str, chunk: list[Mapping[str, Any]]) -> list[Result]:
+    """Evaluate a chunk of scenarios in a worker process."""
+    return _solve_batch(_resolve(function), chunk)
+
+
+def _chunks(rows: Iterable[Mapping[str, Any]], size: int) -> Iterable[list[Mapping[str, Any]]]:
+    """Split the scenarios into lists of `size` scenarios."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert a return value of a solve function to plain Python objects."""
+    if isinstance(value, np.ndarray | np.generic):
+        return value.tolist()
+    if isinstance(value, tuple | list):
+        return [_jsonable(x) for x in value]
+    return value
+
+
+def run(
+    function: str | Callable[..., Any],
+    scenarios: Iterable[Mapping[str, Any]] | Mapping[str, Sequence[Any]],
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+) -> list[Result]:
+    """Evaluate a function for every scenario of a table, using a pool of worker processes.
+
+    The scenarios are split into chunks, which are evaluated on a `ProcessPoolExecutor`. The results are returned in
+    the order of the scenarios. Exceptions listed in `CAPTURED_ERRORS`, such as `SolutionNotFoundError`, are captured
+    in the result of their scenario instead of aborting the batch.
+
+    Args:
+        function:
+            The function, or its qualified name relative to the package, e.g. `'mean.single.inequality.solve_size'`.
+        scenarios:
+            The table of scenarios, either a sequence of keyword-argument mappings, or a mapping from parameter names
+            to equally long columns.
+        workers:
+            Number of worker processes. Defaults to the number of CPUs. If `workers` is 1, the scenarios are evaluated
+            in the current process.
+        chunksize:
+            Number of scenarios sent to a worker at once. Defaults to splitting the table into about four chunks per
+            worker, with at most 10000 scenarios per chunk.
+
+    Returns:
+        The result of each scenario, in the order of the scenarios.
+
+    Raises:
+        ValueError: If `function` is not a function of the package, or the columns of `scenarios` differ in length.
+    """
+    name = _name(function)
+    func = _resolve(name)
+    rows = list(_rows(scenarios))
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        msg = "'workers' must be a positive integer."
+        raise ValueError(msg)
+
+    if workers == 1 or len(rows) <= 1:
+        return _solve_batch(func, rows)
+
+    if chunksize is None:
+        chunksize = min(max(ceil(len(rows) / (4 * workers)), 1), 10000)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunk_results = executor.map(partial(_solve_chunk, name), _chunks(rows, chunksize))
+        return [result for results in chunk_results for result in results]
+
+
+def stream(
+    function: str | Callable[..., Any],
+    scenarios: Iterable[Mapping[str, Any]] | Mapping[str, Sequence[Any]],
+    *,
+    batchsize: int = 1024,
+) -> Iterator[Result]:
+    """Evaluate a function for every scenario of a table lazily, in the current process.
+
+    The scenarios are consumed in micro-batches of `batchsize`, and the results of a batch are yielded before the next
+    one is read, so memory use does not grow with the number of scenarios. `scenarios` may therefore be any iterable,
+    such as a generator reading a file or a database cursor. Exceptions are captured as in `run`.
+
+    Args:
+        function:
+            The function, or its qualified name relative to the package, e.g. `'mean.single.inequality.solve_size'`.
+        scenarios:
+            The table of scenarios, either an iterable of keyword-argument mappings, or a mapping from parameter names
+            to equally long columns.
+        batchsize:
+            Number of scenarios evaluated together.
+
+    Returns:
+        An iterator over the result of each scenario, in the order of the scenarios.
+
+    Raises:
+        ValueError: If `function` is not a function of the package, or `batchsize` is not positive.
+    """
+    func = _resolve(_name(function))
+    if batchsize < 1:
+        msg = "'batchsize' must be a positive integer."
+        raise ValueError(msg)
+
+    return _stream(func, _rows(scenarios), batchsize)
+
+
+def _stream(func: Callable[..., Any], rows: Iterable[Mapping[str, Any]], batchsize: int) -> Iterator[Result]:
+    """Yield the results of `stream`, so that its arguments are validated before the first result is requested."""
+    for chunk in _chunks(rows, batchsize):
+        yield from _solve_batch(func, chunk)
+
+
+def sweep(
+    function: str | Callable[..., Any],
+    parameter: str,
+    values: Iterable[float],
+    /,
+    **params: Any,
+) -> list[Result]:
+    """Evaluate a function over the values of one parameter, starting each solve from the previous solutions.
+
+    If the swept parameter accepts array-likes, as `diff` of `mean.single.inequality.solve_size` does, all values are
+    solved in one vectorized call. Otherwise, or if that call fails, the values are solved one by one in increasing
+    order, in the current process. The solutions move smoothly with the swept parameter, so each search of the solve
+    function, e.g. the sample size search of `solve_size`, starts from the extrapolation of its solutions for the two
+    previous values, and needs only a few evaluations to confirm it. The rejection regions of exact tests are computed
+    once per sample size for the whole sweep. The results are the same as those of separate calls, up to the tolerance
+    of the root finders for continuous solutions. Exceptions are captured as in `run`.
+
+    Args:
+        function:
+            The function, or its qualified name relative to the package, e.g. `'mean.single.inequality.solve_size'`.
+        parameter:
+            Name of the swept parameter, e.g. `'diff'`.
+        values:
+            The values of the swept parameter, in any order.
+        **params:
+            The other keyword arguments of the function, shared by all values.
+
+    Returns:
+        The result for each value, in the order of `values`.
+
+    Raises:
+        ValueError: If `function` is not a function of the package, or `parameter` is also given in `params`.
+    """
+    func = _resolve(_name(function))
+    if parameter in params:
+        msg = f"The swept parameter '{parameter}' must not be given a fixed value."
+        raise ValueError(msg)
+
+    rows = [{**params, parameter: value} for value in values]
+    if len(rows) > 1 and parameter in _array_params(func) and all(isinstance(row[parameter], Real) for row in rows):
+        return _solve_group(func, rows, (parameter,), fallback=partial(_sweep, parameter=parameter))
+    return _sweep(func, rows, parameter=parameter)
+
+
+def _sweep(func: Callable[..., Any], rows: list[Mapping[str, Any]], *, parameter: str) -> list[Result]:
+    """Evaluate the scenarios of `sweep` one by one, in increasing order of the swept parameter."""
+    results: list[Result | None] = [None] * len(rows)
+    state = _Continuation()
+    with _continue(state):
+        for i in sorted(range(len(rows)), key=lambda i: rows[i][parameter]):
+            state.advance(float(rows[i][parameter]))
+            results[i] = _solve_row(func, rows[i])
+    return results
@@ -0,0 +1,348 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Opt-in persistent cache of the results of the solve functions.
+
+While a cache is enabled, every call of a public `solve_*` function with scalar arguments is first looked up in a
+SQLite database in a local directory, and its result is stored there once solved. The database is shared by all the
+processes using the same directory, such as the worker processes of `batch.run` or successive batch jobs.
+
+```python
+from pystatpower import cache
+from pystatpower.mean.independent.inequality import solve_size
+
+with cache.enable("~/.cache/pystatpower", max_entries=100_000) as store:
+    solve_size(diff=1, treatment_std=2, reference_std=2)  # solved, then stored
+    solve_size(diff=1, treatment_std=2, reference_std=2)  # read from the cache
+
+store.stats()
+```
+
+A cache can also be enabled for a whole program, including the worker processes it starts, by setting the environment
+variable `PYSTATPOWER_CACHE` to the directory.
+
+The key of an entry is made of the qualified name of the function, all its arguments with their defaults applied, and
+the versions of PyStatPower, SciPy and NumPy, so that results are never shared between versions. Once the database
+holds more than `max_entries` entries, the least recently used ones are evicted. So that lookups do not need to write,
+the time an entry was last used is only refreshed once it is a minute old.
+
+Exceptions, calls with array-like arguments or results, and the solves continued by `batch.sweep` and `tables` are not
+cached.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from collections.abc import Callable
+from collections.abc import Sequence
+from functools import wraps
+from importlib.metadata import version
+from inspect import signature
+from numbers import Integral
+from numbers import Real
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from typing import TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_REFRESH_INTERVAL = 60.0
+"""Age in seconds after which the time an entry was last used is refreshed on a hit."""
+
+_EVICTION_INTERVAL = 64
+"""Number of entries stored by a process between two evictions."""
+
+
+def _default_path() -> Path:
+    """Return the default cache directory, `pystatpower` within the user cache directory."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "pystatpower"
+
+
+def _canonical(value: Any) -> Any:
+    """Convert an argument to its canonical JSON value, or raise `TypeError` if it cannot be cached."""
+    if value is None or type(value) in {float, bool, str}:
+        return value
+    if isinstance(value, Real) and not isinstance(value, bool):
+        # Integers and floats of equal value are the same argument, e.g. `ratio=1` and `ratio=1.0`.
+        return float(value)
+    msg = f"Arguments of type {type(value).__name__} are not cached."
+    raise TypeError(msg)
+
+
+def _encode(value: Any) -> str | None:
+    """Encode a result as JSON, or return `None` if it cannot be cached."""
+
+    def convert(x: Any) -> Any:
+        if isinstance(x, bool):
+            raise TypeError
+        if isinstance(x, Integral):
+            return int(x)
+        if isinstance(x, Real):
+            return float(x)
+        raise TypeError
+
+    try:
+        if isinstance(value, tuple):
+            return json.dumps([convert(x) for x in value])
+        return json.dumps(convert(value))
+    except TypeError:
+        return None
+
+
+def _decode(text: str) -> Any:
+    """Decode a result encoded by `_encode`."""
+    value = json.loads(text)
+    return tuple(value) if isinstance(value, list) else value
+
+
+class Cache:
+    """A persistent cache of results in a SQLite database.
+
+    Each process opens its own connection to the database, which is in write-ahead logging mode, so that several
+    processes can read concurrently while one writes. A `Cache` can be shared by the threads of a process.
+
+    A cache is a context manager, which disables it on exit if it is the enabled one, and closes it.
+
+    Attributes:
+        path:
+            Path of the database file.
+        max_entries:
+            Number of entries above which the least recently used ones are evicted. The database may exceed it by the
+            few entries stored since the last eviction.
+        hits:
+            Number of lookups of this process that found an entry.
+        misses:
+            Number of lookups of this process that found no entry.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None, *, max_entries: int = 1_000_000) -> None:
+        """Open the cache in a directory, creating it if needed.
+
+        Args:
+            path:
+                The directory of the database. Defaults to `pystatpower` within the user cache directory.
+            max_entries:
+                Number of entries above which the least recently used ones are evicted.
+
+        Raises:
+            ValueError: If `max_entries` is not a positive integer.
+        """
+        if max_entries < 1:
+            msg = "'max_entries' must be a positive integer."
+            raise ValueError(msg)
+
+        import numpy as np
+        import scipy
+
+        directory = _default_path() if path is None else Path(path).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / "cache.sqlite3"
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._versions = (version("pystatpower"), scipy.__version__, np.__version__)
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = 0
+        self._stored = 0
+        self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the connection of the current process, opening it if needed, e.g. in a forked worker process."""
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, used REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    def key(self, function: str, arguments: Sequence[Any]) -> str:
+        """Return the key of a call.
+
+        Args:
+            function:
+                Qualified name of the function relative to the package, e.g. `'mean.single.inequality.solve_size'`.
+            arguments:
+                All the arguments of the call, in the order of the parameters of the function.
+
+        Returns:
+            The key, a SHA-256 digest of the canonical form of the call and the versions.
+
+        Raises:
+            TypeError: If an argument cannot be cached, e.g. an array.
+        """
+        canonical = [function, *self._versions, *map(_canonical, arguments)]
+        return hashlib.sha256(json.dumps(canonical).encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Look up an entry.
+
+        Returns:
+            Whether the entry was found, and its value.
+        """
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT value, used FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            now = time.time()
+            if now - row[1] > _REFRESH_INTERVAL:
+                connection.execute("UPDATE entries SET used = ? WHERE key = ?", (now, key))
+        return True, _decode(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Store an entry, unless its value cannot be cached, and evict the least recently used entries if needed."""
+        text = _encode(value)
+        if text is None:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, text, time.time()))
+            self._stored += 1
+            if self._stored % _EVICTION_INTERVAL == 0:
+                self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Evict the least recently used entries beyond `max_entries`."""
+        connection.execute(
+            "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of `hits` and `misses` of this process, and the number of `entries` of the database."""
+        with self._lock:
+            (entries,) = self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def evict(self) -> None:
+        """Evict the least recently used entries beyond `max_entries` now."""
+        with self._lock:
+            self._evict(self._connect())
+
+    def clear(self) -> None:
+        """Remove all entries, of every version, and reset the counters."""
+        with self._lock:
+            self._connect().execute("DELETE FROM entries")
+            self.hits = self.misses = 0
+
+    def close(self) -> None:
+        """Close the connection of this process. The cache reopens it if used again."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> "Cache":
+        """Return the cache."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Disable the cache if it is the enabled one, and close it."""
+        global _active
+        if _active is self:
+            _active = None
+        self.close()
+
+
+_active: Cache | None = None
+
+
+def enable(path: str | os.PathLike[str] | None = None, *, max_entries: int = 1_000_000) -> Cache:
+    """Enable a persistent cache for all the solve functions, replacing the enabled one if any.
+
+    Args:
+        path:
+            The directory of the database. Defaults to `pystatpower` within the user cache directory.
+        max_entries:
+            Number of entries above which the least recently used ones are evicted.
+
+    Returns:
+        The enabled cache, which can be used as a context manager to disable it on exit.
+    """
+    global _active
+    cache = Cache(path, max_entries=max_entries)
+    if _active is not None:
+        _active.close()
+    _active = cache
+    return cache
+
+
+def disable() -> None:
+    """Disable the enabled cache, if any."""
+    global _active
+    if _active is not None:
+        _active.close()
+    _active = None
+
+
+def active() -> Cache | None:
+    """Return the enabled cache, or `None` if caching is disabled."""
+    return _active
+
+
+def _cached(func: _F) -> _F:
+    """Look up the calls of a solve function in the enabled cache, if any.
+
+    It is applied below `diagnostics._instrument`, so that a call found in the cache is still recorded, without
+    evaluations.
+    """
+    name = f"{func.__module__.removeprefix(f'{__package__}.')}.{func.__name__}"
+    parameters = signature(func).parameters
+    if any(p.kind in {p.VAR_POSITIONAL, p.VAR_KEYWORD} for p in parameters.values()):
+        return func
+
+    # Binding the arguments by hand is an order of magnitude faster than `Signature.bind`, which matters on hits.
+    names = tuple(parameters)
+    known = frozenset(names)
+    positional = tuple(name for name, p in parameters.items() if p.kind != p.KEYWORD_ONLY)
+    defaults = {name: p.default for name, p in parameters.items() if p.default is not p.empty}
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _active
+        if cache is None or len(args) > len(positional) or not kwargs.keys() <= known:
+            return func(*args, **kwargs)
+
+        from ._solver import _continuation
+
+        # Continued solves record their searches for the next ones, see `batch.sweep` and `tables.build`.
+        if _continuation.get() is not None:
+            return func(*args, **kwargs)
+
+        arguments = defaults | dict(zip(positional, args, strict=False)) | kwargs
+        try:
+            key = cache.key(name, [arguments.get(parameter) for parameter in names])
+        except TypeError:
+            return func(*args, **kwargs)
+
+        found, value = cache.get(key)
+        if found:
+            return value
+        value = func(*args, **kwargs)
+        cache.put(key, value)
+        return value
+
+    return wrapper
+
+
+if os.environ.get("PYSTATPOWER_CACHE"):
+    enable(os.environ["PYSTATPOWER_CACHE"])
@@ -0,0 +1,231 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""The `pystatpower` command, evaluating a solve function for every row of a CSV or JSONL file.
+
+```console
+$ pystatpower proportion.independent.noninferiority.solve_size scenarios.csv -o sizes.csv -j 8
+$ generate-scenarios | pystatpower mean.single.inequality.solve_size -f jsonl > sizes.jsonl
+```
+
+Each input row holds the keyword arguments of one call: the columns of a CSV file, whose values are read as integers,
+floats, booleans (`true`, `false`) or strings, empty values meaning the default, or the keys of a JSON object per line
+of a JSONL file. Each output row holds the number of the input row (`row`, from 0), the input arguments, the return
+value of the function (`value`, JSON-encoded in CSV if it is not a number) and the exception it raised, if any
+(`error`). A CSV output has all the columns of a CSV input, and those of the first row of a JSONL input, a later row
+with another key stopping the command. Exceptions are captured per row as in `batch.run`; any other exception, e.g.
+for a misspelled parameter, stops the command.
+
+Rows are read, solved and written in chunks, in the order of the input, so that the command runs in constant memory
+and can be used in a pipeline. With `-j N`, the chunks are solved on `N` worker processes. With `--resume`, the rows
+already in the output file, e.g. from an interrupted run, are skipped, and the others are appended to it.
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from contextlib import suppress
+from pathlib import Path
+from typing import IO
+from typing import Any
+
+from .batch import Result
+from .batch import _chunks
+from .batch import _jsonable
+from .batch import _resolve
+from .batch import _solve_batch
+from .batch import _solve_chunk
+
+_FORMATS = ("csv", "jsonl")
+
+
+def _format(path: str, default: str) -> str:
+    """Infer the format of a file from its extension."""
+    suffix = Path(path).suffix.lower().lstrip(".")
+    return {"csv": "csv", "jsonl": "jsonl", "ndjson": "jsonl"}.get(suffix, default)
+
+
+def _parse(value: str) -> Any:
+    """Convert a CSV value to a number or boolean if it is one."""
+    for convert in (int, float):
+        with suppress(ValueError):
+            return convert(value)
+    return {"true": True, "false": False}.get(value.lower(), value)
+
+
+def _read(stream: IO[str], fmt: str) -> tuple[list[str] | None, Iterator[dict[str, Any]]]:
+    """Read the columns of a CSV stream, or `None` for JSONL, and its scenarios lazily."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        return list(reader.fieldnames) if reader.fieldnames else None, _read_csv(reader)
+    return None, (json.loads(line) for line in stream if line.strip())
+
+
+def _read_csv(reader: csv.DictReader) -> Iterator[dict[str, Any]]:
+    """Read the scenarios of a CSV file, leaving out the empty values."""
+    for index, row in enumerate(reader):
+        if None in row:
+            msg = f"Row {index} has more values than the CSV header has columns."
+            raise ValueError(msg)
+        yield {key: _parse(value) for key, value in row.items() if value not in {None, ""}}
+
+
+def _completed(path: Path, fmt: str) -> tuple[set[int], list[str] | None]:
+    """Return the rows already in an output file, and its CSV header, dropping an incomplete last line."""
+    if not path.exists():
+        return set(), None
+
+    with path.open("r+", encoding="utf-8", newline="") as stream:
+        text = stream.read()
+        if not text.endswith("\n"):
+            # The run was interrupted while writing the last line.
+            text = text[: text.rfind("\n") + 1]
+            stream.seek(0)
+            stream.write(text)
+            stream.truncate()
+
+    lines = text.splitlines()
+    if fmt == "csv":
+        reader = csv.DictReader(lines)
+        return {int(row["row"]) for row in reader}, list(reader.fieldnames or []) or None
+    return {json.loads(line)["row"] for line in lines if line.strip()}, None
+
+
+def _solve(
+    function: str, rows: Iterable[tuple[int, dict[str, Any]]], jobs: int, chunksize: int
+) -> Iterator[tuple[list[tuple[int, dict[str, Any]]], list[Result]]]:
+    """Solve the scenarios in chunks, yielding each chunk with its results, in order."""
+    chunks = _chunks(rows, chunksize)
+    if jobs == 1:
+        func = _resolve(function)
+        for chunk in chunks:
+            yield chunk, _solve_batch(func, [row for _, row in chunk])
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Keep a couple of chunks in flight per worker, so that the workers never wait and memory use stays bounded.
+        pending: deque[tuple[list[tuple[int, dict[str, Any]]], Any]] = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(_solve_chunk, function, [row for _, row in chunk])))
+            if len(pending) >= 2 * jobs:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+
+
+def _output_row(index: int, row: dict[str, Any], result: Result) -> dict[str, Any]:
+    """Return the output row of a scenario."""
+    error = None if result.ok else f"{type(result.error).__name__}: {result.error}"
+    return {"row": index, **row, "value": _jsonable(result.value), "error": error}
+
+
+def _write(
+    stream: IO[str],
+    fmt: str,
+    results: Iterable[tuple[list[tuple[int, dict[str, Any]]], list[Result]]],
+    fieldnames: list[str] | None,
+    *,
+    header: bool,
+) -> None:
+    """Write the output rows, flushing after each chunk.
+
+    In CSV, the columns are `fieldnames`, or those of the first output row if it is `None`, e.g. for JSONL input, and
+    a later row with another column fails rather than losing it.
+    """
+    writer = None
+    for chunk, chunk_results in results:
+        for (index, row), result in zip(chunk, chunk_results, strict=True):
+            output = _output_row(index, row, result)
+            if fmt == "jsonl":
+                stream.write(json.dumps(output) + "\n")
+                continue
+
+            if writer is None:
+                writer = csv.DictWriter(stream, fieldnames or list(output), lineterminator="\n")
+                if header:
+                    writer.writeheader()
+            if extra := [key for key in output if key not in writer.fieldnames]:
+                msg = f"Row {index} has columns not in the CSV header: {', '.join(extra)}."
+                raise ValueError(msg)
+            if not isinstance(output["value"], int | float | None):
+                output["value"] = json.dumps(output["value"])
+            writer.writerow(output)
+        stream.flush()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `pystatpower` command.
+
+    Args:
+        argv:
+            The command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pystatpower", description="Evaluate a solve function for every row of a CSV or JSONL file."
+    )
+    parser.add_argument(
+        "function", help="qualified name of the function, e.g. proportion.independent.noninferiority.solve_size"
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="file of scenarios, or - for the standard input (default)"
+    )
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for the standard output (default)")
+    parser.add_argument(
+        "-f", "--format", choices=_FORMATS, help="format of the input (default: from its extension, else csv)"
+    )
+    parser.add_argument(
+        "--output-format", choices=_FORMATS, help="format of the output (default: from its extension, else the input's)"
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes (default: %(default)s)")
+    parser.add_argument("--chunksize", type=int, default=1024, help="rows solved together (default: %(default)s)")
+    parser.add_argument("--resume", action="store_true", help="skip the rows already in the output, and append to it")
+    args = parser.parse_args(argv)
+
+    try:
+        _resolve(args.function)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.jobs < 1 or args.chunksize < 1:
+        parser.error("--jobs and --chunksize must be positive integers")
+    if args.resume and args.output == "-":
+        parser.error("--resume requires an output file")
+
+    input_format = args.format or _format(args.input, "csv")
+    output_format = args.output_format or _format(args.output, input_format)
+    done, written = _completed(Path(args.output), output_format) if args.resume else (set(), None)
+
+    with ExitStack() as stack:
+        if args.input == "-":
+            source = sys.stdin
+        else:
+            source = stack.enter_context(Path(args.input).open(encoding="utf-8", newline=""))
+        if args.output == "-":
+            sink = sys.stdout
+        else:
+            mode = "a" if args.resume else "w"
+            sink = stack.enter_context(Path(args.output).open(mode, encoding="utf-8", newline=""))
+
+        columns, scenarios = _read(source, input_format)
+        rows = ((i, row) for i, row in enumerate(scenarios) if i not in done)
+        # The columns of a CSV input are all kept, even those left empty in the first rows.
+        fieldnames = written or (list(dict.fromkeys(["row", *columns, "value", "error"])) if columns else None)
+        try:
+            results = _solve(args.function, rows, args.jobs, args.chunksize)
+            _write(sink, output_format, results, fieldnames, header=written is None)
+        except (TypeError, ValueError) as e:
+            print(f"{parser.prog}: error: {type(e).__name__}: {e}", file=sys.stderr)
+            return 1
+    return 0
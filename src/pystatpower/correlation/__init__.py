@@ -9,10 +9,18 @@ This package provides the following modules:
 - inequality: Inequality tests for correlation coefficient.
 """
 
-from ..correlation import ci
-from ..correlation import inequality
+from typing import TYPE_CHECKING
+
+from .._lazy import _attach
+
+if TYPE_CHECKING:
+    from ..correlation import ci
+    from ..correlation import inequality
+
 
 __all__ = [
     "ci",
     "inequality",
 ]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
@@ -10,13 +10,15 @@ This module provides functions to calculate or estimate the following parameters
 """
 
 from math import atanh
-from math import ceil
 from math import sqrt
 from math import tanh
 from typing import Literal
 
-from scipy.optimize import brentq
-from scipy.stats import norm
+from .._constant import SAMPLE_SIZE_SEARCH_MAX
+from .._distributions import _norm_ppf
+from .._solver import _min_size
+from ..cache import _cached
+from ..diagnostics import _instrument
 
 
 def _distance_not_adjusted(
@@ -32,14 +34,14 @@ def _distance_not_adjusted(
 
     match interval_type:
         case "two-sided":
-            L = zr - norm.ppf(1 - alpha / 2) / se_recip
-            U = zr + norm.ppf(1 - alpha / 2) / se_recip
+            L = zr - _norm_ppf(1 - alpha / 2) / se_recip
+            U = zr + _norm_ppf(1 - alpha / 2) / se_recip
             distance = tanh(U) - tanh(L)
         case "lower":
-            L = zr - norm.ppf(1 - alpha) / se_recip
+            L = zr - _norm_ppf(1 - alpha) / se_recip
             distance = correlation - tanh(L)
         case "upper":
-            U = zr + norm.ppf(1 - alpha) / se_recip
+            U = zr + _norm_ppf(1 - alpha) / se_recip
             distance = tanh(U) - correlation
 
     return float(distance)
@@ -59,14 +61,14 @@ def _distance_adjusted(
 
     match interval_type:
         case "two-sided":
-            L = zr - bias - norm.ppf(1 - alpha / 2) / se_recip
-            U = zr - bias + norm.ppf(1 - alpha / 2) / se_recip
+            L = zr - bias - _norm_ppf(1 - alpha / 2) / se_recip
+            U = zr - bias + _norm_ppf(1 - alpha / 2) / se_recip
             distance = tanh(U) - tanh(L)
         case "lower":
-            L = zr - bias - norm.ppf(1 - alpha) / se_recip
+            L = zr - bias - _norm_ppf(1 - alpha) / se_recip
             distance = correlation - tanh(L)
         case "upper":
-            U = zr - bias + norm.ppf(1 - alpha) / se_recip
+            U = zr - bias + _norm_ppf(1 - alpha) / se_recip
             distance = tanh(U) - correlation
 
     return float(distance)
@@ -86,6 +88,8 @@ def _distance(
         return _distance_not_adjusted(correlation, size, conf_level, interval_type)
 
 
+@_instrument
+@_cached
 def solve_distance(
     *,
     correlation: float,
@@ -124,6 +128,8 @@ def solve_distance(
     return _distance(correlation, size, conf_level, interval_type, bias_adj)
 
 
+@_instrument
+@_cached
 def solve_size(
     *,
     correlation: float,
@@ -164,11 +170,8 @@ def solve_size(
     def func(size: float) -> float:
         return _distance(correlation, size, conf_level, interval_type, bias_adj) - distance
 
+    # func is monotonically decreasing. Considering realistic factors, the sample size should not be lower than
+    # ceil(lower_bound), which is returned if the required distance is already achieved there.
     lower_bound = 3 + 1e-12
-    upper_bound = 1e12
-    if func(lower_bound) < 0:
-        # func is monotonically decreasing. If func(lower_bound) < 0, it means the required sample size is less than lower_bound.
-        # Considering realistic factors, the sample size should not be lower than ceil(lower_bound)
-        return ceil(lower_bound)
-    else:
-        return ceil(brentq(func, lower_bound, upper_bound))
+    upper_bound = SAMPLE_SIZE_SEARCH_MAX
+    return _min_size(func, lower_bound, upper_bound, decreasing=True)
@@ -11,52 +11,67 @@ This module provides functions to calculate or estimate the following parameters
 - correlation under the null hypothesis
 """
 
-from math import atanh
-from math import ceil
-from math import sqrt
 from typing import Literal
 
-from scipy.optimize import brentq
-from scipy.stats import norm
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from .._distributions import _norm_cdf
+from .._distributions import _norm_ppf
+from .._math_utils import _all_scalar
+from .._math_utils import _asarray
+from .._math_utils import _scalar_or_array
+from .._solver import _as_sizes
+from .._solver import _min_size
+from .._solver import _min_sizes
+from .._solver import _root
+from ..cache import _cached
+from ..diagnostics import _instrument
 
 
 def _power(
-    null_correlation: float,
-    correlation: float,
+    null_correlation: ArrayLike,
+    correlation: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    size: float,
-    alpha: float,
-) -> float:
+    size: ArrayLike,
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power."""
-    null_zeta = atanh(null_correlation)
-    zeta = atanh(correlation)
-    se_recip = sqrt(size - 3)
+    null_zeta = np.arctanh(null_correlation)
+    zeta = np.arctanh(correlation)
+    se_recip = np.sqrt(size - 3)
 
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf(norm.ppf(1 - alpha / 2) - (zeta - null_zeta) * se_recip)
-                + norm.cdf(norm.ppf(alpha / 2) - (zeta - null_zeta) * se_recip)
+                - _norm_cdf(_norm_ppf(1 - alpha / 2) - (zeta - null_zeta) * se_recip)
+                + _norm_cdf(_norm_ppf(alpha / 2) - (zeta - null_zeta) * se_recip)
             )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - (zeta - null_zeta) * se_recip)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - (zeta - null_zeta) * se_recip)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - (zeta - null_zeta) * se_recip)
+            power = _norm_cdf(_norm_ppf(alpha) - (zeta - null_zeta) * se_recip)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
-    null_correlation: float,
-    correlation: float,
-    size: int,
+    null_correlation: ArrayLike,
+    correlation: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"] = "two-sided",
-    alpha: float = 0.05,
-) -> float:
+    alpha: ArrayLike = 0.05,
+) -> float | np.ndarray:
     r"""Calculate the statistical power.
 
+    The numeric parameters accept either scalars or array-likes, which are broadcast against each other following
+    NumPy rules.
+
     Args:
         null_correlation:
             Correlation coefficient under the null hypothesis.
@@ -77,21 +92,70 @@ def solve_power(
             - If `alternative` is `'greater'` or `'less'`, `alpha` represents the one-sided significance level.
 
     Returns:
-        The statistical power of the test.
+        The statistical power of the test. A float is returned if all numeric parameters are scalars, otherwise an
+        array with the broadcast shape of the parameters is returned.
     """
+    null_correlation, correlation = _asarray(null_correlation), _asarray(correlation)
+    size, alpha = _asarray(size), _asarray(alpha)
+
     return _power(null_correlation, correlation, alternative, size, alpha)
 
 
-def solve_size(
+def power_curve(
     *,
     null_correlation: float,
     correlation: float,
+    sizes: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"] = "two-sided",
     alpha: float = 0.05,
-    power: float = 0.8,
-) -> int:
+) -> np.ndarray:
+    r"""Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        null_correlation:
+            Correlation coefficient under the null hypothesis.
+        correlation:
+            Correlation coefficient under the alternative hypothesis.
+        sizes:
+            Sample sizes at which the power is evaluated.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `'two-sided'`, the alternative hypothesis is $\\rho \\neq \\rho_0$.
+            - If `alternative` is `'greater'`, the alternative hypothesis is $\\rho > \\rho_0$.
+            - If `alternative` is `'less'`, the alternative hypothesis is $\\rho < \\rho_0$.
+        alpha:
+            Significance level.
+
+            - If `alternative` is `'two-sided'`, `alpha` represents the two-sided significance level.
+            - If `alternative` is `'greater'` or `'less'`, `alpha` represents the one-sided significance level.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    return np.asarray(_power(null_correlation, correlation, alternative, sizes, alpha), dtype=float)
+
+
+@_instrument
+@_cached
+def solve_size(
+    *,
+    null_correlation: ArrayLike,
+    correlation: ArrayLike,
+    alternative: Literal["two-sided", "greater", "less"] = "two-sided",
+    alpha: ArrayLike = 0.05,
+    power: ArrayLike = 0.8,
+) -> int | np.ndarray:
     r"""Estimate the required sample size.
 
+    The numeric parameters accept either scalars or array-likes. Array-likes are broadcast against each other
+    following NumPy rules, and all sample sizes are solved together by a vectorized root finder.
+
     Args:
         null_correlation:
             Correlation coefficient under the null hypothesis.
@@ -114,15 +178,34 @@ def solve_size(
             0.8 is a commonly used value for statistical power.
 
     Returns:
-        The required sample size.
+        The required sample size. An integer is returned if all numeric parameters are scalars, otherwise an integer
+        array with the broadcast shape of the parameters is returned. In an array, the elements without a solution are
+        `NaN` instead of failing the whole call, in which case the array is a float array.
     """
+    null_correlation, correlation = _asarray(null_correlation), _asarray(correlation)
+    alpha, power = _asarray(alpha), _asarray(power)
+
+    if not _all_scalar(null_correlation, correlation, alpha, power):
+
+        def vfunc(
+            size: np.ndarray,
+            null_correlation: np.ndarray,
+            correlation: np.ndarray,
+            alpha: np.ndarray,
+            power: np.ndarray,
+        ) -> np.ndarray:
+            return _power(null_correlation, correlation, alternative, size, alpha) - power
+
+        return _as_sizes(_min_sizes(vfunc, 3, args=(null_correlation, correlation, alpha, power)))
 
     def func(size: float) -> float:
         return _power(null_correlation, correlation, alternative, size, alpha) - power
 
-    return ceil(brentq(func, 3, 1e12))
+    return _min_size(func, 3)
 
 
+@_instrument
+@_cached
 def solve_correlation(
     *,
     null_correlation: float,
@@ -185,11 +268,13 @@ def solve_correlation(
 
     match direction:
         case "less":
-            return float(brentq(func, -1 + 1e-12, null_correlation))
+            return float(_root(func, -1 + 1e-12, null_correlation))
         case "greater":
-            return float(brentq(func, null_correlation, 1 - 1e-12))
+            return float(_root(func, null_correlation, 1 - 1e-12))
 
 
+@_instrument
+@_cached
 def solve_null_correlation(
     *,
     correlation: float,
@@ -252,6 +337,6 @@ def solve_null_correlation(
 
     match direction:
         case "greater":
-            return float(brentq(func, correlation, 1 - 1e-12))
+            return float(_root(func, correlation, 1 - 1e-12))
         case "less":
-            return float(brentq(func, -1 + 1e-12, correlation))
+            return float(_root(func, -1 + 1e-12, correlation))
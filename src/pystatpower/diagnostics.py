@@ -0,0 +1,217 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Opt-in instrumentation of the solve functions.
+
+Within a `record()` block, every call of a public `solve_*` function is recorded: its wall time, the number of
+objective evaluations and iterations of the root finders, the brackets they searched, and the time spent in the
+distribution functions (quantiles, distribution functions and mass functions of SciPy). Outside of such a block, the
+instrumentation costs a single context variable lookup per call.
+
+```python
+from pystatpower import diagnostics
+from pystatpower.mean.single.inequality import solve_size
+
+with diagnostics.record() as recorder:
+    solve_size(diff=1, std=2)
+
+recorder.calls[0].evaluations
+recorder.summary()
+recorder.to_json()
+```
+
+Recording is local to the current thread or asyncio task, so concurrent code only records its own calls.
+"""
+
+import json
+
+from collections.abc import Callable
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from functools import wraps
+from time import perf_counter
+from typing import Any
+from typing import TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass
+class SolveRecord:
+    """The measurements of one call of a solve function.
+
+    Calls of other solve functions made while solving, e.g. a solve function delegating to another one, are counted as
+    part of the outermost call.
+
+    Attributes:
+        function:
+            Qualified name of the function relative to the package, e.g. `'mean.single.inequality.solve_size'`.
+        wall_time:
+            Wall time of the call, in seconds.
+        evaluations:
+            Number of evaluations of the objective by the root finders. A vectorized evaluation counts once.
+        iterations:
+            Number of iterations of the root finders.
+        brackets:
+            The brackets searched by the root finders, in the order of the searches.
+        distribution_time:
+            Time spent in the distribution functions, in seconds.
+        distribution_calls:
+            Number of calls of the distribution functions.
+        error:
+            Name of the exception raised by the call, or `None` if it succeeded.
+    """
+
+    function: str
+    wall_time: float = 0.0
+    evaluations: int = 0
+    iterations: int = 0
+    brackets: list[tuple[float, float]] = field(default_factory=list)
+    distribution_time: float = 0.0
+    distribution_calls: int = 0
+    error: str | None = None
+
+
+_COUNTERS = ("wall_time", "evaluations", "iterations", "distribution_time", "distribution_calls")
+
+
+class Recorder:
+    """Collects the records of the solve calls made within a `record()` block.
+
+    Attributes:
+        calls:
+            The record of every call, in call order. Empty if the recorder does not keep individual calls.
+    """
+
+    def __init__(self, *, keep_calls: bool = True) -> None:
+        """Initialize the recorder.
+
+        Args:
+            keep_calls:
+                Whether to keep the record of every call, or only the aggregated counters.
+        """
+        self.keep_calls = keep_calls
+        self.calls: list[SolveRecord] = []
+        self._totals: dict[str, dict[str, float]] = {}
+
+    def _add(self, call: SolveRecord) -> None:
+        if self.keep_calls:
+            self.calls.append(call)
+
+        totals = self._totals.setdefault(
+            call.function, {"calls": 0, "errors": 0, "max_wall_time": 0.0, **dict.fromkeys(_COUNTERS, 0)}
+        )
+        totals["calls"] += 1
+        totals["errors"] += call.error is not None
+        totals["max_wall_time"] = max(totals["max_wall_time"], call.wall_time)
+        for name in _COUNTERS:
+            totals[name] += getattr(call, name)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Aggregate the records per function.
+
+        Returns:
+            For each function, the number of `calls` and `errors`, the totals of the counters of `SolveRecord`, the
+            mean wall time and number of evaluations per call, and the maximum wall time.
+        """
+        summary = {}
+        for function, totals in self._totals.items():
+            summary[function] = dict(totals)
+            summary[function]["mean_wall_time"] = totals["wall_time"] / totals["calls"]
+            summary[function]["mean_evaluations"] = totals["evaluations"] / totals["calls"]
+        return summary
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export the summary and, if kept, the individual calls as a dictionary of plain Python objects."""
+        return {"summary": self.summary(), "calls": [asdict(call) for call in self.calls]}
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Export `to_dict()` as JSON. Keyword arguments are passed to `json.dumps`."""
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def reset(self) -> None:
+        """Discard all records."""
+        self.calls.clear()
+        self._totals.clear()
+
+
+_recorder: ContextVar[Recorder | None] = ContextVar("_recorder", default=None)
+_current: ContextVar[SolveRecord | None] = ContextVar("_current", default=None)
+
+
+@contextmanager
+def record(*, keep_calls: bool = True) -> Generator[Recorder, None, None]:
+    """Record the solve calls made within the block.
+
+    Args:
+        keep_calls:
+            Whether to keep the record of every call. If `False`, only the aggregated counters are kept, so that
+            memory use does not grow with the number of calls.
+
+    Yields:
+        The recorder collecting the records.
+    """
+    recorder = Recorder(keep_calls=keep_calls)
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def _instrument(func: _F) -> _F:
+    """Record the calls of a solve function while a recorder is active."""
+    name = f"{func.__module__.removeprefix(f'{__package__}.')}.{func.__name__}"
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        recorder = _recorder.get()
+        if recorder is None or _current.get() is not None:
+            return func(*args, **kwargs)
+
+        call = SolveRecord(function=name)
+        token = _current.set(call)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            call.error = type(e).__name__
+            raise
+        finally:
+            call.wall_time = perf_counter() - start
+            _current.reset(token)
+            recorder._add(call)
+
+    return wrapper
+
+
+def _timed(func: _F) -> _F:
+    """Record the time spent in a distribution function while a solve call is being recorded."""
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        call = _current.get()
+        if call is None:
+            return func(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            call.distribution_time += perf_counter() - start
+            call.distribution_calls += 1
+
+    return wrapper
+
+
+def _record_search(bracket: tuple[float, float], evaluations: int, iterations: int) -> None:
+    """Record a search of a root finder in the solve call being recorded, if any."""
+    call = _current.get()
+    if call is not None:
+        call.brackets.append((float(bracket[0]), float(bracket[1])))
+        call.evaluations += evaluations
+        call.iterations += iterations
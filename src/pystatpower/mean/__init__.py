@@ -9,10 +9,18 @@ This package provides the following subpackages:
 - independent: Power analysis for two independent mean.
 """
 
-from ..mean import independent
-from ..mean import single
+from typing import TYPE_CHECKING
+
+from .._lazy import _attach
+
+if TYPE_CHECKING:
+    from ..mean import independent
+    from ..mean import single
+
 
 __all__ = [
     "single",
     "independent",
 ]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
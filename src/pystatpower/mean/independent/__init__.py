@@ -11,10 +11,16 @@ This package provides the following modules:
 - superiority: Superiority tests for two independent means.
 """
 
-from ...mean.independent import ci
-from ...mean.independent import inequality
-from ...mean.independent import noninferiority
-from ...mean.independent import superiority
+from typing import TYPE_CHECKING
+
+from ..._lazy import _attach
+
+if TYPE_CHECKING:
+    from ...mean.independent import ci
+    from ...mean.independent import inequality
+    from ...mean.independent import noninferiority
+    from ...mean.independent import superiority
+
 
 __all__ = [
     "ci",
@@ -22,3 +28,5 @@ __all__ = [
     "noninferiority",
     "superiority",
 ]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
@@ -1,82 +1,87 @@
 # Copyright (C) 2024-present The Package Authors
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from math import sqrt
 from typing import Literal
 
-from scipy.stats import nct
-from scipy.stats import norm
-from scipy.stats import t
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from ..._distributions import _nct_cdf
+from ..._distributions import _norm_cdf
+from ..._distributions import _norm_ppf
+from ..._distributions import _t_ppf
+from ..._math_utils import _scalar_or_array
 
 
 def _power_z_equal_var(
-    diff: float,
-    margin: float,
-    std: float,
-    treatment_size: float,
-    reference_size: float,
+    diff: ArrayLike,
+    margin: ArrayLike,
+    std: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the power of two independent mean difference test, using z test, assuming equal variances."""
-    se = std * sqrt(1 / treatment_size + 1 / reference_size)
+    se = std * np.sqrt(1 / treatment_size + 1 / reference_size)
 
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf(norm.ppf(1 - alpha / 2) - (diff - margin) / se)
-                + norm.cdf(norm.ppf(alpha / 2) - (diff - margin) / se)
+                - _norm_cdf(_norm_ppf(1 - alpha / 2) - (diff - margin) / se)
+                + _norm_cdf(_norm_ppf(alpha / 2) - (diff - margin) / se)
             )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - (diff - margin) / se)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - (diff - margin) / se)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - (diff - margin) / se)
+            power = _norm_cdf(_norm_ppf(alpha) - (diff - margin) / se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_z_unequal_var(
-    diff: float,
-    margin: float,
-    treatment_std: float,
-    reference_std: float,
-    treatment_size: float,
-    reference_size: float,
+    diff: ArrayLike,
+    margin: ArrayLike,
+    treatment_std: ArrayLike,
+    reference_std: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the power of two independent mean difference test, using z test, assuming unequal variances."""
-    se = sqrt(treatment_std**2 / treatment_size + reference_std**2 / reference_size)
+    se = np.sqrt(treatment_std**2 / treatment_size + reference_std**2 / reference_size)
 
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf(norm.ppf(1 - alpha / 2) - (diff - margin) / se)
-                + norm.cdf(norm.ppf(alpha / 2) - (diff - margin) / se)
+                - _norm_cdf(_norm_ppf(1 - alpha / 2) - (diff - margin) / se)
+                + _norm_cdf(_norm_ppf(alpha / 2) - (diff - margin) / se)
             )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - (diff - margin) / se)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - (diff - margin) / se)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - (diff - margin) / se)
+            power = _norm_cdf(_norm_ppf(alpha) - (diff - margin) / se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_t_equal_var(
-    diff: float,
-    margin: float,
-    treatment_std: float,
-    reference_std: float,
-    treatment_size: float,
-    reference_size: float,
+    diff: ArrayLike,
+    margin: ArrayLike,
+    treatment_std: ArrayLike,
+    reference_std: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the power of two independent mean difference test, using t test, assuming equal variances."""
     df = treatment_size + reference_size - 2
-    se = sqrt(
+    se = np.sqrt(
         ((treatment_size - 1) * treatment_std**2 + (reference_size - 1) * reference_std**2)
         / df
         * (1 / treatment_size + 1 / reference_size)
@@ -85,88 +90,88 @@ def _power_t_equal_var(
 
     match alternative:
         case "two-sided":
-            power = 1 - nct.cdf(t.ppf(1 - alpha / 2, df), df, nc) + nct.cdf(t.ppf(alpha / 2, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha / 2, df), df, nc) + _nct_cdf(_t_ppf(alpha / 2, df), df, nc)
         case "greater":
-            power = 1 - nct.cdf(t.ppf(1 - alpha, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha, df), df, nc)
         case "less":
-            power = nct.cdf(t.ppf(alpha, df), df, nc)
+            power = _nct_cdf(_t_ppf(alpha, df), df, nc)
 
-    return power
+    return _scalar_or_array(power)
 
 
 def _power_t_unequal_var_welch(
-    diff: float,
-    margin: float,
-    treatment_std: float,
-    reference_std: float,
-    treatment_size: float,
-    reference_size: float,
+    diff: ArrayLike,
+    margin: ArrayLike,
+    treatment_std: ArrayLike,
+    reference_std: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the power of two independent mean difference test, using Welch's approximate t test."""
     df = (treatment_std**2 / treatment_size + reference_std**2 / reference_size) ** 2 / (
         treatment_std**4 / (treatment_size**2 * (treatment_size + 1))
         + reference_std**4 / (reference_size**2 * (reference_size + 1))
     ) - 2
-    se = sqrt(treatment_std**2 / treatment_size + reference_std**2 / reference_size)
+    se = np.sqrt(treatment_std**2 / treatment_size + reference_std**2 / reference_size)
     nc = (diff - margin) / se
 
     match alternative:
         case "two-sided":
-            power = 1 - nct.cdf(t.ppf(1 - alpha / 2, df), df, nc) + nct.cdf(t.ppf(alpha / 2, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha / 2, df), df, nc) + _nct_cdf(_t_ppf(alpha / 2, df), df, nc)
         case "greater":
-            power = 1 - nct.cdf(t.ppf(1 - alpha, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha, df), df, nc)
         case "less":
-            power = nct.cdf(t.ppf(alpha, df), df, nc)
+            power = _nct_cdf(_t_ppf(alpha, df), df, nc)
 
-    return power
+    return _scalar_or_array(power)
 
 
 def _power_t_unequal_var_satterthwaite(
-    diff: float,
-    margin: float,
-    treatment_std: float,
-    reference_std: float,
-    treatment_size: float,
-    reference_size: float,
+    diff: ArrayLike,
+    margin: ArrayLike,
+    treatment_std: ArrayLike,
+    reference_std: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the power of two independent mean difference test, using Satterthwaite's approximate t test."""
     df = (treatment_std**2 / treatment_size + reference_std**2 / reference_size) ** 2 / (
         treatment_std**4 / (treatment_size**2 * (treatment_size - 1))
         + reference_std**4 / (reference_size**2 * (reference_size - 1))
     )
-    se = sqrt(treatment_std**2 / treatment_size + reference_std**2 / reference_size)
+    se = np.sqrt(treatment_std**2 / treatment_size + reference_std**2 / reference_size)
     nc = (diff - margin) / se
 
     match alternative:
         case "two-sided":
-            power = 1 - nct.cdf(t.ppf(1 - alpha / 2, df), df, nc) + nct.cdf(t.ppf(alpha / 2, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha / 2, df), df, nc) + _nct_cdf(_t_ppf(alpha / 2, df), df, nc)
         case "greater":
-            power = 1 - nct.cdf(t.ppf(1 - alpha, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha, df), df, nc)
         case "less":
-            power = nct.cdf(t.ppf(alpha, df), df, nc)
+            power = _nct_cdf(_t_ppf(alpha, df), df, nc)
 
-    return power
+    return _scalar_or_array(power)
 
 
 def _power(
     *,
-    diff: float | None = None,
-    margin: float,
-    treatment_std: float | None = None,
-    reference_std: float | None = None,
-    std: float | None = None,
-    treatment_size: float,
-    reference_size: float,
+    diff: ArrayLike | None = None,
+    margin: ArrayLike,
+    treatment_std: ArrayLike | None = None,
+    reference_std: ArrayLike | None = None,
+    std: ArrayLike | None = None,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
+    alpha: ArrayLike,
     dist: Literal["z", "t"],
     equal_var: bool,
     approx_t_method: Literal["welch", "satterthwaite"],
-) -> float:
+) -> float | np.ndarray:
     """Calculate the power of two independent mean difference test."""
     match dist:
         case "z":
@@ -206,4 +211,60 @@ def _power(
                             alpha,
                         )
 
-    return power
+    return _scalar_or_array(power)
+
+
+def _size_guess(
+    *,
+    diff: float,
+    margin: float,
+    treatment_std: float | None = None,
+    reference_std: float | None = None,
+    std: float | None = None,
+    ratio: float,
+    alternative: Literal["two-sided", "greater", "less"],
+    alpha: float,
+    power: float,
+    dist: Literal["z", "t"],
+    equal_var: bool,
+) -> float:
+    """Approximate the required sample size of the smaller group in closed form.
+
+    The z-test solution is used, neglecting the far tail of the two-sided test. For the t-test, Guenther's correction
+    of z²/4 is added on top of it.
+    """
+    if diff == margin:
+        return float("inf")
+
+    if dist == "z" and equal_var:
+        treatment_std = reference_std = std
+
+    if ratio >= 1:
+        var = treatment_std**2 / ratio + reference_std**2
+    else:
+        var = treatment_std**2 + reference_std**2 * ratio
+
+    z_alpha = _norm_ppf(1 - alpha / 2) if alternative == "two-sided" else _norm_ppf(1 - alpha)
+    size = var * ((z_alpha + _norm_ppf(power)) / (diff - margin)) ** 2
+    if dist == "t":
+        size += z_alpha**2 / 4
+
+    return float(size)
+
+
+def _se(
+    treatment_std: float | None,
+    reference_std: float | None,
+    std: float | None,
+    treatment_size: float,
+    reference_size: float,
+) -> float:
+    """Approximate the standard error of the mean difference, which is the natural scale of the searches over means.
+
+    A missing standard deviation is taken from the common `std`, or else from the other group.
+    """
+    if treatment_std is None:
+        treatment_std = std if std is not None else reference_std
+    if reference_std is None:
+        reference_std = std if std is not None else treatment_std
+    return float(np.sqrt(treatment_std**2 / treatment_size + reference_std**2 / reference_size))
@@ -13,8 +13,10 @@ from math import ceil
 from math import sqrt
 from typing import Literal
 
-from scipy.optimize import brentq
-from scipy.stats import t
+from ..._distributions import _t_ppf
+from ..._solver import _min_size
+from ...cache import _cached
+from ...diagnostics import _instrument
 
 
 def _precision(
@@ -45,15 +47,17 @@ def _precision(
 
     match interval_type:
         case "two-sided":
-            prcision = t.ppf(1 - alpha / 2, df) * se
+            prcision = _t_ppf(1 - alpha / 2, df) * se
         case "lower":
-            prcision = t.ppf(1 - alpha, df) * se
+            prcision = _t_ppf(1 - alpha, df) * se
         case "upper":
-            prcision = t.ppf(1 - alpha, df) * se
+            prcision = _t_ppf(1 - alpha, df) * se
 
     return float(prcision)
 
 
+@_instrument
+@_cached
 def solve_precision(
     *,
     treatment_std: float,
@@ -97,6 +101,8 @@ def solve_precision(
     )
 
 
+@_instrument
+@_cached
 def solve_size(
     *,
     treatment_std: float,
@@ -151,7 +157,7 @@ def solve_size(
                 - precision
             )
 
-        reference_size = ceil(brentq(func, 1, 1e12))
+        reference_size = _min_size(func, 1, decreasing=True)
         treatment_size = ceil(reference_size * ratio)
     else:  # ratio < 1
 
@@ -169,7 +175,7 @@ def solve_size(
                 - precision
             )
 
-        treatment_size = ceil(brentq(func, 1, 1e12))
+        treatment_size = _min_size(func, 1, decreasing=True)
         reference_size = ceil(treatment_size / ratio)
 
     return treatment_size, reference_size
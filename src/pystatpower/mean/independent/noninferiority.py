@@ -7,6 +7,7 @@ This module provides functions to calculate or estimate the following parameters
 
 - statistical power
 - sample size
+- sample sizes minimizing the total cost
 - mean difference
 - mean for the treatment group
 - mean for the reference group
@@ -18,9 +19,20 @@ This module provides functions to calculate or estimate the following parameters
 from math import ceil
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
+
+from ..._constant import LOWER_LIMIT_OF_SAMPLE_SIZE
+from ..._constant import SAMPLE_SIZE_SEARCH_MAX
+from ..._solver import _min_cost_sizes
+from ..._solver import _min_size
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ._power import _power
+from ._power import _se
+from ._power import _size_guess
 from ._verify import _verify_mean_and_get_diff
 from ._verify import _verify_std_and_get_std
 
@@ -34,6 +46,8 @@ def _margin(margin: float, alternative: Literal["greater", "less"]) -> float:
             return abs(margin)
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
     treatment_mean: float | None = None,
@@ -147,6 +161,129 @@ def solve_power(
     return power
 
 
+def power_curve(
+    *,
+    treatment_mean: float | None = None,
+    reference_mean: float | None = None,
+    diff: float | None = None,
+    margin: float,
+    treatment_std: float | None = None,
+    reference_std: float | None = None,
+    std: float | None = None,
+    sizes: ArrayLike,
+    ratio: float = 1,
+    alternative: Literal["greater", "less"],
+    alpha: float = 0.025,
+    dist: Literal["z", "t"] = "t",
+    equal_var: bool = False,
+    approx_t_method: Literal["welch", "satterthwaite"] = "welch",
+) -> np.ndarray:
+    r"""Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        treatment_mean:
+            Mean in the treatment group.
+
+            If `diff` is omitted, this parameter is required along with `reference_mean`.
+        reference_mean:
+            Mean in the reference group.
+
+            If `diff` is omitted, this parameter is required along with `treatment_mean`.
+        diff:
+            Mean difference between treatment and reference group.
+
+            If both `treatment_mean` and `reference_mean` are not specified, this parameter is required.
+        margin:
+            The non-inferiority margin.
+
+            !!! tip
+
+                Regardless of whether `alternative` is specified as `'greater'` or `'less'`, you can always specify this
+                parameter as either positive or negative, as you prefer. Internally, the value of `margin` is converted
+                before actual calculation takes place.
+
+                - If `alternative` is `greater`, the actual margin used internally is `-abs(margin)`.
+                - If `alternative` is `less`, the actual margin used internally is `abs(margin)`.
+        treatment_std:
+            Standard deviation in the treatment group.
+        reference_std:
+            Standard deviation in the reference group.
+        std:
+            Standard deviation in both groups.
+
+            This is a convenience parameter that will override `treatment_std` and `reference_std` when `dist` is `z` and `equal_var` is `True`.
+
+            If you specify `dist` as `z` and `equal_var` as `True`, you can just specify `std` instead of `treatment_std` and `reference_std`.
+            Internally, the value of `std` will be treated as the standard deviation of both the treatment and reference groups.
+        sizes:
+            Sample sizes in the reference group at which the power is evaluated.
+        ratio:
+            Ratio of sample sizes in the treatment and reference groups. The sample sizes in the treatment group are
+            `ratio` * `sizes`, rounded up as in `solve_size`.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `greater`, the alternative hypothesis is $\\mu_1 - \\mu_2 > \\delta$ ($\\delta < 0$)
+            - If `alternative` is `less`, the alternative hypothesis is $\\mu_1 - \\mu_2 < \\delta$ ($\\delta > 0$)
+        alpha:
+            Significance level.
+
+            The non-inferiority test is a one-sided test, with a significance level of 0.025 being commonly used.
+        dist:
+            The distribution used for the test.
+
+            - `'z'`: Standard normal distribution.
+            - `'t'`: Student's or non-central t distribution.
+        equal_var:
+            Whether to assume equal variances between treatment and reference groups.
+
+            - `True`: Variances are assumed equal.
+            - `False`: Variances are assumed unequal.
+        approx_t_method:
+            Approximate t-test method. It is used when `dist` is `'t'` and `equal_var` = `False`.
+
+            - `'welch'`: Welch's approximate t-test (1947).
+            - `'satterthwaite'`: Satterthwaite's approximate t-test (1946).
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+
+    Raises:
+        ValueError: If all of `diff`, `treatment_mean` and `reference_mean` are omitted.
+        ValueError: If `dist` is `z` and `equal_var` is `True`, and all `treatment_std`, `reference_std` and `std` is omitted.
+        ValueError: If `dist` is `z` and `equal_var` is `True`, and both `treatment_std` and `reference_std` are provided, but they are not equal.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    diff = _verify_mean_and_get_diff(treatment_mean, reference_mean, diff)
+    std = _verify_std_and_get_std(treatment_std, reference_std, std, dist, equal_var)
+
+    margin = _margin(margin, alternative)
+
+    return np.asarray(
+        _power(
+            diff=diff,
+            margin=margin,
+            treatment_std=treatment_std,
+            reference_std=reference_std,
+            std=std,
+            treatment_size=np.ceil(sizes * ratio),
+            reference_size=sizes,
+            alternative=alternative,
+            alpha=alpha,
+            dist=dist,
+            equal_var=equal_var,
+            approx_t_method=approx_t_method,
+        ),
+        dtype=float,
+    )
+
+
+@_instrument
+@_cached
 def solve_size(
     *,
     treatment_mean: float | None = None,
@@ -245,6 +382,20 @@ def solve_size(
 
     margin = _margin(margin, alternative)
 
+    guess = _size_guess(
+        diff=diff,
+        margin=margin,
+        treatment_std=treatment_std,
+        reference_std=reference_std,
+        std=std,
+        ratio=ratio,
+        alternative=alternative,
+        alpha=alpha,
+        power=power,
+        dist=dist,
+        equal_var=equal_var,
+    )
+
     if ratio >= 1:
 
         def func(reference_size: float) -> float:
@@ -267,8 +418,8 @@ def solve_size(
             )
 
         lb = max(1 + 1e-12, 3 / (1 + ratio))
-        ub = 1e12
-        reference_size = int(ceil(brentq(func, lb, ub)))
+        ub = SAMPLE_SIZE_SEARCH_MAX
+        reference_size = _min_size(func, lb, ub, guess=guess)
         treatment_size = int(ceil(reference_size * ratio))
         return treatment_size, reference_size
     else:
@@ -293,12 +444,150 @@ def solve_size(
             )
 
         lb = max(1 + 1e-12, 3 / (1 + 1 / ratio))
-        ub = 1e12
-        treatment_size = ceil(brentq(func, lb, ub))
+        ub = SAMPLE_SIZE_SEARCH_MAX
+        treatment_size = _min_size(func, lb, ub, guess=guess)
         reference_size = ceil(treatment_size / ratio)
         return treatment_size, reference_size
 
 
+@_instrument
+@_cached
+def solve_allocation(
+    *,
+    treatment_mean: float | None = None,
+    reference_mean: float | None = None,
+    diff: float | None = None,
+    margin: float,
+    treatment_std: float | None = None,
+    reference_std: float | None = None,
+    std: float | None = None,
+    alternative: Literal["greater", "less"],
+    alpha: float = 0.025,
+    power: float = 0.8,
+    treatment_cost: float = 1,
+    reference_cost: float = 1,
+    dist: Literal["z", "t"] = "t",
+    equal_var: bool = False,
+    approx_t_method: Literal["welch", "satterthwaite"] = "welch",
+) -> tuple[int, int]:
+    r"""Estimate the sample sizes that minimize the total cost at the expected power.
+
+    Instead of fixing the ratio of the sample sizes, the cost of a subject is given for each group, and the sample
+    sizes reaching the expected power at the lowest total cost `treatment_cost * treatment_size + reference_cost *
+    reference_size` are searched for. The ratio of the returned sample sizes is thus the cost-optimal allocation ratio.
+    All candidate ratios are evaluated together, which replaces calling `solve_size` for each of them.
+
+    Args:
+        treatment_mean:
+            Mean in the treatment group.
+
+            If `diff` is omitted, this parameter is required along with `reference_mean`.
+        reference_mean:
+            Mean in the reference group.
+
+            If `diff` is omitted, this parameter is required along with `treatment_mean`.
+        diff:
+            Mean difference between treatment and reference group.
+
+            If both `treatment_mean` and `reference_mean` are not specified, this parameter is required.
+        margin:
+            The non-inferiority margin.
+
+            !!! tip
+
+                Regardless of whether `alternative` is specified as `'greater'` or `'less'`, you can always specify this
+                parameter as either positive or negative, as you prefer. Internally, the value of `margin` is converted
+                before actual calculation takes place.
+
+                - If `alternative` is `greater`, the actual margin used internally is `-abs(margin)`.
+                - If `alternative` is `less`, the actual margin used internally is `abs(margin)`.
+        treatment_std:
+            Standard deviation in the treatment group.
+        reference_std:
+            Standard deviation in the reference group.
+        std:
+            Standard deviation in both groups.
+
+            This is a convenience parameter that will override `treatment_std` and `reference_std` when `dist` is `z` and `equal_var` is `True`.
+
+            If you specify `dist` as `z` and `equal_var` as `True`, you can just specify `std` instead of `treatment_std` and `reference_std`.
+            Internally, the value of `std` will be treated as the standard deviation of both the treatment and reference groups.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `greater`, the alternative hypothesis is $\\mu_1 - \\mu_2 > \\delta$ ($\\delta < 0$)
+            - If `alternative` is `less`, the alternative hypothesis is $\\mu_1 - \\mu_2 < \\delta$ ($\\delta > 0$)
+        alpha:
+            Significance level.
+
+            The non-inferiority test is a one-sided test, with a significance level of 0.025 being commonly used.
+        power:
+            Expected statistical power.
+
+            0.8 is a commonly used value for statistical power.
+        treatment_cost:
+            Cost per subject in the treatment group.
+        reference_cost:
+            Cost per subject in the reference group.
+        dist:
+            The distribution used for the test.
+
+            - `'z'`: Standard normal distribution.
+            - `'t'`: Student's or non-central t distribution.
+        equal_var:
+            Whether to assume equal variances between treatment and reference groups.
+
+            - `True`: Variances are assumed equal.
+            - `False`: Variances are assumed unequal.
+        approx_t_method:
+            Approximate t-test method. It is used when `dist` is `'t'` and `equal_var` = `False`.
+
+            - `'welch'`: Welch's approximate t-test (1947).
+            - `'satterthwaite'`: Satterthwaite's approximate t-test (1946).
+
+    Returns:
+        The sample sizes in the treatment and reference groups, respectively. If several designs have the lowest cost,
+        the balanced one is preferred, and otherwise the one with the smallest reference group.
+
+    Raises:
+        ValueError: If all of `diff`, `treatment_mean` and `reference_mean` are omitted.
+        ValueError: If `dist` is `z` and `equal_var` is `True`, and all `treatment_std`, `reference_std` and `std` is omitted.
+        ValueError: If `dist` is `z` and `equal_var` is `True`, and both `treatment_std` and `reference_std` are provided, but they are not equal.
+        ValueError: If `treatment_cost` or `reference_cost` is not positive.
+    """
+    if treatment_cost <= 0 or reference_cost <= 0:
+        msg = "'treatment_cost' and 'reference_cost' must be positive."
+        raise ValueError(msg)
+
+    diff = _verify_mean_and_get_diff(treatment_mean, reference_mean, diff)
+    std = _verify_std_and_get_std(treatment_std, reference_std, std, dist, equal_var)
+
+    margin = _margin(margin, alternative)
+
+    def func(treatment_size: np.ndarray, reference_size: np.ndarray) -> np.ndarray:
+        return (
+            _power(
+                diff=diff,
+                margin=margin,
+                treatment_std=treatment_std,
+                reference_std=reference_std,
+                std=std,
+                treatment_size=treatment_size,
+                reference_size=reference_size,
+                alternative=alternative,
+                alpha=alpha,
+                dist=dist,
+                equal_var=equal_var,
+                approx_t_method=approx_t_method,
+            )
+            - power
+        )
+
+    return _min_cost_sizes(func, treatment_cost, reference_cost, LOWER_LIMIT_OF_SAMPLE_SIZE)
+
+
+@_instrument
+@_cached
 def solve_diff(
     *,
     margin: float,
@@ -403,13 +692,16 @@ def solve_diff(
             - power
         )
 
+    se = _se(treatment_std, reference_std, std, treatment_size, reference_size)
     match alternative:
         case "greater":
-            return float(brentq(func, margin, 1e9))
+            return float(_root(func, margin, step=se))
         case "less":
-            return float(brentq(func, -1e9, margin))
+            return float(_root(func, ub=margin, step=se))
 
 
+@_instrument
+@_cached
 def solve_treatment_mean(
     *,
     reference_mean: float,
@@ -517,13 +809,16 @@ def solve_treatment_mean(
             - power
         )
 
+    se = _se(treatment_std, reference_std, std, treatment_size, reference_size)
     match alternative:
         case "greater":
-            return float(brentq(func, reference_mean + margin, 1e9))
+            return float(_root(func, reference_mean + margin, step=se))
         case "less":
-            return float(brentq(func, -1e9, reference_mean + margin))
+            return float(_root(func, ub=reference_mean + margin, step=se))
 
 
+@_instrument
+@_cached
 def solve_reference_mean(
     *,
     treatment_mean: float,
@@ -631,13 +926,16 @@ def solve_reference_mean(
             - power
         )
 
+    se = _se(treatment_std, reference_std, std, treatment_size, reference_size)
     match alternative:
         case "greater":
-            return float(brentq(func, -1e9, treatment_mean - margin))
+            return float(_root(func, ub=treatment_mean - margin, step=se))
         case "less":
-            return float(brentq(func, treatment_mean - margin, 1e9))
+            return float(_root(func, treatment_mean - margin, step=se))
 
 
+@_instrument
+@_cached
 def solve_margin(
     *,
     treatment_mean: float | None = None,
@@ -748,13 +1046,16 @@ def solve_margin(
             - power
         )
 
+    se = _se(treatment_std, reference_std, std, treatment_size, reference_size)
     match alternative:
         case "greater":
-            return float(brentq(func, -1e9, diff))
+            return float(_root(func, ub=diff, step=se))
         case "less":
-            return float(brentq(func, diff, 1e9))
+            return float(_root(func, diff, step=se))
 
 
+@_instrument
+@_cached
 def solve_treatment_std(
     *,
     treatment_mean: float | None = None,
@@ -932,9 +1233,11 @@ def solve_treatment_std(
                 - power
             )
 
-    return float(brentq(func, 1e-6, 1e6))
+    return float(_root(func, 0, start=abs(diff - margin) or 1.0))
 
 
+@_instrument
+@_cached
 def solve_reference_std(
     *,
     treatment_mean: float | None = None,
@@ -1113,4 +1416,4 @@ def solve_reference_std(
                 - power
             )
 
-    return float(brentq(func, 1e-6, 1e6))
+    return float(_root(func, 0, start=abs(diff - margin) or 1.0))
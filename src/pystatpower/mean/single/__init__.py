@@ -12,10 +12,16 @@ This package provides the following modules:
 - equivalence: Equivalence tests for a single mean.
 """
 
-from ...mean.single import ci
-from ...mean.single import inequality
-from ...mean.single import noninferiority
-from ...mean.single import superiority
+from typing import TYPE_CHECKING
+
+from ..._lazy import _attach
+
+if TYPE_CHECKING:
+    from ...mean.single import ci
+    from ...mean.single import inequality
+    from ...mean.single import noninferiority
+    from ...mean.single import superiority
+
 
 __all__ = [
     "ci",
@@ -23,3 +29,5 @@ __all__ = [
     "noninferiority",
     "superiority",
 ]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
@@ -1,66 +1,101 @@
 # Copyright (C) 2024-present The Package Authors
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from math import sqrt
 from typing import Literal
 
-from scipy.stats import nct
-from scipy.stats import norm
-from scipy.stats import t
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from ..._distributions import _nct_cdf
+from ..._distributions import _norm_cdf
+from ..._distributions import _norm_ppf
+from ..._distributions import _t_ppf
+from ..._math_utils import _scalar_or_array
 
 
 def _power_z(
-    offset: float,
-    std: float,
-    size: float,
+    offset: ArrayLike,
+    std: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power based on z-distribution."""
-    se = std / sqrt(size)
+    se = std / np.sqrt(size)
     match alternative:
         case "two-sided":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha / 2) - offset / se) + norm.cdf(norm.ppf(alpha / 2) - offset / se)
+            power = (
+                1 - _norm_cdf(_norm_ppf(1 - alpha / 2) - offset / se) + _norm_cdf(_norm_ppf(alpha / 2) - offset / se)
+            )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - offset / se)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - offset / se)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - offset / se)
+            power = _norm_cdf(_norm_ppf(alpha) - offset / se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_t(
-    offset: float,
-    std: float,
-    size: float,
+    offset: ArrayLike,
+    std: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power based on t-distribution."""
     df = size - 1
-    nc = offset * sqrt(size) / std
+    nc = offset * np.sqrt(size) / std
     match alternative:
         case "two-sided":
-            power = 1 - nct.cdf(t.ppf(1 - alpha / 2, df), df, nc) + nct.cdf(t.ppf(alpha / 2, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha / 2, df), df, nc) + _nct_cdf(_t_ppf(alpha / 2, df), df, nc)
         case "greater":
-            power = 1 - nct.cdf(t.ppf(1 - alpha, df), df, nc)
+            power = 1 - _nct_cdf(_t_ppf(1 - alpha, df), df, nc)
         case "less":
-            power = nct.cdf(t.ppf(alpha, df), df, nc)
+            power = _nct_cdf(_t_ppf(alpha, df), df, nc)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power(
-    offset: float,
-    std: float,
-    size: float,
+    offset: ArrayLike,
+    std: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
+    alpha: ArrayLike,
     dist: Literal["z", "t"] = "t",
-) -> float:
-    """Calculate the statistical power."""
+) -> float | np.ndarray:
+    """Calculate the statistical power.
+
+    All numeric arguments broadcast against each other following NumPy rules. A Python float is returned if every
+    argument is a scalar, otherwise an array of the broadcast shape is returned.
+    """
     match dist:
         case "z":
             return _power_z(offset, std, size, alternative, alpha)
         case "t":
             return _power_t(offset, std, size, alternative, alpha)
+
+
+def _size_guess(
+    offset: float,
+    std: float,
+    alternative: Literal["two-sided", "greater", "less"],
+    alpha: float,
+    power: float,
+    dist: Literal["z", "t"],
+) -> float:
+    """Approximate the required sample size in closed form.
+
+    The z-test solution is used, neglecting the far tail of the two-sided test. For the t-test, Guenther's correction
+    of z²/2 is added on top of it.
+    """
+    if offset == 0:
+        return float("inf")
+
+    z_alpha = _norm_ppf(1 - alpha / 2) if alternative == "two-sided" else _norm_ppf(1 - alpha)
+    size = ((z_alpha + _norm_ppf(power)) * std / offset) ** 2
+    if dist == "t":
+        size += z_alpha**2 / 2
+
+    return float(size)
@@ -10,13 +10,14 @@ This module provides functions to calculate or estimate the following parameters
 - standard deviation
 """
 
-from math import ceil
 from math import sqrt
 from typing import Literal
 
-from scipy.optimize import brentq
-from scipy.stats import norm
-from scipy.stats import t
+from ..._distributions import _norm_ppf
+from ..._distributions import _t_ppf
+from ..._solver import _min_size
+from ...cache import _cached
+from ...diagnostics import _instrument
 
 
 def _precision_z(
@@ -32,9 +33,9 @@ def _precision_z(
 
     match interval_type:
         case "two-sided":
-            precision = norm.ppf(1 - alpha / 2) * se
+            precision = _norm_ppf(1 - alpha / 2) * se
         case "one-sided" | "lower" | "upper":
-            precision = norm.ppf(1 - alpha) * se
+            precision = _norm_ppf(1 - alpha) * se
 
     return float(precision)
 
@@ -53,9 +54,9 @@ def _precision_t(
 
     match interval_type:
         case "two-sided":
-            precision = t.ppf(1 - alpha / 2, df) * se
+            precision = _t_ppf(1 - alpha / 2, df) * se
         case "one-sided" | "lower" | "upper":
-            precision = t.ppf(1 - alpha, df) * se
+            precision = _t_ppf(1 - alpha, df) * se
 
     return float(precision)
 
@@ -75,6 +76,8 @@ def _precision(
             return _precision_t(std, size, conf_level, interval_type)
 
 
+@_instrument
+@_cached
 def solve_precision(
     *,
     std: float,
@@ -117,6 +120,8 @@ def solve_precision(
     return _precision(std, size, conf_level, interval_type, dist)
 
 
+@_instrument
+@_cached
 def solve_size(
     *,
     precision: float,
@@ -160,9 +165,11 @@ def solve_size(
     def func(size: float) -> float:
         return _precision(std, size, conf_level, interval_type, dist) - precision
 
-    return ceil(brentq(func, 1 + 1e-12, 1e12))
+    return _min_size(func, 1 + 1e-12, decreasing=True)
 
 
+@_instrument
+@_cached
 def solve_std(
     *,
     precision: float,
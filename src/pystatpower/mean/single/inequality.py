@@ -15,12 +15,23 @@ This module provides functions to calculate or estimate the following parameters
 
 import warnings
 
-from math import ceil
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
+
+from ..._constant import LOWER_LIMIT_OF_SAMPLE_SIZE
+from ..._math_utils import _all_scalar
+from ..._math_utils import _asarray
+from ..._solver import _as_sizes
+from ..._solver import _min_size
+from ..._solver import _min_sizes
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ._power import _power as _raw_power
+from ._power import _size_guess
 
 
 class _ParamsValidator:
@@ -68,30 +79,36 @@ class _ParamsValidator:
 
 
 def _power(
-    diff: float,
-    std: float,
-    size: float,
+    diff: ArrayLike,
+    std: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
+    alpha: ArrayLike,
     dist: Literal["z", "t"],
-) -> float:
+) -> float | np.ndarray:
     """Calculate the statistical power."""
     return _raw_power(diff, std, size, alternative, alpha, dist)
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
-    mean: float | None = None,
-    null_mean: float | None = None,
-    diff: float | None = None,
-    std: float,
-    size: int,
+    mean: ArrayLike | None = None,
+    null_mean: ArrayLike | None = None,
+    diff: ArrayLike | None = None,
+    std: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"] = "two-sided",
-    alpha: float = 0.05,
+    alpha: ArrayLike = 0.05,
     dist: Literal["z", "t"] = "t",
-) -> float:
+) -> float | np.ndarray:
     r"""Calculate the statistical power.
 
+    The numeric parameters `mean`, `null_mean`, `diff`, `std`, `size` and `alpha` accept either scalars or
+    array-likes. Array-likes are broadcast against each other following NumPy rules, and the power is evaluated for
+    all combinations in a single vectorized call.
+
     Args:
         mean:
             Mean under the alternative hypothesis.
@@ -127,11 +144,15 @@ def solve_power(
             - `'t'`: Student's t distribution.
 
     Returns:
-        The statistical power of the test.
+        The statistical power of the test. A float is returned if all numeric parameters are scalars, otherwise an
+        array with the broadcast shape of the parameters is returned.
 
     Raises:
         ValueError: The given set of parameters is insufficient to determine the mean difference.
     """
+    mean, null_mean, diff = _asarray(mean), _asarray(null_mean), _asarray(diff)
+    std, size, alpha = _asarray(std), _asarray(size), _asarray(alpha)
+
     pv = _ParamsValidator(mean=mean, null_mean=null_mean, diff=diff)
     pv.validate(target="diff")
     diff = pv.diff
@@ -139,19 +160,90 @@ def solve_power(
     return _power(diff, std, size, alternative, alpha, dist)
 
 
-def solve_size(
+def power_curve(
     *,
     mean: float | None = None,
     null_mean: float | None = None,
     diff: float | None = None,
     std: float,
+    sizes: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"] = "two-sided",
     alpha: float = 0.05,
-    power: float = 0.8,
     dist: Literal["z", "t"] = "t",
-) -> int:
+) -> np.ndarray:
+    r"""Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        mean:
+            Mean under the alternative hypothesis.
+
+            This parameter must be used in conjuction with `null_mean` to compute the `diff`, where `diff` = `mean` - `null_mean`.
+        null_mean:
+            Mean under the null hypothesis.
+
+            This parameter must be used in conjuction with `mean` to compute the `diff`, where `diff` = `mean` - `null_mean`.
+        diff:
+            Mean difference between the alternative hypothesis and the null hypothesis.
+
+            If this parameter is specified, both `mean` and `null_mean` are ignored.
+        std:
+            Standard deviation.
+        sizes:
+            Sample sizes at which the power is evaluated.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `'two-sided'`, the alternative hypothesis is $\\mu \\neq \\mu_0$
+            - If `alternative` is `'greater'`, the alternative hypothesis is $\\mu > \\mu_0$
+            - If `alternative` is `'less'`, the alternative hypothesis is $\\mu < \\mu_0$
+        alpha:
+            Significance level.
+
+            - If `alternative` is `'two-sided'`, `alpha` represents the two-sided significance level.
+            - If `alternative` is `'greater'` or `'less'`, `alpha` represents the one-sided significance level.
+        dist:
+            The distribution used for the test.
+
+            - `'z'`: Normal distribution.
+            - `'t'`: Student's t distribution.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+
+    Raises:
+        ValueError: The given set of parameters is insufficient to determine the mean difference.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    pv = _ParamsValidator(mean=mean, null_mean=null_mean, diff=diff)
+    pv.validate(target="diff")
+    diff = pv.diff
+
+    return np.asarray(_power(diff, std, sizes, alternative, alpha, dist), dtype=float)
+
+
+@_instrument
+@_cached
+def solve_size(
+    *,
+    mean: ArrayLike | None = None,
+    null_mean: ArrayLike | None = None,
+    diff: ArrayLike | None = None,
+    std: ArrayLike,
+    alternative: Literal["two-sided", "greater", "less"] = "two-sided",
+    alpha: ArrayLike = 0.05,
+    power: ArrayLike = 0.8,
+    dist: Literal["z", "t"] = "t",
+) -> int | np.ndarray:
     r"""Estimate the required sample size.
 
+    The numeric parameters `mean`, `null_mean`, `diff`, `std`, `alpha` and `power` accept either scalars or
+    array-likes. Array-likes are broadcast against each other following NumPy rules, and all sample sizes are solved
+    together by a vectorized root finder.
+
     Args:
         mean:
             Mean under the alternative hypothesis.
@@ -189,21 +281,38 @@ def solve_size(
             - `'t'`: Student's t distribution.
 
     Returns:
-        The required sample size.
+        The required sample size. An integer is returned if all numeric parameters are scalars, otherwise an integer
+        array with the broadcast shape of the parameters is returned. In an array, the elements without a solution are
+        `NaN` instead of failing the whole call, in which case the array is a float array.
 
     Raises:
         ValueError: The given set of parameters is insufficient to determine the mean difference.
     """
+    mean, null_mean, diff = _asarray(mean), _asarray(null_mean), _asarray(diff)
+    std, alpha, power = _asarray(std), _asarray(alpha), _asarray(power)
+
     pv = _ParamsValidator(mean=mean, null_mean=null_mean, diff=diff)
     pv.validate(target="diff")
     diff = pv.diff
 
+    if not _all_scalar(diff, std, alpha, power):
+
+        def vfunc(
+            size: np.ndarray, diff: np.ndarray, std: np.ndarray, alpha: np.ndarray, power: np.ndarray
+        ) -> np.ndarray:
+            return _power(diff, std, size, alternative, alpha, dist) - power
+
+        return _as_sizes(_min_sizes(vfunc, LOWER_LIMIT_OF_SAMPLE_SIZE, args=(diff, std, alpha, power)))
+
     def func(size: float) -> float:
         return _power(diff, std, size, alternative, alpha, dist) - power
 
-    return ceil(brentq(func, 1 + 0.1, 1e12))
+    guess = _size_guess(diff, std, alternative, alpha, power, dist)
+    return _min_size(func, LOWER_LIMIT_OF_SAMPLE_SIZE, guess=guess)
 
 
+@_instrument
+@_cached
 def solve_mean(
     *,
     null_mean: float,
@@ -275,11 +384,13 @@ def solve_mean(
 
     match direction:
         case "greater":
-            return float(brentq(func, null_mean, 1e9))
+            return float(_root(func, null_mean, step=std / np.sqrt(size)))
         case "less":
-            return float(brentq(func, -1e9, null_mean))
+            return float(_root(func, ub=null_mean, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_null_mean(
     *,
     mean: float,
@@ -351,11 +462,13 @@ def solve_null_mean(
 
     match direction:
         case "greater":
-            return float(brentq(func, mean, 1e9))
+            return float(_root(func, mean, step=std / np.sqrt(size)))
         case "less":
-            return float(brentq(func, -1e9, mean))
+            return float(_root(func, ub=mean, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_diff(
     *,
     std: float,
@@ -424,11 +537,13 @@ def solve_diff(
 
     match direction:
         case "greater":
-            return float(brentq(func, 0, 1e9))
+            return float(_root(func, 0, step=std / np.sqrt(size)))
         case "less":
-            return float(brentq(func, -1e9, 0))
+            return float(_root(func, ub=0, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_std(
     *,
     mean: float | None = None,
@@ -491,4 +606,4 @@ def solve_std(
     def func(std: float) -> float:
         return _power(diff, std, size, alternative, alpha, dist) - power
 
-    return float(brentq(func, 1e-6, 1e12))
+    return float(_root(func, 0, start=abs(diff) or 1.0))
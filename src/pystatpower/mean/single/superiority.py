@@ -18,12 +18,19 @@ This module provides functions to calculate or estimate the following parameters
 
 import warnings
 
-from math import ceil
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
+
+from ..._constant import LOWER_LIMIT_OF_SAMPLE_SIZE
+from ..._solver import _min_size
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ._power import _power
+from ._power import _size_guess
 
 
 def _margin(margin: float, alternative: Literal["greater", "less"]) -> float:
@@ -137,6 +144,8 @@ class _ParamsValidator:
         )
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
     mean: float | None = None,
@@ -244,6 +253,120 @@ def solve_power(
     return _power(offset, std, size, alternative, alpha, dist)
 
 
+def power_curve(
+    *,
+    mean: float | None = None,
+    null_mean: float | None = None,
+    margin: float | None = None,
+    diff: float | None = None,
+    superiority_mean: float | None = None,
+    offset: float | None = None,
+    std: float,
+    sizes: ArrayLike,
+    alternative: Literal["greater", "less"],
+    alpha: float = 0.025,
+    dist: Literal["z", "t"] = "t",
+) -> np.ndarray:
+    r"""Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        mean:
+            Mean under the alternative hypothesis.
+
+            This parameter must be used together with `superiority_mean`, or alternatively, in conjunction with `null_mean` and `margin` to calculate the `offset`.
+
+            - If you specify this parameter along with `superiority_mean`, the `offset` is calculated as `mean` - `superiority_mean`.
+            - If you specify this parameter along with `null_mean` and `margin`, the `offset` is calculated as `mean` - `null_mean` - `margin`.
+        null_mean:
+            Mean under the null hypothesis.
+
+            This parameter must be used together with `mean` and `margin` to calculate the `offset`.
+
+            - If you specify this parameter along with `mean` and `margin`, the `offset` is calculated as `mean` - `null_mean` - `margin`.
+        margin:
+            The superiority margin.
+
+            This parameter must be used together with `diff`, or alternatively, in conjunction with `mean` and `null_mean` to calculate the `offset`.
+
+            - If you specify this parameter along with `diff`, the `offset` is calculated as `diff` - `margin`.
+            - If you specify this parameter along with `mean` and `null_mean`, the `offset` is calculated as `mean` - `null_mean` - `margin`.
+
+            !!! tip
+
+                Regardless of whether `alternative` is specified as `'greater'` or `'less'`, you can always specify this
+                parameter as either positive or negative, as you prefer. Internally, the value of `margin` is converted
+                before actual calculation takes place.
+
+                - If `alternative` is `'greater'`, the internally used margin is `abs(margin)`.
+                - If `alternative` is `'less'`, the internally used margin is `-abs(margin)`.
+        diff:
+            Difference between the mean under the alternative hypothesis and the mean under the null hypothesis.
+
+            This parameter must be used together with `margin` to calculate the `offset`.
+
+            - If you specify this parameter along with `margin`, the `offset` if calculated as `diff` - `margin`.
+        superiority_mean:
+            The superiority mean.
+
+            - If `alternative` is `'greater'`, the superiority mean is defined as the smallest mean that exceeds the
+              null hypothesis mean and is considered superior.
+            - If `alternative` is `'less'`, the superiority mean is defined as the largest mean that falls below the
+              null hypothesis mean and is considered superior.
+
+            This parameter must be used together with `mean` to calculate the `offset`.
+
+            - If you specify this parameter along with `mean`, the `offset` if calculated as `mean` - `superiority_mean`.
+        offset:
+            The offset, defined as the difference between the mean under the alternative hypothesis and the superiority mean.
+
+            If you specify this parameter, all of `mean`, `null_mean`, `margin`, `diff`, `superiority_mean` are ignored.
+        std:
+            Standard deviation.
+        sizes:
+            Sample sizes at which the power is evaluated.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `'greater'`, the alternative hypothesis is $\\mu - \\mu_0 > \\delta \\ (\\delta > 0)$
+            - If `alternative` is `'less'`, the alternative hypothesis is $\\mu - \\mu_0 < \\delta \\ (\\delta < 0)$
+        alpha:
+            Significance level.
+
+            The superiority test is a one-sided test, with a significance level of 0.025 being commonly used.
+        dist:
+            The distribution used for the test.
+
+            - `'z'`: Normal distribution.
+            - `'t'`: Student's t distribution.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+
+    Raises:
+        ValueError: The given set of parameters is insufficient to determine the offset.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    pv = _ParamsValidator(
+        mean=mean,
+        null_mean=null_mean,
+        margin=margin,
+        diff=diff,
+        superiority_mean=superiority_mean,
+        offset=offset,
+        alternative=alternative,
+    )
+    pv.validate(target="offset")
+    offset = pv.offset
+
+    return np.asarray(_power(offset, std, sizes, alternative, alpha, dist), dtype=float)
+
+
+@_instrument
+@_cached
 def solve_size(
     *,
     mean: float | None = None,
@@ -353,9 +476,12 @@ def solve_size(
     def func(size: float) -> float:
         return _power(offset, std, size, alternative, alpha, dist) - power
 
-    return ceil(brentq(func, 1 + 0.1, 1e12))
+    guess = _size_guess(offset, std, alternative, alpha, power, dist)
+    return _min_size(func, LOWER_LIMIT_OF_SAMPLE_SIZE, guess=guess)
 
 
+@_instrument
+@_cached
 def solve_mean(
     *,
     null_mean: float | None = None,
@@ -441,11 +567,13 @@ def solve_mean(
 
     match alternative:
         case "greater":
-            return float(brentq(func, superiority_mean, 1e6))
+            return float(_root(func, superiority_mean, step=std / np.sqrt(size)))
         case "less":
-            return float(brentq(func, -1e6, superiority_mean))
+            return float(_root(func, ub=superiority_mean, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_null_mean(
     *,
     mean: float,
@@ -506,11 +634,13 @@ def solve_null_mean(
 
     match alternative:
         case "greater":
-            return float(brentq(func, -1e6, mean - margin))
+            return float(_root(func, ub=mean - margin, step=std / np.sqrt(size)))
         case "less":
-            return float(brentq(func, mean - margin, 1e6))
+            return float(_root(func, mean - margin, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_margin(
     *,
     mean: float | None = None,
@@ -583,11 +713,13 @@ def solve_margin(
 
     match alternative:
         case "greater":
-            return float(brentq(func, 0, diff))
+            return float(_root(func, 0, diff))
         case "less":
-            return float(brentq(func, diff, 0))
+            return float(_root(func, diff, 0))
 
 
+@_instrument
+@_cached
 def solve_diff(
     *,
     margin: float,
@@ -645,11 +777,13 @@ def solve_diff(
 
     match alternative:
         case "greater":
-            return float(brentq(func, margin, 1e8))
+            return float(_root(func, margin, step=std / np.sqrt(size)))
         case "less":
-            return float(brentq(func, -1e8, margin))
+            return float(_root(func, ub=margin, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_superiority_mean(
     *,
     mean: float,
@@ -702,11 +836,13 @@ def solve_superiority_mean(
 
     match alternative:
         case "greater":
-            return float(brentq(func, -1e9, mean))
+            return float(_root(func, ub=mean, step=std / np.sqrt(size)))
         case "less":
-            return float(brentq(func, mean, 1e9))
+            return float(_root(func, mean, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_offset(
     *,
     std: float,
@@ -751,9 +887,11 @@ def solve_offset(
     def func(offset: float) -> float:
         return _power(offset, std, size, alternative, alpha, dist) - power
 
-    return float(brentq(func, -1e9, 1e9))
+    return float(_root(func, step=std / np.sqrt(size)))
 
 
+@_instrument
+@_cached
 def solve_std(
     *,
     mean: float | None = None,
@@ -863,4 +1001,4 @@ def solve_std(
     def func(std: float) -> float:
         return _power(offset, std, size, alternative, alpha, dist) - power
 
-    return float(brentq(func, 1e-6, 1e12))
+    return float(_root(func, 0, start=abs(offset) or 1.0))
@@ -7,3 +7,16 @@ This package provides the following modules:
 
 - observe_at_least_one_event: Models that have observed at least one event
 """
+
+from typing import TYPE_CHECKING
+
+from .._lazy import _attach
+
+if TYPE_CHECKING:
+    from ..misc import observe_at_least_one_event
+
+__all__ = [
+    "observe_at_least_one_event",
+]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
@@ -9,24 +9,30 @@ This module provides functions to calculate or estimate the following parameters
 - sample size
 """
 
-from math import ceil
-from math import exp
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
 
-def _power_binom(proportion: float, size: float) -> float:
+from .._math_utils import _scalar_or_array
+from .._solver import _min_size
+from .._solver import _root
+from ..cache import _cached
+from ..diagnostics import _instrument
+
+
+def _power_binom(proportion: ArrayLike, size: ArrayLike) -> float | np.ndarray:
     """Calculate the power to observe at least one event, based on the binomial distribution."""
-    return 1 - (1 - proportion) ** size
+    return _scalar_or_array(1 - (1 - proportion) ** size)
 
 
-def _power_poisson(proportion: float, size: float) -> float:
+def _power_poisson(proportion: ArrayLike, size: ArrayLike) -> float | np.ndarray:
     """Calculate the power to observe at least one event, based on the Poisson distribution."""
-    return 1 - exp(-size * proportion)
+    return _scalar_or_array(1 - np.exp(-size * proportion))
 
 
-def _power(proportion: float, size: float, dist: Literal["bin", "poisson"]) -> float:
+def _power(proportion: ArrayLike, size: ArrayLike, dist: Literal["bin", "poisson"]) -> float | np.ndarray:
     match dist:
         case "bin":
             return _power_binom(proportion, size)
@@ -34,6 +40,8 @@ def _power(proportion: float, size: float, dist: Literal["bin", "poisson"]) -> f
             return _power_poisson(proportion, size)
 
 
+@_instrument
+@_cached
 def solve_power(*, proportion: float, size: int, dist: Literal["bin", "poisson"] = "bin") -> float:
     """Calculate the detection power.
 
@@ -54,6 +62,33 @@ def solve_power(*, proportion: float, size: int, dist: Literal["bin", "poisson"]
     return _power(proportion, size, dist)
 
 
+def power_curve(*, proportion: float, sizes: ArrayLike, dist: Literal["bin", "poisson"] = "bin") -> np.ndarray:
+    """Calculate the detection power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        proportion:
+            Event proportion.
+        sizes:
+            Sample sizes at which the power is evaluated.
+        dist:
+            The distribution of the number of events that occurred.
+
+            - `'bin'`: binomial distribution
+            - `'poisson'`: Poisson distribution
+
+    Returns:
+        The power to observe at least one event at each sample size, with the same shape as `sizes`.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    return np.asarray(_power(proportion, sizes, dist), dtype=float)
+
+
+@_instrument
+@_cached
 def solve_size(*, proportion: float, power: float = 0.95, dist: Literal["bin", "poisson"] = "bin") -> int:
     """Estimate the required sample size.
 
@@ -77,9 +112,11 @@ def solve_size(*, proportion: float, power: float = 0.95, dist: Literal["bin", "
     def func(size: float) -> float:
         return _power(proportion, size, dist) - power
 
-    return ceil(brentq(func, 1e-12, 1e12))
+    return _min_size(func, 1e-12)
 
 
+@_instrument
+@_cached
 def solve_proportion(*, size: int, power: float = 0.95, dist: Literal["bin", "poisson"] = "bin") -> float:
     """Estimate the required event proportion.
 
@@ -103,4 +140,4 @@ def solve_proportion(*, size: int, power: float = 0.95, dist: Literal["bin", "po
     def func(proportion: float) -> float:
         return _power(proportion, size, dist) - power
 
-    return float(brentq(func, 0, 1))
+    return float(_root(func, 0, 1))
@@ -10,12 +10,20 @@ This package provides the following subpackages:
 - paired: Power analysis for two paired proportions.
 """
 
-from ..proportion import independent
-from ..proportion import paired
-from ..proportion import single
+from typing import TYPE_CHECKING
+
+from .._lazy import _attach
+
+if TYPE_CHECKING:
+    from ..proportion import independent
+    from ..proportion import paired
+    from ..proportion import single
+
 
 __all__ = [
     "single",
     "independent",
     "paired",
 ]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
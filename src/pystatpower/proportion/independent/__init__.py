@@ -11,10 +11,16 @@ This package provides the following modules:
 - superiority: Superiority tests for two independent proportions.
 """
 
-from ...proportion.independent import ci
-from ...proportion.independent import inequality
-from ...proportion.independent import noninferiority
-from ...proportion.independent import superiority
+from typing import TYPE_CHECKING
+
+from ..._lazy import _attach
+
+if TYPE_CHECKING:
+    from ...proportion.independent import ci
+    from ...proportion.independent import inequality
+    from ...proportion.independent import noninferiority
+    from ...proportion.independent import superiority
+
 
 __all__ = [
     "ci",
@@ -22,3 +28,5 @@ __all__ = [
     "noninferiority",
     "superiority",
 ]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
@@ -1,57 +1,69 @@
 # Copyright (C) 2024-present The Package Authors
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from math import sqrt
+from functools import lru_cache
 from typing import Literal
 
-from scipy.stats import norm
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from ..._distributions import _binom_pmfs
+from ..._distributions import _norm_cdf
+from ..._distributions import _norm_ppf
+from ..._math_utils import _scalar_or_array
+
+_EXACT_GRID = np.linspace(0, 1, 257)[1:-1]
+"""The common proportions at which the size of a rejection region is evaluated first."""
+
+_EXACT_CACHE_MAXSIZE = 128
 
 
 def _power_pooled(
-    treatment_proportion: float,
-    reference_proportion: float,
-    proportion_threshold: float,
-    treatment_size: float,
-    reference_size: float,
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using z-test with pooled variance."""
     effect = treatment_proportion - proportion_threshold
 
     treatment_var = treatment_proportion * (1 - treatment_proportion) / treatment_size
     reference_var = reference_proportion * (1 - reference_proportion) / reference_size
-    se = sqrt(treatment_var + reference_var)
+    se = np.sqrt(treatment_var + reference_var)
 
     pooled_proportion = (treatment_size * treatment_proportion + reference_size * reference_proportion) / (
         treatment_size + reference_size
     )
-    pooled_se = sqrt(pooled_proportion * (1 - pooled_proportion) * (1 / treatment_size + 1 / reference_size))
+    pooled_se = np.sqrt(pooled_proportion * (1 - pooled_proportion) * (1 / treatment_size + 1 / reference_size))
 
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf((norm.ppf(1 - alpha / 2) * pooled_se - effect) / se)
-                + norm.cdf((norm.ppf(alpha / 2) * pooled_se - effect) / se)
+                - _norm_cdf((_norm_ppf(1 - alpha / 2) * pooled_se - effect) / se)
+                + _norm_cdf((_norm_ppf(alpha / 2) * pooled_se - effect) / se)
             )
         case "greater":
-            power = 1 - norm.cdf((norm.ppf(1 - alpha) * pooled_se - effect) / se)
+            power = 1 - _norm_cdf((_norm_ppf(1 - alpha) * pooled_se - effect) / se)
         case "less":
-            power = norm.cdf((norm.ppf(alpha) * pooled_se - effect) / se)
+            power = _norm_cdf((_norm_ppf(alpha) * pooled_se - effect) / se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_pooled_cc(
-    treatment_proportion: float,
-    reference_proportion: float,
-    proportion_threshold: float,
-    treatment_size: float,
-    reference_size: float,
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using z-test with pooled variance and continuity correction."""
     effect = treatment_proportion - proportion_threshold
 
@@ -59,64 +71,66 @@ def _power_pooled_cc(
 
     treatment_var = treatment_proportion * (1 - treatment_proportion) / treatment_size
     reference_var = reference_proportion * (1 - reference_proportion) / reference_size
-    se = sqrt(treatment_var + reference_var)
+    se = np.sqrt(treatment_var + reference_var)
 
     pooled_proportion = (treatment_size * treatment_proportion + reference_size * reference_proportion) / (
         treatment_size + reference_size
     )
-    pooled_se = sqrt(pooled_proportion * (1 - pooled_proportion) * (1 / treatment_size + 1 / reference_size))
+    pooled_se = np.sqrt(pooled_proportion * (1 - pooled_proportion) * (1 / treatment_size + 1 / reference_size))
 
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf((norm.ppf(1 - alpha / 2) * pooled_se - (effect - c)) / se)
-                + norm.cdf((norm.ppf(alpha / 2) * pooled_se - (effect + c)) / se)
+                - _norm_cdf((_norm_ppf(1 - alpha / 2) * pooled_se - (effect - c)) / se)
+                + _norm_cdf((_norm_ppf(alpha / 2) * pooled_se - (effect + c)) / se)
             )
         case "greater":
-            power = 1 - norm.cdf((norm.ppf(1 - alpha) * pooled_se - (effect - c)) / se)
+            power = 1 - _norm_cdf((_norm_ppf(1 - alpha) * pooled_se - (effect - c)) / se)
         case "less":
-            power = norm.cdf((norm.ppf(alpha) * pooled_se - (effect + c)) / se)
+            power = _norm_cdf((_norm_ppf(alpha) * pooled_se - (effect + c)) / se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_unpooled(
-    treatment_proportion: float,
-    reference_proportion: float,
-    proportion_threshold: float,
-    treatment_size: float,
-    reference_size: float,
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using z-tes with unpooled variance."""
     effect = treatment_proportion - proportion_threshold
 
     treatment_var = treatment_proportion * (1 - treatment_proportion) / treatment_size
     reference_var = reference_proportion * (1 - reference_proportion) / reference_size
-    se = sqrt(treatment_var + reference_var)
+    se = np.sqrt(treatment_var + reference_var)
 
     match alternative:
         case "two-sided":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha / 2) - effect / se) + norm.cdf(norm.ppf(alpha / 2) - effect / se)
+            power = (
+                1 - _norm_cdf(_norm_ppf(1 - alpha / 2) - effect / se) + _norm_cdf(_norm_ppf(alpha / 2) - effect / se)
+            )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - effect / se)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - effect / se)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - effect / se)
+            power = _norm_cdf(_norm_ppf(alpha) - effect / se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_unpooled_cc(
-    treatment_proportion: float,
-    reference_proportion: float,
-    proportion_threshold: float,
-    treatment_size: float,
-    reference_size: float,
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using unpooled variance and continuity correction."""
     effect = treatment_proportion - proportion_threshold
 
@@ -124,36 +138,176 @@ def _power_unpooled_cc(
 
     treatment_var = treatment_proportion * (1 - treatment_proportion) / treatment_size
     reference_var = reference_proportion * (1 - reference_proportion) / reference_size
-    se = sqrt(treatment_var + reference_var)
+    se = np.sqrt(treatment_var + reference_var)
 
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf(norm.ppf(1 - alpha / 2) - (effect - c) / se)
-                + norm.cdf(norm.ppf(alpha / 2) - (effect + c) / se)
+                - _norm_cdf(_norm_ppf(1 - alpha / 2) - (effect - c) / se)
+                + _norm_cdf(_norm_ppf(alpha / 2) - (effect + c) / se)
             )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - (effect - c) / se)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - (effect - c) / se)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - (effect + c) / se)
+            power = _norm_cdf(_norm_ppf(alpha) - (effect + c) / se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
-def _power(
-    treatment_proportion: float,
-    reference_proportion: float,
-    proportion_threshold: float,
-    treatment_size: float,
-    reference_size: float,
+def _exact_statistic(
+    treatment_size: int, reference_size: int, alternative: Literal["two-sided", "greater", "less"]
+) -> np.ndarray:
+    """Calculate the z statistic with pooled variance of every outcome, oriented so that large values reject."""
+    x1 = np.arange(treatment_size + 1)[:, np.newaxis]
+    x2 = np.arange(reference_size + 1)[np.newaxis, :]
+    pooled_proportion = (x1 + x2) / (treatment_size + reference_size)
+    pooled_se = np.sqrt(pooled_proportion * (1 - pooled_proportion) * (1 / treatment_size + 1 / reference_size))
+
+    # The outcomes without any or with only events carry no evidence, and their statistic is set to zero.
+    diff = x1 / treatment_size - x2 / reference_size
+    z = np.divide(diff, pooled_se, out=np.zeros_like(pooled_se), where=pooled_se > 0)
+    match alternative:
+        case "two-sided":
+            z = np.abs(z)
+        case "less":
+            z = -z
+
+    # Rounding merges the ties broken by floating point errors, e.g. between outcomes mirrored by symmetry.
+    return np.round(z, 12)
+
+
+def _exact_size(region: np.ndarray, proportion: np.ndarray) -> np.ndarray:
+    """Calculate the probability of a rejection region at common proportions of both groups."""
+    treatment_pmf = _binom_pmfs(region.shape[0] - 1, proportion)
+    reference_pmf = _binom_pmfs(region.shape[1] - 1, proportion)
+    return np.sum((treatment_pmf @ region) * reference_pmf, axis=1)
+
+
+@lru_cache(maxsize=_EXACT_CACHE_MAXSIZE)
+def _exact_region(
+    treatment_size: int,
+    reference_size: int,
     alternative: Literal["two-sided", "greater", "less"],
     alpha: float,
-    method: Literal["z-pooled", "z-unpooled"],
+) -> np.ndarray:
+    """Calculate the rejection region of the exact unconditional test.
+
+    The test rejects the null hypothesis for the outcomes whose z statistic exceeds a critical value, chosen as the
+    smallest one for which the probability of the region stays below `alpha` at every common proportion of both groups
+    (Suissa and Shuster, 1985). The regions of decreasing critical values are nested, so their size increases, and the
+    critical value is found by a bisection over the distinct values of the statistic.
+
+    The size of a region is maximized over a grid of proportions, refined around its largest values. The proportions
+    at which the previous candidates exceeded `alpha` are tried first, so that most candidates are rejected after a
+    few evaluations instead of the whole grid.
+
+    The region only depends on the sample sizes, the alternative and the significance level, so it is computed once
+    and kept in an LRU cache, shared by the power evaluations of all proportions and by the sample size searches.
+
+    Returns:
+        A read-only boolean matrix, whose element `[x1, x2]` tells whether the outcome of `x1` events in the treatment
+        group and `x2` events in the reference group rejects the null hypothesis.
+    """
+    statistic = _exact_statistic(treatment_size, reference_size, alternative)
+    levels = np.unique(statistic[statistic > 0])[::-1]
+    grid_pmfs = _binom_pmfs(treatment_size, _EXACT_GRID), _binom_pmfs(reference_size, _EXACT_GRID)
+    step = _EXACT_GRID[1] - _EXACT_GRID[0]
+    hot: list[float] = []
+
+    def admissible(count: int) -> bool:
+        region = (statistic >= levels[count - 1]).astype(float)
+        if hot and np.max(_exact_size(region, np.array(hot))) > alpha:
+            return False
+
+        sizes = np.sum((grid_pmfs[0] @ region) * grid_pmfs[1], axis=1)
+        fine = np.concatenate([np.linspace(p - step, p + step, 33) for p in _EXACT_GRID[np.argsort(sizes)[-3:]]])
+        fine = np.clip(fine, step / 64, 1 - step / 64)
+        fine_sizes = _exact_size(region, fine)
+        if np.max(fine_sizes) > alpha:
+            hot[:] = [*hot[-3:], float(fine[np.argmax(fine_sizes)])]
+            return False
+        return True
+
+    # The largest number of levels of the statistic, from the top, whose region has a size of at most `alpha`.
+    lo, hi = 0, levels.size
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if admissible(mid):
+            lo = mid
+        else:
+            hi = mid - 1
+
+    region = statistic >= levels[lo - 1] if lo > 0 else np.zeros_like(statistic, dtype=bool)
+    region.flags.writeable = False
+    return region
+
+
+def _power_exact(
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
+    alternative: Literal["two-sided", "greater", "less"],
+    alpha: ArrayLike,
+) -> float | np.ndarray:
+    """Calculate the statistical power, using the exact unconditional test.
+
+    The power is the probability of the rejection region under the outer product of the binomial distributions of both
+    groups. The parameters sharing the sample sizes and the significance level share one rejection region.
+
+    Raises:
+        ValueError: If a sample size is not a positive integer.
+    """
+    treatment_proportion, reference_proportion, treatment_size, reference_size, alpha = np.broadcast_arrays(
+        *(
+            np.asarray(x, dtype=float)
+            for x in (treatment_proportion, reference_proportion, treatment_size, reference_size, alpha)
+        )
+    )
+    sizes = np.stack([treatment_size, reference_size])
+    if np.any((sizes < 1) | (sizes != np.round(sizes))):
+        msg = "The exact test requires positive integer sample sizes."
+        raise ValueError(msg)
+
+    groups: dict[tuple[int, int, float], list[int]] = {}
+    for i, key in enumerate(zip(treatment_size.flat, reference_size.flat, alpha.flat, strict=True)):
+        groups.setdefault((int(key[0]), int(key[1]), float(key[2])), []).append(i)
+
+    power = np.empty(treatment_size.shape)
+    for (n1, n2, a), indices in groups.items():
+        region = _exact_region(n1, n2, alternative, a).astype(float)
+        treatment_pmf = _binom_pmfs(n1, treatment_proportion.flat[indices])
+        reference_pmf = _binom_pmfs(n2, reference_proportion.flat[indices])
+        power.flat[indices] = np.sum((treatment_pmf @ region) * reference_pmf, axis=1)
+
+    return _scalar_or_array(power)
+
+
+def _power(
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
+    alternative: Literal["two-sided", "greater", "less"],
+    alpha: ArrayLike,
+    method: Literal["z-pooled", "z-unpooled", "exact"],
     continuity_correction: bool,
-) -> float:
-    """Calculate the statistical power."""
+) -> float | np.ndarray:
+    """Calculate the statistical power.
+
+    Raises:
+        ValueError: If `method` is `'exact'` and `proportion_threshold` differs from `reference_proportion`.
+    """
     match method:
+        case "exact":
+            if np.any(np.asarray(proportion_threshold) != np.asarray(reference_proportion)):
+                msg = "The exact test only supports the inequality test, without a margin."
+                raise ValueError(msg)
+            return _power_exact(
+                treatment_proportion, reference_proportion, treatment_size, reference_size, alternative, alpha
+            )
         case "z-pooled":
             if continuity_correction:
                 return _power_pooled_cc(
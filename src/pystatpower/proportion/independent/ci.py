@@ -11,6 +11,7 @@ This module provides functions to calculate or estimate the following parameters
 - proportion for the reference group
 """
 
+from collections.abc import Callable
 from math import acos
 from math import ceil
 from math import copysign
@@ -21,10 +22,13 @@ from math import sqrt
 from typing import Literal
 
 from scipy.optimize import OptimizeResult
-from scipy.optimize import brentq
 from scipy.optimize import minimize_scalar
-from scipy.stats import norm
 
+from ..._distributions import _norm_ppf
+from ..._solver import _min_size
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ...exceptions import SolutionNotFoundError
 
 
@@ -46,16 +50,16 @@ def _distance_chisq(
 
     match interval_type:
         case "two-sided":
-            z = norm.ppf(1 - alpha / 2)
+            z = _norm_ppf(1 - alpha / 2)
             L = diff - z * sd
             U = diff + z * sd
             distance = min(U, 1) - max(L, -1)
         case "lower":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             L = diff - z * sd
             distance = diff - max(L, -1)
         case "upper":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             U = diff + z * sd
             distance = min(U, 1) - diff
 
@@ -81,16 +85,16 @@ def _distance_chisq_cc(
 
     match interval_type:
         case "two-sided":
-            z = norm.ppf(1 - alpha / 2)
+            z = _norm_ppf(1 - alpha / 2)
             L = diff - z * sd - c
             U = diff + z * sd + c
             distance = min(U, 1) - max(L, -1)
         case "lower":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             L = diff - z * sd - c
             distance = diff - max(L, -1)
         case "upper":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             U = diff + z * sd + c
             distance = min(U, 1) - diff
 
@@ -111,7 +115,7 @@ def _distance_wilson(
 
     def _wilson_ci(proportion: float, size: float, alpha: float) -> tuple[float, float]:
         """Internal function to calculate Wilson confidence interval."""
-        z = norm.ppf(1 - alpha)
+        z = _norm_ppf(1 - alpha)
 
         a = 2 * size * proportion + z**2
         b = z**2 + 4 * size * proportion * (1 - proportion)
@@ -175,7 +179,7 @@ def _distance_wilson_cc(
 
     def _wilson_cc_ci(proportion: float, size: float, alpha: float) -> tuple[float, float]:
         """Internal function to calculate Wilson confidence interval with continuity correction."""
-        z = norm.ppf(1 - alpha)
+        z = _norm_ppf(1 - alpha)
 
         a = 2 * size * proportion + z**2
         b = z**2 + 4 * size * proportion * (1 - proportion)
@@ -225,57 +229,130 @@ def _distance_wilson_cc(
     return float(distance)
 
 
-def _distance_farrington_manning(
+def _score_rmle(delta: float, treatment_size: float, reference_size: float, x21: float, m_1: float) -> float:
+    """Calculate the restricted maximum likelihood estimate of the reference proportion given the difference `delta`.
+
+    The estimate is the root of a cubic within the unit interval, which is computed in closed form.
+    """
+    L3 = treatment_size + reference_size
+    L2 = (L3 + reference_size) * delta - L3 - m_1
+    L1 = (reference_size * delta - L3 - 2 * x21) * delta + m_1
+    L0 = x21 * delta * (1 - delta)
+    C = L2**3 / (27 * L3**3) - L1 * L2 / (6 * L3**2) + L0 / (2 * L3)
+    if isclose(C, 0, abs_tol=1e-12):
+        return -L2 / (3 * L3)
+
+    B = copysign(1, C) * sqrt(L2**2 / (9 * L3**2) - L1 / (3 * L3))
+    A = 1 / 3 * (pi + acos(min(max(C / B**3, -1), 1)))
+    return 2 * B * cos(A) - L2 / (3 * L3)
+
+
+def _score_quantiles(conf_level: float, interval_type: Literal["two-sided", "lower", "upper"]) -> tuple[float, ...]:
+    """Return the critical values of the score statistic, positive for a lower limit and negative for an upper limit."""
+    alpha = 1 - conf_level
+    match interval_type:
+        case "two-sided":
+            return _norm_ppf(1 - alpha / 2), _norm_ppf(alpha / 2)
+        case "lower":
+            return (_norm_ppf(1 - alpha),)
+        case "upper":
+            return (_norm_ppf(alpha),)
+
+
+def _score_limits(
     treatment_proportion: float,
     reference_proportion: float,
     treatment_size: float,
     reference_size: float,
-    conf_level: float,
-    interval_type: Literal["two-sided", "lower", "upper"],
-) -> float:
-    """Calculate the confidence interval width or the distance from the proportion difference to the confidence limit, using Farrington and Manning's score method."""
-    alpha = 1 - conf_level
-    diff = treatment_proportion - reference_proportion
+    quantiles: tuple[float, ...],
+    *,
+    corrected: bool,
+    guess: tuple[float, ...] | None = None,
+) -> tuple[float, ...]:
+    """Calculate the confidence limits of the score methods, at which the score statistic equals the `quantiles`.
+
+    If `guess` holds the limits for other sample sizes, the distance from the proportion difference to each limit is
+    extrapolated from them, as it varies about as the standard error, and the limit is first searched for within a
+    narrow bracket around the extrapolation. The whole range is searched if the bracket misses the limit.
 
-    x11 = treatment_size * treatment_proportion
+    Args:
+        treatment_proportion:
+            Proportion in the treatment group.
+        reference_proportion:
+            Proportion in the reference group.
+        treatment_size:
+            Sample size of the treatment group.
+        reference_size:
+            Sample size of the reference group.
+        quantiles:
+            The critical values, positive for a lower limit and negative for an upper limit.
+        corrected:
+            Whether to apply the variance correction `N / (N - 1)` of Miettinen and Nurminen.
+        guess:
+            The limits for other sample sizes, followed by `1 / treatment_size + 1 / reference_size` for those sizes.
+
+    Returns:
+        The confidence limits in the order of `quantiles`, followed by `1 / treatment_size + 1 / reference_size`.
+    """
+    diff = treatment_proportion - reference_proportion
     x21 = reference_size * reference_proportion
-    m_1 = x11 + x21
+    m_1 = treatment_size * treatment_proportion + x21
     N = treatment_size + reference_size
+    factor = N / (N - 1) if corrected else 1
+    scale = 1 / treatment_size + 1 / reference_size
 
-    def func(delta: float) -> float:
-        L3 = N
-        L2 = (N + reference_size) * delta - N - m_1
-        L1 = (reference_size * delta - N - 2 * x21) * delta + m_1
-        L0 = x21 * delta * (1 - delta)
-        C = L2**3 / (27 * L3**3) - L1 * L2 / (6 * L3**2) + L0 / (2 * L3)
-        if isclose(C, 0, abs_tol=1e-12):
-            p2 = -L2 / (3 * L3)
-        else:
-            B = copysign(1, C) * sqrt(L2**2 / (9 * L3**2) - L1 / (3 * L3))
-            A = 1 / 3 * (pi + acos(C / B**3))
-            p2 = 2 * B * cos(A) - L2 / (3 * L3)
-
+    def statistic(delta: float) -> float:
+        p2 = _score_rmle(delta, treatment_size, reference_size, x21, m_1)
         p1 = p2 + delta
-
-        variance = p1 * (1 - p1) / treatment_size + p2 * (1 - p2) / reference_size
-
+        variance = (p1 * (1 - p1) / treatment_size + p2 * (1 - p2) / reference_size) * factor
         return (diff - delta) / sqrt(variance)
 
     eps = 1e-12
+    limits = []
+    for i, quantile in enumerate(quantiles):
+        lb, ub = (-1 + eps, diff) if quantile > 0 else (diff, 1 - eps)
+
+        def func(delta: float, quantile: float = quantile) -> float:
+            return statistic(delta) - quantile
+
+        if guess is not None:
+            estimate = diff + (guess[i] - diff) * sqrt(scale / guess[-1])
+            a = max(estimate - 0.02 * abs(estimate - diff), lb)
+            b = min(estimate + 0.02 * abs(estimate - diff), ub)
+            if a < b and func(a) * func(b) <= 0:
+                lb, ub = a, b
+        limits.append(_root(func, lb, ub))
+
+    return *limits, scale
 
+
+def _score_distance(
+    limits: tuple[float, ...], diff: float, interval_type: Literal["two-sided", "lower", "upper"]
+) -> float:
+    """Calculate the confidence interval width or the distance from the proportion difference to the confidence limit."""
     match interval_type:
         case "two-sided":
-            L = brentq(lambda delta: func(delta) - norm.ppf(1 - alpha / 2), -1 + eps, diff)
-            U = brentq(lambda delta: func(delta) - norm.ppf(alpha / 2), diff, 1 - eps)
-            distance = U - L
+            return float(limits[1] - limits[0])
         case "lower":
-            L = brentq(lambda delta: func(delta) - norm.ppf(1 - alpha), -1 + eps, diff)
-            distance = diff - L
+            return float(diff - limits[0])
         case "upper":
-            U = brentq(lambda delta: func(delta) - norm.ppf(alpha), diff, 1 - eps)
-            distance = U - diff
+            return float(limits[0] - diff)
 
-    return float(distance)
+
+def _distance_farrington_manning(
+    treatment_proportion: float,
+    reference_proportion: float,
+    treatment_size: float,
+    reference_size: float,
+    conf_level: float,
+    interval_type: Literal["two-sided", "lower", "upper"],
+) -> float:
+    """Calculate the confidence interval width or the distance from the proportion difference to the confidence limit, using Farrington and Manning's score method."""
+    quantiles = _score_quantiles(conf_level, interval_type)
+    limits = _score_limits(
+        treatment_proportion, reference_proportion, treatment_size, reference_size, quantiles, corrected=False
+    )
+    return _score_distance(limits, treatment_proportion - reference_proportion, interval_type)
 
 
 def _distance_miettinen_nurminen(
@@ -287,48 +364,11 @@ def _distance_miettinen_nurminen(
     interval_type: Literal["two-sided", "lower", "upper"],
 ) -> float:
     """Calculate the confidence interval width or the distance from the proportion difference to the confidence limit, using Miettinen and Nurminen's score method."""
-    alpha = 1 - conf_level
-    diff = treatment_proportion - reference_proportion
-
-    x11 = treatment_size * treatment_proportion
-    x21 = reference_size * reference_proportion
-    m_1 = x11 + x21
-    N = treatment_size + reference_size
-
-    def func(delta: float) -> float:
-        L3 = N
-        L2 = (N + reference_size) * delta - N - m_1
-        L1 = (reference_size * delta - N - 2 * x21) * delta + m_1
-        L0 = x21 * delta * (1 - delta)
-        C = L2**3 / (27 * L3**3) - L1 * L2 / (6 * L3**2) + L0 / (2 * L3)
-        if isclose(C, 0, abs_tol=1e-12):
-            p2 = -L2 / (3 * L3)
-        else:
-            B = copysign(1, C) * sqrt(L2**2 / (9 * L3**2) - L1 / (3 * L3))
-            A = 1 / 3 * (pi + acos(C / B**3))
-            p2 = 2 * B * cos(A) - L2 / (3 * L3)
-
-        p1 = p2 + delta
-
-        variance = (p1 * (1 - p1) / treatment_size + p2 * (1 - p2) / reference_size) * (N / (N - 1))
-
-        return (diff - delta) / sqrt(variance)
-
-    eps = 1e-12
-
-    match interval_type:
-        case "two-sided":
-            L = brentq(lambda delta: func(delta) - norm.ppf(1 - alpha / 2), -1 + eps, diff)
-            U = brentq(lambda delta: func(delta) - norm.ppf(alpha / 2), diff, 1 - eps)
-            distance = U - L
-        case "lower":
-            L = brentq(lambda delta: func(delta) - norm.ppf(1 - alpha), -1 + eps, diff)
-            distance = diff - L
-        case "upper":
-            U = brentq(lambda delta: func(delta) - norm.ppf(alpha), diff, 1 - eps)
-            distance = U - diff
-
-    return float(distance)
+    quantiles = _score_quantiles(conf_level, interval_type)
+    limits = _score_limits(
+        treatment_proportion, reference_proportion, treatment_size, reference_size, quantiles, corrected=True
+    )
+    return _score_distance(limits, treatment_proportion - reference_proportion, interval_type)
 
 
 def _distance(
@@ -391,6 +431,57 @@ def _distance(
             )
 
 
+def _distance_function(
+    treatment_proportion: float,
+    reference_proportion: float,
+    conf_level: float,
+    interval_type: Literal["two-sided", "lower", "upper"],
+    method: Literal["chisq", "wilson", "farrington_manning", "fm", "miettinen_nurminen", "mn"],
+    continuity_correction: bool = False,
+) -> Callable[[float, float], float]:
+    """Return `_distance` as a function of the sample sizes, for a search over the sample size.
+
+    For the score methods, the critical values are computed once, and each evaluation starts from the confidence limits
+    of the previous one, which are close by as the search narrows down.
+    """
+    if method not in {"fm", "farrington_manning", "mn", "miettinen_nurminen"}:
+
+        def distance(treatment_size: float, reference_size: float) -> float:
+            return _distance(
+                treatment_proportion,
+                reference_proportion,
+                treatment_size,
+                reference_size,
+                conf_level,
+                interval_type,
+                method,
+                continuity_correction,
+            )
+
+        return distance
+
+    corrected = method in {"mn", "miettinen_nurminen"}
+    quantiles = _score_quantiles(conf_level, interval_type)
+    limits = None
+
+    def func(treatment_size: float, reference_size: float) -> float:
+        nonlocal limits
+        limits = _score_limits(
+            treatment_proportion,
+            reference_proportion,
+            treatment_size,
+            reference_size,
+            quantiles,
+            corrected=corrected,
+            guess=limits,
+        )
+        return _score_distance(limits, treatment_proportion - reference_proportion, interval_type)
+
+    return func
+
+
+@_instrument
+@_cached
 def solve_distance(
     *,
     treatment_proportion: float,
@@ -454,6 +545,8 @@ def solve_distance(
     )
 
 
+@_instrument
+@_cached
 def solve_size(
     *,
     treatment_proportion: float,
@@ -504,48 +597,30 @@ def solve_size(
     Returns:
         The required sample sizes in treatment and reference groups, respectively.
     """
+    distance_of = _distance_function(
+        treatment_proportion, reference_proportion, conf_level, interval_type, method, continuity_correction
+    )
+
     if ratio >= 1:
 
         def func(reference_size: float) -> float:
-            return (
-                _distance(
-                    treatment_proportion,
-                    reference_proportion,
-                    reference_size * ratio,
-                    reference_size,
-                    conf_level,
-                    interval_type,
-                    method,
-                    continuity_correction,
-                )
-                - distance
-            )
+            return distance_of(reference_size * ratio, reference_size) - distance
 
-        reference_size = ceil(brentq(func, 1, 1e12))
+        reference_size = _min_size(func, 1, decreasing=True)
         treatment_size = ceil(reference_size * ratio)
     else:  # ratio < 1
 
         def func(treatment_size: float) -> float:
-            return (
-                _distance(
-                    treatment_proportion,
-                    reference_proportion,
-                    treatment_size,
-                    treatment_size / ratio,
-                    conf_level,
-                    interval_type,
-                    method,
-                    continuity_correction,
-                )
-                - distance
-            )
+            return distance_of(treatment_size, treatment_size / ratio) - distance
 
-        treatment_size = ceil(brentq(func, 1, 1e12))
+        treatment_size = _min_size(func, 1, decreasing=True)
         reference_size = ceil(treatment_size / ratio)
 
     return treatment_size, reference_size
 
 
+@_instrument
+@_cached
 def solve_treatment_proportion(
     *,
     reference_proportion: float,
@@ -640,15 +715,17 @@ def solve_treatment_proportion(
                 msg = "Solution not found."
                 raise SolutionNotFoundError(msg)
             else:
-                return float(brentq(func, res.x, ub))
+                return float(_root(func, res.x, ub))
         case "less":
             if func(res.x) * func(lb) > 0:
                 msg = "Solution not found."
                 raise SolutionNotFoundError(msg)
             else:
-                return float(brentq(func, lb, res.x))
+                return float(_root(func, lb, res.x))
 
 
+@_instrument
+@_cached
 def solve_reference_proportion(
     *,
     treatment_proportion: float,
@@ -743,10 +820,10 @@ def solve_reference_proportion(
                 msg = "Solution not found."
                 raise SolutionNotFoundError(msg)
             else:
-                return float(brentq(func, res.x, ub))
+                return float(_root(func, res.x, ub))
         case "less":
             if func(res.x) * func(lb) > 0:
                 msg = "Solution not found."
                 raise SolutionNotFoundError(msg)
             else:
-                return float(brentq(func, lb, res.x))
+                return float(_root(func, lb, res.x))
@@ -7,30 +7,66 @@ This module provides functions to calculate or estimate the following parameters
 
 - statistical power
 - sample size
+- sample sizes minimizing the total cost
 - proportion for the treatment group
 - proportion for the reference group
 """
 
 from math import ceil
+from math import floor
+from math import nan
+from math import sqrt
 from typing import Literal
 
-from scipy.optimize import brentq
-
+import numpy as np
+
+from numpy.typing import ArrayLike
+
+from ..._constant import EXACT_SAMPLE_SIZE_SEARCH_MAX
+from ..._distributions import _binom_pmf
+from ..._distributions import _norm_ppf
+from ..._math_utils import _all_scalar
+from ..._math_utils import _asarray
+from ..._solver import _as_sizes
+from ..._solver import _min_cost_sizes
+from ..._solver import _min_size
+from ..._solver import _min_sizes
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
+from ...exceptions import SolutionNotFoundError
+from ..single._power import _min_nonneg
 from ._power import _power as _raw_power
 
 
 def _power(
-    treatment_proportion: float,
-    reference_proportion: float,
-    treatment_size: int,
-    reference_size: int,
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
     alternative: Literal["two-sided", "one-sided"],
-    alpha: float,
-    method: Literal["z-pooled", "z-unpooled"],
+    alpha: ArrayLike,
+    method: Literal["z-pooled", "z-unpooled", "exact"],
     continuity_correction: bool,
-) -> float:
+) -> float | np.ndarray:
     """Calculate the statistical power."""
     if alternative == "one-sided":
+        if not _all_scalar(treatment_proportion, reference_proportion):
+            power_greater, power_less = (
+                _power(
+                    treatment_proportion,
+                    reference_proportion,
+                    treatment_size,
+                    reference_size,
+                    direction,
+                    alpha,
+                    method,
+                    continuity_correction,
+                )
+                for direction in ("greater", "less")
+            )
+            return np.where(treatment_proportion > reference_proportion, power_greater, power_less)
+
         alternative = "greater" if treatment_proportion > reference_proportion else "less"
 
     return _raw_power(
@@ -46,19 +82,87 @@ def _power(
     )
 
 
-def solve_power(
-    *,
+def _exact_sizes(
     treatment_proportion: float,
     reference_proportion: float,
-    treatment_size: int,
-    reference_size: int,
     alternative: Literal["two-sided", "one-sided"],
-    alpha: float = 0.05,
-    method: Literal["z-pooled", "z-unpooled"] = "z-unpooled",
+    ratio: float,
+    alpha: float,
+    power: float,
+) -> tuple[int, int]:
+    """Estimate the required sample sizes of the exact test.
+
+    The power of the exact test follows a saw-tooth pattern in the sample size, so the smaller group is solved for by
+    `_min_nonneg`, starting from the sample size of the z-test with pooled variance.
+    """
+    if treatment_proportion == reference_proportion:
+        msg = "The power of the exact test does not exceed 'alpha' when the proportions are equal."
+        raise SolutionNotFoundError(msg)
+
+    def split(size: ArrayLike) -> tuple[ArrayLike, ArrayLike]:
+        if ratio >= 1:
+            return np.ceil(np.multiply(size, ratio)), size
+        return size, np.ceil(np.divide(size, ratio))
+
+    def func(size: np.ndarray) -> np.ndarray:
+        treatment_size, reference_size = split(size)
+        return (
+            _power(
+                treatment_proportion,
+                reference_proportion,
+                treatment_size,
+                reference_size,
+                alternative,
+                alpha,
+                "exact",
+                False,
+            )
+            - power
+        )
+
+    # The sample size of the z-test with pooled variance serves as the starting point of the search.
+    z_alpha = _norm_ppf(1 - alpha / 2) if alternative == "two-sided" else _norm_ppf(1 - alpha)
+    z_beta = _norm_ppf(power)
+    pooled_proportion = (ratio * treatment_proportion + reference_proportion) / (ratio + 1)
+    sd_null = sqrt(pooled_proportion * (1 - pooled_proportion) * (1 + 1 / ratio))
+    sd_alt = sqrt(
+        treatment_proportion * (1 - treatment_proportion) / ratio + reference_proportion * (1 - reference_proportion)
+    )
+    reference_size = float(((z_alpha * sd_null + z_beta * sd_alt) / (treatment_proportion - reference_proportion)) ** 2)
+    anchor = reference_size if ratio >= 1 else reference_size * ratio
+
+    # The outcomes are spread over two groups, so the saw-tooth of the exact power stays below half the probability of
+    # the most likely count of a single group.
+    def amplitude(size: int) -> float:
+        return 0.5 * max(
+            float(_binom_pmf(floor((n + 1) * p), n, p))
+            for n, p in zip(split(size), (treatment_proportion, reference_proportion), strict=True)
+        )
+
+    # Every sample size costs a rejection region, so the saw-tooth is scanned in small blocks.
+    size = _min_nonneg(func, bounds=(1, EXACT_SAMPLE_SIZE_SEARCH_MAX), anchor=anchor, amplitude=amplitude, block=8)
+    treatment_size, reference_size = split(size)
+    return int(treatment_size), int(reference_size)
+
+
+@_instrument
+@_cached
+def solve_power(
+    *,
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    treatment_size: ArrayLike,
+    reference_size: ArrayLike,
+    alternative: Literal["two-sided", "one-sided"],
+    alpha: ArrayLike = 0.05,
+    method: Literal["z-pooled", "z-unpooled", "exact"] = "z-unpooled",
     continuity_correction: bool = False,
-) -> float:
+) -> float | np.ndarray:
     """Calculate the statistical power.
 
+    The numeric parameters accept either scalars or array-likes, which are broadcast against each other following
+    NumPy rules.
+
     Args:
         treatment_proportion:
             Proportion in the treatment group.
@@ -83,12 +187,21 @@ def solve_power(
 
             - `'z-pooled'`: Z-test using pooled variance.
             - `'z-unpooled'`: Z-test using unpooled variance.
+            - `'exact'`: Exact unconditional test (Suissa-Shuster), using the z statistic with pooled variance and
+              the largest size over the common proportion of both groups.
         continuity_correction:
-            Wether to apply Yates' continuity correction.
+            Wether to apply Yates' continuity correction. It is ignored if `method` is `'exact'`.
 
     Returns:
-        The statistical power of the test.
+        The statistical power of the test. A float is returned if all numeric parameters are scalars, otherwise an
+        array with the broadcast shape of the parameters is returned.
+
+    Raises:
+        ValueError: If `method` is `'exact'` and a sample size is not a positive integer.
     """
+    treatment_proportion, reference_proportion = _asarray(treatment_proportion), _asarray(reference_proportion)
+    treatment_size, reference_size, alpha = _asarray(treatment_size), _asarray(reference_size), _asarray(alpha)
+
     return _power(
         treatment_proportion,
         reference_proportion,
@@ -101,19 +214,93 @@ def solve_power(
     )
 
 
-def solve_size(
+def power_curve(
     *,
     treatment_proportion: float,
     reference_proportion: float,
-    alternative: Literal["two-sided", "one-sided"],
+    sizes: ArrayLike,
     ratio: float = 1,
+    alternative: Literal["two-sided", "one-sided"],
     alpha: float = 0.05,
-    power: float = 0.8,
-    method: Literal["z-pooled", "z-unpooled"] = "z-unpooled",
+    method: Literal["z-pooled", "z-unpooled", "exact"] = "z-unpooled",
     continuity_correction: bool = False,
-) -> tuple[int, int]:
+) -> np.ndarray:
+    """Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        treatment_proportion:
+            Proportion in the treatment group.
+        reference_proportion:
+            Proportion in the reference group.
+        sizes:
+            Sample sizes in the reference group at which the power is evaluated.
+        ratio:
+            Ratio of sample sizes in the treatment and reference groups. The sample sizes in the treatment group are
+            `ratio` * `sizes`, rounded up as in `solve_size`.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `'two-sided'`, the alternative hypothesis is $p_1 ≠ p_2$
+            - If `alternative` is `'one-sided'`, the alternative hypothesis is $p_1 > p_2$ or $p_1 < p_2$, depending on the value of `treatment_proportion` and `reference_proportion`.
+        alpha:
+            Significance level.
+
+            - If `alternative` is `'two-sided'`, `alpha` represents the two-sided significance level.
+            - If `alternative` is `'one-sided'`, `alpha` represents the one-sided significance level.
+        method:
+            The method used to construct the test statistic.
+
+            - `'z-pooled'`: Z-test using pooled variance.
+            - `'z-unpooled'`: Z-test using unpooled variance.
+            - `'exact'`: Exact unconditional test (Suissa-Shuster), using the z statistic with pooled variance and
+              the largest size over the common proportion of both groups.
+        continuity_correction:
+            Wether to apply Yates' continuity correction. It is ignored if `method` is `'exact'`.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+
+    Raises:
+        ValueError: If `method` is `'exact'` and a sample size in either group is not a positive integer.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    return np.asarray(
+        _power(
+            treatment_proportion,
+            reference_proportion,
+            np.ceil(sizes * ratio),
+            sizes,
+            alternative,
+            alpha,
+            method,
+            continuity_correction,
+        ),
+        dtype=float,
+    )
+
+
+@_instrument
+@_cached
+def solve_size(
+    *,
+    treatment_proportion: ArrayLike,
+    reference_proportion: ArrayLike,
+    alternative: Literal["two-sided", "one-sided"],
+    ratio: ArrayLike = 1,
+    alpha: ArrayLike = 0.05,
+    power: ArrayLike = 0.8,
+    method: Literal["z-pooled", "z-unpooled", "exact"] = "z-unpooled",
+    continuity_correction: bool = False,
+) -> tuple[int, int] | tuple[np.ndarray, np.ndarray]:
     """Estimate the required sample size.
 
+    The numeric parameters accept either scalars or array-likes. Array-likes are broadcast against each other
+    following NumPy rules, and all sample sizes are solved together by a vectorized root finder.
+
     Args:
         treatment_proportion:
             Proportion in the treatment group.
@@ -140,12 +327,77 @@ def solve_size(
 
             - `'z-pooled'`: Z-test using pooled variance.
             - `'z-unpooled'`: Z-test using unpooled variance.
+            - `'exact'`: Exact unconditional test (Suissa-Shuster), using the z statistic with pooled variance and
+              the largest size over the common proportion of both groups.
         continuity_correction:
-            Wether to apply Yates' continuity correction.
+            Wether to apply Yates' continuity correction. It is ignored if `method` is `'exact'`.
 
     Returns:
-        The required sample sizes in the treatment and reference groups, respectively.
+        The required sample sizes in the treatment and reference groups, respectively. If any numeric parameter is an
+        array-like, both sample sizes are integer arrays with the broadcast shape of the parameters. In the arrays, the
+        elements without a solution are `NaN` instead of failing the whole call, in which case they are float arrays.
+
+    Raises:
+        SolutionNotFoundError: If `method` is `'exact'`, all numeric parameters are scalars, and no sample size up to
+            2000 in the smaller group achieves `power`, e.g. if the proportions are equal.
+
+    Info:
+        The power of the exact test is not monotone in the sample size, and each sample size is searched for
+        separately, starting from the sample size of the z-test with pooled variance. The rejection region of every
+        pair of sample sizes evaluated is kept in a cache, so that later solves with the same significance level reuse
+        it.
     """
+    treatment_proportion, reference_proportion = _asarray(treatment_proportion), _asarray(reference_proportion)
+    ratio, alpha, power = _asarray(ratio), _asarray(alpha), _asarray(power)
+
+    if method == "exact":
+        if not _all_scalar(treatment_proportion, reference_proportion, ratio, alpha, power):
+            # Each element is searched for separately, so those without a solution are `NaN` on their own.
+            def solve(*args: float) -> tuple[float, float]:
+                try:
+                    return _exact_sizes(*args)
+                except SolutionNotFoundError:
+                    return nan, nan
+
+            treatment_size, reference_size = np.vectorize(solve, otypes=[float, float], excluded={2})(
+                treatment_proportion, reference_proportion, alternative, ratio, alpha, power
+            )
+            return _as_sizes(treatment_size), _as_sizes(reference_size)
+        return _exact_sizes(treatment_proportion, reference_proportion, alternative, ratio, alpha, power)
+
+    if not _all_scalar(treatment_proportion, reference_proportion, ratio, alpha, power):
+        # The smaller group is solved for, and the larger group is derived from it, as in the scalar case.
+        def vfunc(
+            size: np.ndarray,
+            treatment_proportion: np.ndarray,
+            reference_proportion: np.ndarray,
+            ratio: np.ndarray,
+            alpha: np.ndarray,
+            power: np.ndarray,
+        ) -> np.ndarray:
+            treatment_size = np.where(ratio >= 1, size * ratio, size)
+            reference_size = np.where(ratio >= 1, size, size / ratio)
+            return (
+                _power(
+                    treatment_proportion,
+                    reference_proportion,
+                    treatment_size,
+                    reference_size,
+                    alternative,
+                    alpha,
+                    method,
+                    continuity_correction,
+                )
+                - power
+            )
+
+        args = (treatment_proportion, reference_proportion, ratio, alpha, power)
+        size = _min_sizes(vfunc, 1e-12, args=args)
+        ratio = np.broadcast_to(ratio, size.shape)
+        treatment_size = np.where(ratio >= 1, np.ceil(size * ratio), size)
+        reference_size = np.where(ratio >= 1, size, np.ceil(size / ratio))
+        return _as_sizes(treatment_size), _as_sizes(reference_size)
+
     if ratio >= 1:
 
         def func(reference_size: float) -> float:
@@ -163,7 +415,7 @@ def solve_size(
                 - power
             )
 
-        reference_size = ceil(brentq(func, 1e-12, 1e12))
+        reference_size = _min_size(func, 1e-12)
         treatment_size = ceil(reference_size * ratio)
         return treatment_size, reference_size
     else:
@@ -183,11 +435,94 @@ def solve_size(
                 - power
             )
 
-        treatment_size = ceil(brentq(func, 1e-12, 1e12))
+        treatment_size = _min_size(func, 1e-12)
         reference_size = ceil(treatment_size / ratio)
         return treatment_size, reference_size
 
 
+@_instrument
+@_cached
+def solve_allocation(
+    *,
+    treatment_proportion: float,
+    reference_proportion: float,
+    alternative: Literal["two-sided", "one-sided"],
+    alpha: float = 0.05,
+    power: float = 0.8,
+    treatment_cost: float = 1,
+    reference_cost: float = 1,
+    method: Literal["z-pooled", "z-unpooled"] = "z-unpooled",
+    continuity_correction: bool = False,
+) -> tuple[int, int]:
+    r"""Estimate the sample sizes that minimize the total cost at the expected power.
+
+    Instead of fixing the ratio of the sample sizes, the cost of a subject is given for each group, and the sample
+    sizes reaching the expected power at the lowest total cost `treatment_cost * treatment_size + reference_cost *
+    reference_size` are searched for. The ratio of the returned sample sizes is thus the cost-optimal allocation ratio.
+    All candidate ratios are evaluated together, which replaces calling `solve_size` for each of them.
+
+    Args:
+        treatment_proportion:
+            Proportion in the treatment group.
+        reference_proportion:
+            Proportion in the reference group.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `'two-sided'`, the alternative hypothesis is $p_1 ≠ p_2$
+            - If `alternative` is `'one-sided'`, the alternative hypothesis is $p_1 > p_2$ or $p_1 < p_2$, depending on the value of `treatment_proportion` and `reference_proportion`.
+        alpha:
+            Significance level.
+
+            - If `alternative` is `'two-sided'`, `alpha` represents the two-sided significance level.
+            - If `alternative` is `'one-sided'`, `alpha` represents the one-sided significance level.
+        power:
+            Expected statistical power.
+
+            0.8 is a commonly used value for statistical power.
+        treatment_cost:
+            Cost per subject in the treatment group.
+        reference_cost:
+            Cost per subject in the reference group.
+        method:
+            The method used to construct the test statistic.
+
+            - `'z-pooled'`: Z-test using pooled variance.
+            - `'z-unpooled'`: Z-test using unpooled variance.
+        continuity_correction:
+            Wether to apply Yates' continuity correction.
+
+    Returns:
+        The sample sizes in the treatment and reference groups, respectively. If several designs have the lowest cost,
+        the balanced one is preferred, and otherwise the one with the smallest reference group.
+
+    Raises:
+        ValueError: If `treatment_cost` or `reference_cost` is not positive.
+    """
+    if treatment_cost <= 0 or reference_cost <= 0:
+        msg = "'treatment_cost' and 'reference_cost' must be positive."
+        raise ValueError(msg)
+
+    def func(treatment_size: np.ndarray, reference_size: np.ndarray) -> np.ndarray:
+        return (
+            _power(
+                treatment_proportion,
+                reference_proportion,
+                treatment_size,
+                reference_size,
+                alternative,
+                alpha,
+                method,
+                continuity_correction,
+            )
+            - power
+        )
+
+    return _min_cost_sizes(func, treatment_cost, reference_cost, 1)
+
+
+@_instrument
+@_cached
 def solve_treatment_proportion(
     *,
     reference_proportion: float,
@@ -196,7 +531,7 @@ def solve_treatment_proportion(
     alternative: Literal["two-sided", "one-sided"],
     alpha: float = 0.05,
     power: float = 0.8,
-    method: Literal["z-pooled", "z-unpooled"] = "z-unpooled",
+    method: Literal["z-pooled", "z-unpooled", "exact"] = "z-unpooled",
     continuity_correction: bool = False,
     direction: Literal["greater", "less"],
 ) -> float:
@@ -228,8 +563,10 @@ def solve_treatment_proportion(
 
             - `'z-pooled'`: Z-test using pooled variance.
             - `'z-unpooled'`: Z-test using unpooled variance.
+            - `'exact'`: Exact unconditional test (Suissa-Shuster), using the z statistic with pooled variance and
+              the largest size over the common proportion of both groups.
         continuity_correction:
-            Wether to apply Yates' continuity correction.
+            Wether to apply Yates' continuity correction. It is ignored if `method` is `'exact'`.
         direction:
             The direction for the treatment proportion relative to the reference proportion.
 
@@ -257,11 +594,13 @@ def solve_treatment_proportion(
 
     match direction:
         case "greater":
-            return float(brentq(func, reference_proportion, 1 - 1e-12))
+            return float(_root(func, reference_proportion, 1 - 1e-12))
         case "less":
-            return float(brentq(func, 1e-12, reference_proportion))
+            return float(_root(func, 1e-12, reference_proportion))
 
 
+@_instrument
+@_cached
 def solve_reference_proportion(
     *,
     treatment_proportion: float,
@@ -270,7 +609,7 @@ def solve_reference_proportion(
     alternative: Literal["two-sided", "one-sided"],
     alpha: float = 0.05,
     power: float = 0.8,
-    method: Literal["z-pooled", "z-unpooled"] = "z-unpooled",
+    method: Literal["z-pooled", "z-unpooled", "exact"] = "z-unpooled",
     continuity_correction: bool = False,
     direction: Literal["greater", "less"],
 ) -> float:
@@ -302,8 +641,10 @@ def solve_reference_proportion(
 
             - `'z-pooled'`: Z-test using pooled variance.
             - `'z-unpooled'`: Z-test using unpooled variance.
+            - `'exact'`: Exact unconditional test (Suissa-Shuster), using the z statistic with pooled variance and
+              the largest size over the common proportion of both groups.
         continuity_correction:
-            Wether to apply Yates' continuity correction.
+            Wether to apply Yates' continuity correction. It is ignored if `method` is `'exact'`.
         direction:
             The direction for the treatment proportion relative to the reference proportion.
 
@@ -331,6 +672,6 @@ def solve_reference_proportion(
 
     match direction:
         case "greater":
-            return float(brentq(func, treatment_proportion, 1 - 1e-12))
+            return float(_root(func, treatment_proportion, 1 - 1e-12))
         case "less":
-            return float(brentq(func, 1e-12, treatment_proportion))
+            return float(_root(func, 1e-12, treatment_proportion))
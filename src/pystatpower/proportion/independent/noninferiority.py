@@ -7,6 +7,7 @@ This module provides functions to calculate or estimate the following parameters
 
 - statistical power
 - sample size
+- sample sizes minimizing the total cost
 - proportion for the treatment group
 - proportion for the reference group
 - non-inferiority margin
@@ -15,8 +16,15 @@ This module provides functions to calculate or estimate the following parameters
 from math import ceil
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
+
+from ..._solver import _min_cost_sizes
+from ..._solver import _min_size
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ._power import _power
 
 
@@ -29,6 +37,8 @@ def _margin(margin: float, alternative: Literal["greater", "less"]) -> float:
             return abs(margin)
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
     treatment_proportion: float,
@@ -98,6 +108,86 @@ def solve_power(
     )
 
 
+def power_curve(
+    *,
+    treatment_proportion: float,
+    reference_proportion: float,
+    margin: float,
+    sizes: ArrayLike,
+    ratio: float = 1,
+    alternative: Literal["greater", "less"],
+    alpha: float = 0.025,
+    method: Literal["z-pooled", "z-unpooled"] = "z-unpooled",
+    continuity_correction: bool = False,
+) -> np.ndarray:
+    r"""Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        treatment_proportion:
+            Proportion in the treatment group.
+        reference_proportion:
+            Proportion in the reference group.
+        margin:
+            The non-inferiority margin.
+
+            !!! tip
+
+                Regardless of whether `alternative` is specified as `'greater'` or `'less'`, you can always specify this
+                parameter as either positive or negative, as you prefer. Internally, the value of `margin` is converted
+                before actual calculation takes place.
+
+                - If `alternative` is `'greater'`, the internally used margin is `-abs(margin)`.
+                - If `alternative` is `'less'`, the internally used margin is `abs(margin)`.
+        sizes:
+            Sample sizes in the reference group at which the power is evaluated.
+        ratio:
+            Ratio of sample sizes in the treatment and reference groups. The sample sizes in the treatment group are
+            `ratio` * `sizes`, rounded up as in `solve_size`.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `'greater'`, the alternative hypothesis is $p_1 - p_2 > \\delta \\ (\\delta < 0)$
+            - If `alternative` is `'less'`, the alternative hypothesis is $p_1 - p_2 < \\delta \\ (\\delta > 0)$.
+        alpha:
+            Significance level.
+
+            The non-inferiority test is a one-sided test, with a significance level of 0.025 being commonly used.
+        method:
+            The method used to construct the test statistic.
+
+            - `'z-pooled'`: Z-test using pooled variance.
+            - `'z-unpooled'`: Z-test using unpooled variance.
+        continuity_correction:
+            Wether to apply Yates' continuity correction.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    margin = _margin(margin, alternative)
+
+    return np.asarray(
+        _power(
+            treatment_proportion,
+            reference_proportion,
+            reference_proportion + margin,
+            np.ceil(sizes * ratio),
+            sizes,
+            alternative,
+            alpha,
+            method,
+            continuity_correction,
+        ),
+        dtype=float,
+    )
+
+
+@_instrument
+@_cached
 def solve_size(
     *,
     treatment_proportion: float,
@@ -174,7 +264,7 @@ def solve_size(
                 - power
             )
 
-        reference_size = ceil(brentq(func, 1e-12, 1e12))
+        reference_size = _min_size(func, 1e-12)
         treatment_size = ceil(reference_size * ratio)
         return treatment_size, reference_size
     else:
@@ -195,11 +285,108 @@ def solve_size(
                 - power
             )
 
-        treatment_size = ceil(brentq(func, 1e-12, 1e12))
+        treatment_size = _min_size(func, 1e-12)
         reference_size = ceil(treatment_size * (1 / ratio))
         return treatment_size, reference_size
 
 
+@_instrument
+@_cached
+def solve_allocation(
+    *,
+    treatment_proportion: float,
+    reference_proportion: float,
+    margin: float,
+    alternative: Literal["greater", "less"],
+    alpha: float = 0.025,
+    power: float = 0.8,
+    treatment_cost: float = 1,
+    reference_cost: float = 1,
+    method: Literal["z-pooled", "z-unpooled"] = "z-unpooled",
+    continuity_correction: bool = False,
+) -> tuple[int, int]:
+    r"""Estimate the sample sizes that minimize the total cost at the expected power.
+
+    Instead of fixing the ratio of the sample sizes, the cost of a subject is given for each group, and the sample
+    sizes reaching the expected power at the lowest total cost `treatment_cost * treatment_size + reference_cost *
+    reference_size` are searched for. The ratio of the returned sample sizes is thus the cost-optimal allocation ratio.
+    All candidate ratios are evaluated together, which replaces calling `solve_size` for each of them.
+
+    Args:
+        treatment_proportion:
+            Proportion in the treatment group.
+        reference_proportion:
+            Proportion in the reference group.
+        margin:
+            The non-inferiority margin.
+
+            !!! tip
+
+                Regardless of whether `alternative` is specified as `'greater'` or `'less'`, you can always specify this
+                parameter as either positive or negative, as you prefer. Internally, the value of `margin` is converted
+                before actual calculation takes place.
+
+                - If `alternative` is `'greater'`, the internally used margin is `-abs(margin)`.
+                - If `alternative` is `'less'`, the internally used margin is `abs(margin)`.
+        alternative:
+            Type of the alternative hypothesis.
+
+            - If `alternative` is `'greater'`, the alternative hypothesis is $p_1 - p_2 > \\delta \\ (\\delta < 0)$
+            - If `alternative` is `'less'`, the alternative hypothesis is $p_1 - p_2 < \\delta \\ (\\delta > 0)$.
+        alpha:
+            Significance level.
+
+            The non-inferiority test is a one-sided test, with a significance level of 0.025 being commonly used.
+        power:
+            Expected statistical power.
+
+            0.8 is a commonly used value for statistical power.
+        treatment_cost:
+            Cost per subject in the treatment group.
+        reference_cost:
+            Cost per subject in the reference group.
+        method:
+            The method used to construct the test statistic.
+
+            - `'z-pooled'`: Z-test using pooled variance.
+            - `'z-unpooled'`: Z-test using unpooled variance.
+        continuity_correction:
+            Wether to apply Yates' continuity correction.
+
+    Returns:
+        The sample sizes in the treatment and reference groups, respectively. If several designs have the lowest cost,
+        the balanced one is preferred, and otherwise the one with the smallest reference group.
+
+    Raises:
+        ValueError: If `treatment_cost` or `reference_cost` is not positive.
+    """
+    if treatment_cost <= 0 or reference_cost <= 0:
+        msg = "'treatment_cost' and 'reference_cost' must be positive."
+        raise ValueError(msg)
+
+    margin = _margin(margin, alternative)
+
+    def func(treatment_size: np.ndarray, reference_size: np.ndarray) -> np.ndarray:
+        return (
+            _power(
+                treatment_proportion,
+                reference_proportion,
+                reference_proportion + margin,
+                treatment_size,
+                reference_size,
+                alternative,
+                alpha,
+                method,
+                continuity_correction,
+            )
+            - power
+        )
+
+    return _min_cost_sizes(func, treatment_cost, reference_cost, 1)
+
+
+@_instrument
+@_cached
 def solve_treatment_proportion(
     *,
     reference_proportion: float,
@@ -303,11 +490,13 @@ def solve_treatment_proportion(
 
     match alternative:
         case "greater":
-            return float(brentq(func, max(reference_proportion + margin, 0), 1))
+            return float(_root(func, max(reference_proportion + margin, 0), 1))
         case "less":
-            return float(brentq(func, 0, min(reference_proportion + margin, 1)))
+            return float(_root(func, 0, min(reference_proportion + margin, 1)))
 
 
+@_instrument
+@_cached
 def solve_reference_proportion(
     *,
     treatment_proportion: float,
@@ -411,11 +600,13 @@ def solve_reference_proportion(
 
     match alternative:
         case "greater":
-            return brentq(func, 0, min(treatment_proportion - margin, 1))
+            return _root(func, 0, min(treatment_proportion - margin, 1))
         case "less":
-            return brentq(func, max(treatment_proportion - margin, 0), 1)
+            return _root(func, max(treatment_proportion - margin, 0), 1)
 
 
+@_instrument
+@_cached
 def solve_margin(
     *,
     treatment_proportion: float,
@@ -507,6 +698,6 @@ def solve_margin(
 
     match alternative:
         case "greater":
-            return float(brentq(func, -1, min(treatment_proportion - reference_proportion, 0)))
+            return float(_root(func, -1, min(treatment_proportion - reference_proportion, 0)))
         case "less":
-            return float(brentq(func, max(treatment_proportion - reference_proportion, 0), 1))
+            return float(_root(func, max(treatment_proportion - reference_proportion, 0), 1))
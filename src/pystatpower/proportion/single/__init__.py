@@ -12,11 +12,17 @@ This package provides the following modules:
 - equivalence: Equivalence tests for a single proportion.
 """
 
-from . import ci
-from . import equivalence
-from . import inequality
-from . import noninferiority
-from . import superiority
+from typing import TYPE_CHECKING
+
+from ..._lazy import _attach
+
+if TYPE_CHECKING:
+    from . import ci
+    from . import equivalence
+    from . import inequality
+    from . import noninferiority
+    from . import superiority
+
 
 __all__ = [
     "ci",
@@ -25,3 +31,5 @@ __all__ = [
     "superiority",
     "equivalence",
 ]
+
+__getattr__, __dir__ = _attach(__name__, __all__)
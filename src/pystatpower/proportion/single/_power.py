@@ -2,186 +2,310 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from collections.abc import Callable
-from math import sqrt
+from math import isfinite
 from typing import Literal
 
-from scipy.stats import binom
-from scipy.stats import norm
+import numpy as np
 
+from numpy.typing import ArrayLike
 
-def _min_nonneg(f: Callable[[int], float], *, bounds: tuple[int, int], strict: bool = False) -> int:
+from ..._distributions import _binom_cdf
+from ..._distributions import _binom_ppf
+from ..._distributions import _norm_cdf
+from ..._distributions import _norm_ppf
+from ..._math_utils import _all_scalar
+from ..._math_utils import _scalar_or_array
+from ..._solver import _continuation
+from ..._solver import _search
+from ...diagnostics import _record_search
+from ...exceptions import SolutionNotFoundError
+
+
+def _min_nonneg(
+    f: Callable[[np.ndarray], np.ndarray],
+    *,
+    bounds: tuple[int, int],
+    anchor: float | None = None,
+    amplitude: Callable[[int], float] | None = None,
+    strict: bool = False,
+    block: int = 256,
+) -> int:
     """Return the smallest non-negative integer satisfying f(x) >= 0.
 
+    The function is not assumed to be monotone, as is the case for the power of exact tests, which follows a saw-tooth
+    pattern in the sample size. Instead, it is assumed to be an increasing trend plus an oscillation bounded by
+    `amplitude`. The search proceeds in three stages:
+
+    1. Starting from `anchor`, step upwards with exponentially growing steps until `f(x) >= 0`.
+    2. Step downwards from there with exponentially growing steps until `f(x) < -amplitude(x)`, below which the
+       oscillation can no longer lift `f` above zero.
+    3. Scan every integer in the bracket and return the first one satisfying the condition.
+
     Args:
         f:
-            A discrete function whose domain is the set of positive integers.
+            A vectorized discrete function whose domain is the set of positive integers.
         bounds:
             A limited boundary
+        anchor:
+            An approximation of the solution, e.g. the sample size given by a normal approximation. If omitted, the
+            search starts from the lower bound.
+        amplitude:
+            An upper bound of the oscillation of `f` around its trend at `x`. If omitted, `f` is assumed monotone.
         strict:
             Whether to enable strict mode. In strict mode, after finding the smallest non-negative integer that meets
-            the condition, the search will continue to increase x to ensure that f(x) remains stable above 0.
-
-            Currently, this parameter does not have any effect.
+            the condition, the search will continue to increase x to ensure that f(x) remains stable above 0. The
+            condition is considered stable once it has held over a window at least as long as the solution itself.
+        block:
+            Number of consecutive integers evaluated in one vectorized call when scanning.
 
     Returns:
         Non-negative integer solutions satisfying the condition.
+
+    Raises:
+        SolutionNotFoundError: If no integer within `bounds` satisfies the condition.
     """
-    lb, ub = bounds
+    with _search() as slot:
+        if slot is not None and anchor is None:
+            anchor = slot.guess
+
+        lb, ub = int(bounds[0]), int(bounds[1])
+        evaluations = 0
+
+        def evaluate(xs: np.ndarray) -> np.ndarray:
+            nonlocal evaluations
+            evaluations += 1
+            return f(xs)
 
-    x = lb
-    step = 1
-    while x < ub:
-        if f(x) >= 0:
-            break
-        x += step
+        def satisfied(x: int) -> bool:
+            return bool(evaluate(np.array([x]))[0] >= 0)
 
-    return x
+        # Stage 1: exponential bracketing upwards from the anchor.
+        x = lb if anchor is None or not isfinite(anchor) else min(max(int(anchor), lb), ub)
+        step = 1
+        while not satisfied(x):
+            if x >= ub:
+                msg = f"No sample size within [{lb}, {ub}] achieves the required power."
+                raise SolutionNotFoundError(msg)
+            x, step = min(x + step, ub), step * 2
+        hi = x
+
+        # Stage 2: exponential bracketing downwards.
+        step = 1
+        while x > lb and evaluate(np.array([x]))[0] >= (-amplitude(x) if amplitude is not None else 0):
+            x, step = max(x - step, lb), step * 2
+        lo = x
+
+        # Stage 3: scan the local window.
+        first = hi
+        for start in range(lo, hi + 1, block):
+            xs = np.arange(start, min(start + block, hi + 1))
+            (hits,) = np.nonzero(evaluate(xs) >= 0)
+            if hits.size > 0:
+                first = int(xs[hits[0]])
+                break
+
+        stable = first
+        x = first + 1
+        while strict and x < min(2 * stable, ub):
+            xs = np.arange(x, min(x + block, 2 * stable, ub))
+            (misses,) = np.nonzero(evaluate(xs) < 0)
+            if misses.size > 0:
+                stable = int(xs[misses[-1]]) + 1
+            x = int(xs[-1]) + 1
+
+        _record_search((lo, hi), evaluations, evaluations)
+        if slot is not None:
+            slot.root = stable
+        return stable
+
+
+def _critical_counts(
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
+    alternative: Literal["two-sided", "greater", "less"],
+    alpha: ArrayLike,
+) -> tuple[ArrayLike, ArrayLike]:
+    """Calculate the rejection region of the exact test.
+
+    Returns:
+        The largest count rejecting the null hypothesis from below, and the largest count not rejecting it from above.
+        The side not tested by `alternative` is returned as `-1` and `size`, i.e. an empty region.
+    """
+    reject_L, reject_U = -1, size
+    match alternative:
+        case "two-sided":
+            reject_L = _binom_ppf(alpha / 2, size, proportion_threshold)
+            reject_L = np.where(_binom_cdf(reject_L, size, proportion_threshold) > alpha / 2, reject_L - 1, reject_L)
+            reject_U = _binom_ppf(1 - alpha / 2, size, proportion_threshold)
+        case "greater":
+            reject_U = _binom_ppf(1 - alpha, size, proportion_threshold)
+        case "less":
+            reject_L = _binom_ppf(alpha, size, proportion_threshold)
+            reject_L = np.where(_binom_cdf(reject_L, size, proportion_threshold) > alpha, reject_L - 1, reject_L)
+
+    return reject_L, reject_U
+
+
+def _rejection_region(
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
+    alternative: Literal["two-sided", "greater", "less"],
+    alpha: ArrayLike,
+) -> tuple[ArrayLike, ArrayLike]:
+    """Return `_critical_counts`, reusing those of the previous solves of a sweep.
+
+    The rejection region depends on neither the proportion nor the power, so within a sweep over either of them, only
+    the sample sizes not met by a previous solve need to be computed.
+    """
+    state = _continuation.get()
+    if state is None or not _all_scalar(proportion_threshold, alpha):
+        return _critical_counts(proportion_threshold, size, alternative, alpha)
+
+    key = ("exact", float(proportion_threshold), alternative, float(alpha))
+    regions = state.memo.setdefault(key, {})
+    sizes = np.ravel(size).tolist()
+    missing = [n for n in dict.fromkeys(sizes) if n not in regions]
+    if missing:
+        counts = np.broadcast_arrays(*_critical_counts(proportion_threshold, np.array(missing), alternative, alpha))
+        regions.update(zip(missing, zip(*(c.tolist() for c in counts), strict=True), strict=True))
+
+    reject_L, reject_U = np.array([regions[n] for n in sizes], dtype=float).T
+    return reject_L.reshape(np.shape(size)), reject_U.reshape(np.shape(size))
 
 
 def _power_exact(
-    proportion: float,
-    proportion_threshold: float,
-    size: int,
+    proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using exact test."""
+    reject_L, reject_U = _rejection_region(proportion_threshold, size, alternative, alpha)
     match alternative:
         case "two-sided":
-            reject_L = binom.ppf(alpha / 2, size, proportion_threshold)
-            if binom.cdf(reject_L, size, proportion_threshold) > alpha / 2:
-                reject_L -= 1
-            reject_U = binom.ppf(1 - alpha / 2, size, proportion_threshold)
-            power = 1 - binom.cdf(reject_U, size, proportion) + binom.cdf(reject_L, size, proportion)
+            power = 1 - _binom_cdf(reject_U, size, proportion) + _binom_cdf(reject_L, size, proportion)
         case "greater":
-            reject_U = binom.ppf(1 - alpha, size, proportion_threshold)
-            power = 1 - binom.cdf(reject_U, size, proportion)
+            power = 1 - _binom_cdf(reject_U, size, proportion)
         case "less":
-            reject_L = binom.ppf(alpha, size, proportion_threshold)
-            if binom.cdf(reject_L, size, proportion_threshold) > alpha:
-                reject_L -= 1
-            power = binom.cdf(reject_L, size, proportion)
+            power = _binom_cdf(reject_L, size, proportion)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_p0(
-    proportion: float,
-    proportion_threshold: float,
-    size: float,
+    proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using p0 to calculate the variance."""
     offset = proportion - proportion_threshold
-    p0_se = sqrt(proportion_threshold * (1 - proportion_threshold) / size)
-    p_se = sqrt(proportion * (1 - proportion) / size)
+    p0_se = np.sqrt(proportion_threshold * (1 - proportion_threshold) / size)
+    p_se = np.sqrt(proportion * (1 - proportion) / size)
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf((norm.ppf(1 - alpha / 2) * p0_se - offset) / p_se)
-                + norm.cdf((norm.ppf(alpha / 2) * p0_se - offset) / p_se)
+                - _norm_cdf((_norm_ppf(1 - alpha / 2) * p0_se - offset) / p_se)
+                + _norm_cdf((_norm_ppf(alpha / 2) * p0_se - offset) / p_se)
             )
         case "greater":
-            power = 1 - norm.cdf((norm.ppf(1 - alpha) * p0_se - offset) / p_se)
+            power = 1 - _norm_cdf((_norm_ppf(1 - alpha) * p0_se - offset) / p_se)
         case "less":
-            power = norm.cdf((norm.ppf(alpha) * p0_se - offset) / p_se)
-    return float(power)
+            power = _norm_cdf((_norm_ppf(alpha) * p0_se - offset) / p_se)
+    return _scalar_or_array(power)
 
 
 def _power_p0_cc(
-    proportion: float,
-    proportion_threshold: float,
-    size: float,
+    proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using p0 with continuity correction to calculate the variance."""
-    if abs(proportion - proportion_threshold) > 1 / (2 * size):
-        c = 1 / (2 * size)
-    else:
-        c = 0
+    c = np.where(np.abs(proportion - proportion_threshold) > 1 / (2 * size), 1 / (2 * size), 0)
 
     offset = proportion - proportion_threshold
-    p0_se = sqrt(proportion_threshold * (1 - proportion_threshold) / size)
-    p_se = sqrt(proportion * (1 - proportion) / size)
+    p0_se = np.sqrt(proportion_threshold * (1 - proportion_threshold) / size)
+    p_se = np.sqrt(proportion * (1 - proportion) / size)
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf((norm.ppf(1 - alpha / 2) * p0_se - (offset - c)) / p_se)
-                + norm.cdf((norm.ppf(alpha / 2) * p0_se - (offset + c)) / p_se)
+                - _norm_cdf((_norm_ppf(1 - alpha / 2) * p0_se - (offset - c)) / p_se)
+                + _norm_cdf((_norm_ppf(alpha / 2) * p0_se - (offset + c)) / p_se)
             )
         case "greater":
-            power = 1 - norm.cdf((norm.ppf(1 - alpha) * p0_se - (offset - c)) / p_se)
+            power = 1 - _norm_cdf((_norm_ppf(1 - alpha) * p0_se - (offset - c)) / p_se)
         case "less":
-            power = norm.cdf((norm.ppf(alpha) * p0_se - (offset + c)) / p_se)
-    return float(power)
+            power = _norm_cdf((_norm_ppf(alpha) * p0_se - (offset + c)) / p_se)
+    return _scalar_or_array(power)
 
 
 def _power_phat(
-    proportion: float,
-    proportion_threshold: float,
-    size: float,
+    proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using phat to calculate the variance."""
     offset = proportion - proportion_threshold
-    p_se = sqrt(proportion * (1 - proportion) / size)
+    p_se = np.sqrt(proportion * (1 - proportion) / size)
     match alternative:
         case "two-sided":
             power = (
-                1 - norm.cdf(norm.ppf(1 - alpha / 2) - offset / p_se) + norm.cdf(norm.ppf(alpha / 2) - offset / p_se)
+                1
+                - _norm_cdf(_norm_ppf(1 - alpha / 2) - offset / p_se)
+                + _norm_cdf(_norm_ppf(alpha / 2) - offset / p_se)
             )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - offset / p_se)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - offset / p_se)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - offset / p_se)
+            power = _norm_cdf(_norm_ppf(alpha) - offset / p_se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power_phat_cc(
-    proportion: float,
-    proportion_threshold: float,
-    size: float,
+    proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
-) -> float:
+    alpha: ArrayLike,
+) -> float | np.ndarray:
     """Calculate the statistical power, using phat with continuity correction to calculate the variance."""
-    if abs(proportion - proportion_threshold) > 1 / (2 * size):
-        c = 1 / (2 * size)
-    else:
-        c = 0
+    c = np.where(np.abs(proportion - proportion_threshold) > 1 / (2 * size), 1 / (2 * size), 0)
 
     offset = proportion - proportion_threshold
-    p_se = sqrt(proportion * (1 - proportion) / size)
+    p_se = np.sqrt(proportion * (1 - proportion) / size)
     match alternative:
         case "two-sided":
             power = (
                 1
-                - norm.cdf(norm.ppf(1 - alpha / 2) - (offset - c) / p_se)
-                + norm.cdf(norm.ppf(alpha / 2) - (offset + c) / p_se)
+                - _norm_cdf(_norm_ppf(1 - alpha / 2) - (offset - c) / p_se)
+                + _norm_cdf(_norm_ppf(alpha / 2) - (offset + c) / p_se)
             )
         case "greater":
-            power = 1 - norm.cdf(norm.ppf(1 - alpha) - (offset - c) / p_se)
+            power = 1 - _norm_cdf(_norm_ppf(1 - alpha) - (offset - c) / p_se)
         case "less":
-            power = norm.cdf(norm.ppf(alpha) - (offset + c) / p_se)
+            power = _norm_cdf(_norm_ppf(alpha) - (offset + c) / p_se)
 
-    return float(power)
+    return _scalar_or_array(power)
 
 
 def _power(
-    proportion: float,
-    proportion_threshold: float,
-    size: float,
+    proportion: ArrayLike,
+    proportion_threshold: ArrayLike,
+    size: ArrayLike,
     alternative: Literal["two-sided", "greater", "less"],
-    alpha: float,
+    alpha: ArrayLike,
     method: Literal["exact", "z-p0", "z-phat"],
     continuity_correction: bool,
-) -> float:
+) -> float | np.ndarray:
     """Calculate the statistical power."""
     match method:
         case "exact":
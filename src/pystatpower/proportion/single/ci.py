@@ -10,17 +10,25 @@ This module provides functions to calculate or estimate the following parameters
 - proportion
 """
 
-from math import ceil
 from math import sqrt
 from typing import Literal
 
+import numpy as np
+
+from numpy.typing import ArrayLike
 from scipy.optimize import OptimizeResult
-from scipy.optimize import brentq
 from scipy.optimize import minimize_scalar
-from scipy.stats import f
-from scipy.stats import norm
 
+from ..._constant import LOWER_LIMIT_OF_SAMPLE_SIZE
+from ..._constant import SAMPLE_SIZE_SEARCH_MAX
+from ..._distributions import _beta_ppf
+from ..._distributions import _f_ppf
+from ..._distributions import _norm_ppf
 from ..._math_utils import _domain_square_root_of_quad
+from ..._solver import _min_size
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 
 
 def _distance_wald(
@@ -36,16 +44,16 @@ def _distance_wald(
 
     match interval_type:
         case "two-sided":
-            z = norm.ppf(1 - alpha / 2)
+            z = _norm_ppf(1 - alpha / 2)
             L = proportion - z * se
             U = proportion + z * se
             distance = min(U, 1) - max(L, 0)
         case "lower":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             L = proportion - z * se
             distance = proportion - max(L, 0)
         case "upper":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             U = proportion + z * se
             distance = min(U, 1) - proportion
 
@@ -66,16 +74,16 @@ def _distance_wald_cc(
 
     match interval_type:
         case "two-sided":
-            z = norm.ppf(1 - alpha / 2)
+            z = _norm_ppf(1 - alpha / 2)
             L = proportion - z * se - c
             U = proportion + z * se + c
             distance = min(U, 1) - max(L, 0)
         case "lower":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             L = proportion - z * se - c
             distance = proportion - max(L, 0)
         case "upper":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             U = proportion + z * se + c
             distance = min(U, 1) - proportion
 
@@ -93,7 +101,7 @@ def _distance_wilson(
 
     match interval_type:
         case "two-sided":
-            z = norm.ppf(1 - alpha / 2)
+            z = _norm_ppf(1 - alpha / 2)
             a = 2 * (size + z**2)
             b = 2 * size * proportion + z**2
             c = z**2 + 4 * size * proportion * (1 - proportion)
@@ -102,7 +110,7 @@ def _distance_wilson(
             U = (b + z * sqrt(c)) / a
             distance = U - L
         case "lower":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             a = 2 * (size + z**2)
             b = 2 * size * proportion + z**2
             c = z**2 + 4 * size * proportion * (1 - proportion)
@@ -110,7 +118,7 @@ def _distance_wilson(
             L = (b - z * sqrt(c)) / a
             distance = proportion - L
         case "upper":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             a = 2 * (size + z**2)
             b = 2 * size * proportion + z**2
             c = z**2 + 4 * size * proportion * (1 - proportion)
@@ -132,7 +140,7 @@ def _distance_wilson_cc(
 
     match interval_type:
         case "two-sided":
-            z = norm.ppf(1 - alpha / 2)
+            z = _norm_ppf(1 - alpha / 2)
             a = 2 * (size + z**2)
             b = 2 * size * proportion + z**2
             c1 = z**2 - 1 / size + 4 * size * proportion * (1 - proportion)
@@ -142,7 +150,7 @@ def _distance_wilson_cc(
             U = ((b + 1) + z * sqrt(c1 - c2)) / a
             distance = U - L
         case "lower":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             a = 2 * (size + z**2)
             b = 2 * size * proportion + z**2
             c1 = z**2 - 1 / size + 4 * size * proportion * (1 - proportion)
@@ -151,7 +159,7 @@ def _distance_wilson_cc(
             L = ((b - 1) - z * sqrt(c1 + c2)) / a
             distance = proportion - L
         case "upper":
-            z = norm.ppf(1 - alpha)
+            z = _norm_ppf(1 - alpha)
             a = 2 * (size + z**2)
             b = 2 * size * proportion + z**2
             c1 = z**2 - 1 / size + 4 * size * proportion * (1 - proportion)
@@ -178,19 +186,55 @@ def _distance_clopper_pearson(
 
     match interval_type:
         case "two-sided":
-            L = 1 / (1 + (n * q + 1) / (n * p * f.ppf(alpha / 2, 2 * n * p, 2 * (n * q + 1))))
-            U = 1 / (1 + n * q / ((n * p + 1) * f.ppf(1 - alpha / 2, 2 * (n * p + 1), 2 * n * q)))
+            L = 1 / (1 + (n * q + 1) / (n * p * _f_ppf(alpha / 2, 2 * n * p, 2 * (n * q + 1))))
+            U = 1 / (1 + n * q / ((n * p + 1) * _f_ppf(1 - alpha / 2, 2 * (n * p + 1), 2 * n * q)))
             distance = U - L
         case "lower":
-            L = 1 / (1 + (n * q + 1) / (n * p * f.ppf(alpha, 2 * n * p, 2 * (n * q + 1))))
+            L = 1 / (1 + (n * q + 1) / (n * p * _f_ppf(alpha, 2 * n * p, 2 * (n * q + 1))))
             distance = proportion - L
         case "upper":
-            U = 1 / (1 + n * q / ((n * p + 1) * f.ppf(1 - alpha, 2 * (n * p + 1), 2 * n * q)))
+            U = 1 / (1 + n * q / ((n * p + 1) * _f_ppf(1 - alpha, 2 * (n * p + 1), 2 * n * q)))
             distance = U - proportion
 
     return float(distance)
 
 
+def _distance_clopper_pearson_count(
+    proportion: float,
+    size: ArrayLike,
+    count: ArrayLike,
+    conf_level: float,
+    interval_type: Literal["two-sided", "lower", "upper"],
+) -> np.ndarray:
+    """Calculate the width of the confidence interval or the distance from the proportion to the confidence limit, using the Clopper-Pearson method with `count` events within [0, `size`]."""
+    alpha = 1 - conf_level
+    q = alpha / 2 if interval_type == "two-sided" else alpha
+    size, count = np.broadcast_arrays(np.asarray(size, dtype=float), np.asarray(count, dtype=float))
+
+    match interval_type:
+        case "two-sided":
+            L = np.where(count > 0, _beta_ppf(q, count, size - count + 1), 0)
+            U = np.where(count < size, _beta_ppf(1 - q, count + 1, size - count), 1)
+            return U - L
+        case "lower":
+            L = np.where(count > 0, _beta_ppf(q, count, size - count + 1), 0)
+            return proportion - L
+        case "upper":
+            U = np.where(count < size, _beta_ppf(1 - q, count + 1, size - count), 1)
+            return U - proportion
+
+
+def _distance_clopper_pearson_integer(
+    proportion: float,
+    size: ArrayLike,
+    conf_level: float,
+    interval_type: Literal["two-sided", "lower", "upper"],
+) -> np.ndarray:
+    """Calculate the width of the confidence interval or the distance from the proportion to the confidence limit, using the Clopper-Pearson method with the number of events rounded to an integer."""
+    count = np.floor(np.asarray(size, dtype=float) * proportion + 0.5)
+    return _distance_clopper_pearson_count(proportion, size, count, conf_level, interval_type)
+
+
 def _distance(
     proportion: float,
     size: float,
@@ -198,10 +242,13 @@ def _distance(
     interval_type: Literal["two-sided", "lower", "upper"],
     method: Literal["wald", "wilson", "clopper-pearson", "cp"],
     continuity_correction: bool = False,
+    integer_count: bool = False,
 ) -> float:
     """Calculate the width of the confidence interval or the distance from the proportion to the confidence limit."""
     match method:
         case "clopper-pearson" | "cp":
+            if integer_count:
+                return float(_distance_clopper_pearson_integer(proportion, size, conf_level, interval_type))
             return _distance_clopper_pearson(proportion, size, conf_level, interval_type)
         case "wald":
             if continuity_correction:
@@ -215,6 +262,51 @@ def _distance(
                 return _distance_wilson(proportion, size, conf_level, interval_type)
 
 
+def _integer_count_sizes(
+    proportion: float,
+    distance: float,
+    conf_level: float,
+    interval_type: Literal["two-sided", "lower", "upper"],
+    block: int = 256,
+) -> tuple[int, int]:
+    """Find the sample sizes of the Clopper-Pearson method with the number of events rounded to an integer.
+
+    The distance is not monotone in the sample size, as the rounded number of events moves by jumps relative to the
+    expected one. It is bounded by its values at the numbers of events half an event below and above the expected one,
+    and at the middle of the sample size in between, since the width is unimodal and symmetric in the number of events
+    and the distances to the limits are monotone. These bounds are smooth in the sample size, so the sample sizes at
+    which they reach `distance` are found by integer searches. Between them, the distance is evaluated for blocks of
+    `block` consecutive sample sizes at once.
+
+    Returns:
+        The smallest sample size achieving `distance`, and the sample size from which every larger one achieves it.
+    """
+
+    def bounds(size: float) -> np.ndarray:
+        counts = np.clip([size * proportion - 0.5, size * proportion + 0.5, size / 2], 0, size)
+        counts[2] = np.clip(counts[2], counts[0], counts[1])
+        return _distance_clopper_pearson_count(proportion, size, counts, conf_level, interval_type)
+
+    lo = _min_size(lambda size: bounds(size).min() - distance, 1, decreasing=True)
+    hi = _min_size(lambda size: bounds(size).max() - distance, lo, decreasing=True)
+
+    # `hi` achieves `distance`, as its upper bound does.
+    first, stable = hi, lo
+    for start in range(lo, hi, block):
+        sizes = np.arange(start, min(start + block, hi))
+        achieved = _distance_clopper_pearson_integer(proportion, sizes, conf_level, interval_type) <= distance
+        (hits,) = np.nonzero(achieved)
+        (misses,) = np.nonzero(~achieved)
+        if first == hi and hits.size > 0:
+            first = int(sizes[hits[0]])
+        if misses.size > 0:
+            stable = int(sizes[misses[-1]]) + 1
+
+    return first, stable
+
+
+@_instrument
+@_cached
 def solve_distance(
     *,
     proportion: float,
@@ -223,6 +315,7 @@ def solve_distance(
     interval_type: Literal["two-sided", "lower", "upper"] = "two-sided",
     method: Literal["wald", "wilson", "clopper-pearson", "cp"] = "cp",
     continuity_correction: bool = False,
+    integer_count: bool = False,
 ) -> float:
     """Calculate the confidence interval width or the distance from the proportion to the confidence limit.
 
@@ -250,6 +343,10 @@ def solve_distance(
             - `'clopper-pearson'`, `'cp'`: Clopper-Pearson method.
         continuity_correction:
             Whether to apply the continuity correction, only takes effect when `method` is specified as `'wald'` or `'wilson'`
+        integer_count:
+            Whether to construct the Clopper-Pearson interval from the number of events `size * proportion` rounded to
+            the nearest integer, as it would be observed, rather than from the expected number itself. Only takes
+            effect when `method` is `'clopper-pearson'` or `'cp'`.
 
     Returns:
         The confidence interval width or the distance from the proportion to the confidence limit.
@@ -257,9 +354,11 @@ def solve_distance(
             - If `alternative` is `'two-sided'`, the confidence interval width is returned.
             - If `alternative` is `'less'`, the distance from the proportion to the confidence limit is returned.
     """
-    return _distance(proportion, size, conf_level, interval_type, method, continuity_correction)
+    return _distance(proportion, size, conf_level, interval_type, method, continuity_correction, integer_count)
 
 
+@_instrument
+@_cached
 def solve_size(
     *,
     proportion: float,
@@ -268,6 +367,8 @@ def solve_size(
     interval_type: Literal["two-sided", "lower", "upper"] = "two-sided",
     method: Literal["wald", "wilson", "clopper-pearson", "cp"] = "cp",
     continuity_correction: bool = False,
+    integer_count: bool = False,
+    strict: bool = False,
 ) -> int:
     """Estimate the required sample size.
 
@@ -300,10 +401,23 @@ def solve_size(
             - `'clopper-pearson'`, `'cp'`: Clopper-Pearson method.
         continuity_correction:
             Whether to apply the continuity correction, only takes effect when `method` is specified as `'wald'` or `'wilson'`
+        integer_count:
+            Whether to construct the Clopper-Pearson interval from the number of events `size * proportion` rounded to
+            the nearest integer, as it would be observed, rather than from the expected number itself. Only takes
+            effect when `method` is `'clopper-pearson'` or `'cp'`.
+        strict:
+            Whether to return the sample size from which `distance` is achieved for every larger sample size, rather
+            than the smallest sample size achieving it. It is only used when `integer_count` is `True`.
+
+            With an integer number of events, the distance is not monotone in the sample size, so a few sample sizes
+            slightly larger than the smallest one may fall short of `distance` again.
 
     Returns:
         The required sample size.
     """
+    if method in {"clopper-pearson", "cp"} and integer_count:
+        first, stable = _integer_count_sizes(proportion, distance, conf_level, interval_type)
+        return stable if strict else first
 
     def func(size: float) -> float:
         return _distance(proportion, size, conf_level, interval_type, method, continuity_correction) - distance
@@ -315,7 +429,7 @@ def solve_size(
         alpha = 1 - conf_level
         match interval_type:
             case "two-sided":
-                z = norm.ppf(1 - alpha / 2)
+                z = _norm_ppf(1 - alpha / 2)
 
                 a = 4 * proportion * (1 - proportion)
                 b1 = z**2 + (4 * proportion - 2)
@@ -323,37 +437,40 @@ def solve_size(
                 c = -1
                 lb = max(_domain_square_root_of_quad(a, b1, c)[1][0], _domain_square_root_of_quad(a, b2, c)[1][0])
             case "lower":
-                z = norm.ppf(1 - alpha)
+                z = _norm_ppf(1 - alpha)
 
                 a = 4 * proportion * (1 - proportion)
                 b = z**2 + (4 * proportion - 2)
                 c = -1
                 lb = _domain_square_root_of_quad(a, b, c)[1][0]
             case "upper":
-                z = norm.ppf(1 - alpha)
+                z = _norm_ppf(1 - alpha)
 
                 a = 4 * proportion * (1 - proportion)
                 b = z**2 - (4 * proportion - 2)
                 c = -1
                 lb = _domain_square_root_of_quad(a, b, c)[1][0]
 
-        ub = 1e12
+        ub = SAMPLE_SIZE_SEARCH_MAX
 
         # The width of the confidence interval calculated by wilson score continuity correction does not decreases
         # monotonically as the sample size increases. Instead, it first increases in the small sample range, and as
         # the sample size continues to increase, the width of the confidence interval gradually decreases. Therefore,
         # using brentq directly may not converge. You must first find the maximum value point $n'$ of the confidence
-        # interval, and then limit the search interval of brentq to $(n', 1e12)$ to ensure convergence.
+        # interval, and then limit the search interval to $(n', N_{max})$ to ensure convergence.
         res: OptimizeResult = minimize_scalar(lambda size: -func(size), bounds=(lb, ub))
         if -res.fun < 0:
-            return 2  # Any sample size can meet the requirements, and the minimum allowed sample size 2 is directly returned.
+            # Any sample size can meet the requirements, and the minimum allowed sample size is directly returned.
+            return LOWER_LIMIT_OF_SAMPLE_SIZE
         else:
             lb = max(lb, res.x)
-            return ceil(brentq(func, lb, ub))
+            return _min_size(func, lb, ub, decreasing=True)
     else:
-        return ceil(brentq(func, 1e-12, 1e12))
+        return _min_size(func, 1e-12, decreasing=True)
 
 
+@_instrument
+@_cached
 def solve_proportion(
     *,
     size: int,
@@ -413,6 +530,6 @@ def solve_proportion(
     else:
         match direction:
             case "greater":
-                return float(brentq(func, 0.5, 1 - 1e-12))
+                return float(_root(func, 0.5, 1 - 1e-12))
             case "less":
-                return float(brentq(func, 1e-12, 0.5))
+                return float(_root(func, 1e-12, 0.5))
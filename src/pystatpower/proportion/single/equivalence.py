@@ -9,11 +9,15 @@ This module provides functions to calculate or estimate the following parameters
 - sample size
 """
 
-from math import ceil
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
+
+from ..._solver import _min_size
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ._power import _power as _raw_power
 
 
@@ -35,6 +39,8 @@ def _power(
     )
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
     proportion: float,
@@ -77,6 +83,58 @@ def solve_power(
     return _power(proportion, null_proportion, margin_lower, margin_upper, size, alpha, method, continuity_correction)
 
 
+def power_curve(
+    *,
+    proportion: float,
+    null_proportion: float,
+    margin_lower: float,
+    margin_upper: float,
+    sizes: ArrayLike,
+    alpha: float = 0.025,
+    method: Literal["z-p0", "z-phat"] = "z-phat",
+    continuity_correction: bool = False,
+) -> np.ndarray:
+    """Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        proportion:
+            Proportion under the alternative hypothesis.
+        null_proportion:
+            Proportion under the null hypothesis.
+        margin_lower:
+            The lower equivalence margin, must be a negative value.
+        margin_upper:
+            The upper equivalence margin, must be a positive value.
+        sizes:
+            Sample sizes at which the power is evaluated.
+        alpha:
+            Significance level.
+
+            The equivalence test is a two one-sided test, with a significance level of 0.025 being commonly used.
+        method:
+            The method used to construct the test statistic.
+
+            - `'z-p0'`: Standard normal distribution (large sample approximation), using p0 to calculate the variance.
+            - `'z-phat'`: Standard normal distribution (large sample approximation), using phat to calculate the variance.
+        continuity_correction:
+            Whether to apply the continuity correction.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    return np.asarray(
+        _power(proportion, null_proportion, margin_lower, margin_upper, sizes, alpha, method, continuity_correction),
+        dtype=float,
+    )
+
+
+@_instrument
+@_cached
 def solve_size(
     *,
     proportion: float,
@@ -125,4 +183,4 @@ def solve_size(
             - power
         )
 
-    return ceil(brentq(func, 1e-12, 1e12))
+    return _min_size(func, 1e-12)
@@ -11,15 +11,27 @@ This module provides functions to calculate or estimate the following parameters
 - proportion under the null hypothesis
 """
 
-from math import ceil
+from math import floor
+from math import sqrt
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
+
+from ..._constant import SAMPLE_SIZE_SEARCH_MAX
+from ..._distributions import _binom_pmf
+from ..._distributions import _norm_ppf
+from ..._solver import _min_size
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ._power import _min_nonneg
 from ._power import _power
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
     proportion: float,
@@ -65,6 +77,60 @@ def solve_power(
     return _power(proportion, null_proportion, size, alternative, alpha, method, continuity_correction)
 
 
+def power_curve(
+    *,
+    proportion: float,
+    null_proportion: float,
+    sizes: ArrayLike,
+    alternative: Literal["two-sided", "greater", "less"] = "two-sided",
+    alpha: float = 0.05,
+    method: Literal["exact", "z-p0", "z-phat"] = "exact",
+    continuity_correction: bool = False,
+) -> np.ndarray:
+    """Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        proportion:
+            Proportion under the alternative hypothesis.
+        null_proportion:
+            Proportion under the null hypothesis.
+        sizes:
+            Sample sizes at which the power is evaluated.
+        alternative:
+            Type of the alternative hypothesis:
+
+            - If `alternative` is `'two-sided'`, the alternative hypothesis is $p ≠ p_0$
+            - If `alternative` is `'greater'`, the alternative hypothesis is $p > p_0$
+            - If `alternative` is `'less'`, the alternative hypothesis is $p < p_0$
+        alpha:
+            Significance level.
+
+            - If `alternative` is `'two-sided'`, `alpha` represents the two-sided significance level.
+            - If `alternative` is `'greater'` or `'less'`, `alpha` represents the one-sided significance level.
+        method:
+            The method used to construct the test statistic.
+
+            - `'exact'`: Binomial distribution.
+            - `'z-p0'`: Standard normal distribution (large sample approximation), using p0 to calculate the variance.
+            - `'z-phat'`: Standard normal distribution (large sample approximation), using phat to calculate the variance.
+        continuity_correction:
+            Whether to apply the continuity correction.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    return np.asarray(
+        _power(proportion, null_proportion, sizes, alternative, alpha, method, continuity_correction), dtype=float
+    )
+
+
+@_instrument
+@_cached
 def solve_size(
     *,
     proportion: float,
@@ -74,6 +140,7 @@ def solve_size(
     power: float = 0.8,
     method: Literal["exact", "z-p0", "z-phat"] = "exact",
     continuity_correction: bool = False,
+    strict: bool = False,
 ) -> int:
     """Estimate the required sample size.
 
@@ -105,20 +172,44 @@ def solve_size(
             - `'z-phat'`: Standard normal distribution (large sample approximation), using phat to calculate the variance.
         continuity_correction:
             Whether to apply the continuity correction.
+        strict:
+            Whether to return the sample size from which the power stays above `power` for every larger sample size,
+            rather than the smallest sample size achieving `power`. It is only used when `method` is `'exact'`.
+
+            The power of the exact test is not monotone in the sample size, so a few sample sizes slightly larger
+            than the smallest one may fall short of `power` again.
 
     Returns:
         The required sample size.
+
+    Raises:
+        SolutionNotFoundError: If `method` is `'exact'` and no sample size achieves `power`.
     """
 
     def func(size: float) -> float:
         return _power(proportion, null_proportion, size, alternative, alpha, method, continuity_correction) - power
 
     if method == "exact":
-        return _min_nonneg(func, bounds=(1, 1e12))
+        # The sample size of the normal approximation serves as the starting point of the exact search.
+        anchor = None
+        if proportion != null_proportion:
+            z_alpha = _norm_ppf(1 - alpha / 2) if alternative == "two-sided" else _norm_ppf(1 - alpha)
+            z_beta = _norm_ppf(power)
+            sd_null, sd_alt = sqrt(null_proportion * (1 - null_proportion)), sqrt(proportion * (1 - proportion))
+            anchor = float(((z_alpha * sd_null + z_beta * sd_alt) / (proportion - null_proportion)) ** 2)
+
+        # The saw-tooth of the exact power is bounded by the probability of the outcomes at the critical values.
+        def amplitude(size: int) -> float:
+            tails = 2 if alternative == "two-sided" else 1
+            return tails * float(_binom_pmf(floor((size + 1) * proportion), size, proportion))
+
+        return _min_nonneg(func, bounds=(1, SAMPLE_SIZE_SEARCH_MAX), anchor=anchor, amplitude=amplitude, strict=strict)
     else:
-        return ceil(brentq(func, 1e-12, 1e12))
+        return _min_size(func, 1e-12)
 
 
+@_instrument
+@_cached
 def solve_proportion(
     *,
     null_proportion: float,
@@ -191,11 +282,13 @@ def solve_proportion(
 
     match direction:
         case "greater":
-            return float(brentq(func, null_proportion, 1 - 1e-12))
+            return float(_root(func, null_proportion, 1 - 1e-12))
         case "less":
-            return float(brentq(func, 1e-12, null_proportion))
+            return float(_root(func, 1e-12, null_proportion))
 
 
+@_instrument
+@_cached
 def solve_null_proportion(
     *,
     proportion: float,
@@ -272,6 +365,6 @@ def solve_null_proportion(
 
     match direction:
         case "greater":
-            return float(brentq(func, proportion, 1 - 1e-12))
+            return float(_root(func, proportion, 1 - 1e-12))
         case "less":
-            return float(brentq(func, 1e-12, proportion))
+            return float(_root(func, 1e-12, proportion))
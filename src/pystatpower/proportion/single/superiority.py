@@ -13,11 +13,16 @@ This module provides functions to calculate or estimate the following parameters
 - superiority margin
 """
 
-from math import ceil
 from typing import Literal
 
-from scipy.optimize import brentq
+import numpy as np
 
+from numpy.typing import ArrayLike
+
+from ..._solver import _min_size
+from ..._solver import _root
+from ...cache import _cached
+from ...diagnostics import _instrument
 from ._power import _power
 
 
@@ -43,6 +48,8 @@ def _verify_and_get_sup_proportion(
     return superiority_proportion
 
 
+@_instrument
+@_cached
 def solve_power(
     *,
     proportion: float,
@@ -112,6 +119,85 @@ def solve_power(
     return _power(proportion, superiority_proportion, size, alternative, alpha, method, continuity_correction)
 
 
+def power_curve(
+    *,
+    proportion: float,
+    null_proportion: float | None = None,
+    margin: float | None = None,
+    superiority_proportion: float | None = None,
+    sizes: ArrayLike,
+    alternative: Literal["greater", "less"],
+    alpha: float = 0.025,
+    method: Literal["z-p0", "z-phat"] = "z-phat",
+    continuity_correction: bool = False,
+) -> np.ndarray:
+    r"""Calculate the statistical power over a range of sample sizes.
+
+    The power is evaluated at all sample sizes in a single vectorized call of the underlying power function, rather
+    than by calling `solve_power` once per sample size.
+
+    Args:
+        proportion:
+            Proportion under the alternative hypothesis.
+        null_proportion:
+            Proportion under the null hypothesis.
+
+            Ignored if `superiority_proportion` is specified; otherwise, required along with `margin`.
+        margin:
+            The superiority margin.
+
+            Ignored if `superiority_proportion` is specified; otherwise, required along with `null_proportion`.
+
+            !!! tip
+
+                Regardless of whether `alternative` is specified as `'greater'` or `'less'`, you can always specify this
+                parameter as either positive or negative, as you prefer. Internally, the value of `margin` is converted
+                before actual calculation takes place.
+
+                - If `alternative` is `'greater'`, the internally used margin is `abs(margin)`.
+                - If `alternative` is `'less'`, the internally used margin is `-abs(margin)`.
+        superiority_proportion:
+            The superiority proportion.
+
+            Required if either `null_proportion` or `margin` is omitted.
+        sizes:
+            Sample sizes at which the power is evaluated.
+        alternative:
+            Type of the alternative hypothesis:
+
+            - If `alternative` is `'greater'`, the alternative hypothesis is $p - p_0 > \\delta \\ (\\delta > 0)$
+            - If `alternative` is `'less'`, the alternative hypothesis is $p - p_0 < \\delta \\ (\\delta < 0)$
+        alpha:
+            Significance level.
+
+            The superiority test is a one-sided test, with a significance level of 0.025 being commonly used.
+        method:
+            The method used to construct the test statistic.
+
+            - `'z-p0'`: Standard normal distribution (large sample approximation), using p0 to calculate the variance.
+            - `'z-phat'`: Standard normal distribution (large sample approximation), using phat to calculate the variance.
+        continuity_correction:
+            Whether to apply the continuity correction.
+
+    Returns:
+        The statistical power of the test at each sample size, with the same shape as `sizes`.
+
+    Raises:
+        ValueError: If `superiority_proportion` is omitted, and either `null_proportion` or `margin` is missing.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+
+    margin = _margin(margin, alternative)
+    superiority_proportion = _verify_and_get_sup_proportion(null_proportion, margin, superiority_proportion)
+
+    return np.asarray(
+        _power(proportion, superiority_proportion, sizes, alternative, alpha, method, continuity_correction),
+        dtype=float,
+    )
+
+
+@_instrument
+@_cached
 def solve_size(
     *,
     proportion: float,
@@ -185,9 +271,11 @@ def solve_size(
             _power(proportion, superiority_proportion, size, alternative, alpha, method, continuity_correction) - power
         )
 
-    return ceil(brentq(func, 1e-12, 1e12))
+    return _min_size(func, 1e-12)
 
 
+@_instrument
+@_cached
 def solve_proportion(
     *,
     null_proportion: float | None = None,
@@ -291,11 +379,13 @@ def solve_proportion(
     eps = 1e-12
     match alternative:
         case "greater":
-            return float(brentq(func, superiority_proportion + eps, 1 - eps))
+            return float(_root(func, superiority_proportion + eps, 1 - eps))
         case "less":
-            return float(brentq(func, eps, superiority_proportion - eps))
+            return float(_root(func, eps, superiority_proportion - eps))
 
 
+@_instrument
+@_cached
 def solve_null_proportion(
     *,
     proportion: float,
@@ -389,11 +479,13 @@ def solve_null_proportion(
     eps = 1e-12
     match alternative:
         case "greater":
-            return float(brentq(func, eps, min(proportion - margin, 1 - margin) - eps))
+            return float(_root(func, eps, min(proportion - margin, 1 - margin) - eps))
         case "less":
-            return float(brentq(func, max(proportion - margin, -margin) + eps, 1 - eps))
+            return float(_root(func, max(proportion - margin, -margin) + eps, 1 - eps))
 
 
+@_instrument
+@_cached
 def solve_superiority_proportion(
     *,
     proportion: float,
@@ -469,11 +561,13 @@ def solve_superiority_proportion(
     eps = 1e-12
     match alternative:
         case "greater":
-            return float(brentq(func, eps, proportion - eps))
+            return float(_root(func, eps, proportion - eps))
         case "less":
-            return float(brentq(func, proportion + eps, 1 - eps))
+            return float(_root(func, proportion + eps, 1 - eps))
 
 
+@_instrument
+@_cached
 def solve_margin(
     *,
     proportion: float,
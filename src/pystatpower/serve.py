@@ -0,0 +1,448 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""A local HTTP/JSON service for the solve functions.
+
+```console
+$ python -m pystatpower.serve --port 8000
+$ curl -d '{"diff": 1, "std": 2}' http://127.0.0.1:8000/mean/single/inequality/solve_size
+{"value": 34}
+```
+
+Every `solve_*` and `power_curve` function of the package is served at the path of its qualified name, with dots or
+slashes, e.g. `POST /mean.single.inequality.solve_size`. The body is a JSON object of the keyword arguments, and the
+reply is `{"value": ...}`, or `{"error": {"type": ..., "message": ...}}` with status 422 if the solve failed, e.g.
+with a `SolutionNotFoundError`, or 400 if the arguments are invalid. A JSON array of such objects is solved as a batch,
+and answered with the array of the replies, with status 200.
+
+The service also answers:
+
+- `GET /functions`, the qualified names of the functions;
+- `GET /metrics`, the counters of requests, errors, batches and cache, and the wall time per function;
+- `GET /health`, `{"status": "ok"}`.
+
+The solves run on a pool of worker processes, started and warmed up (NumPy, SciPy and the solve functions imported)
+with the service, so that requests do not pay for them. Concurrent requests are collected for `--batch-window`
+milliseconds and sent to the workers together, where those differing only in parameters accepting array-likes are
+solved in one vectorized call, as in `batch.run`. Results are kept in an in-memory LRU cache of `--cache-size` entries.
+
+The service binds to `127.0.0.1` by default, and needs no network access beyond its own socket.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import queue
+import threading
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from time import monotonic
+from time import perf_counter
+from typing import Any
+
+from .aio import _key
+from .batch import Result
+from .batch import _jsonable
+from .batch import _resolve
+from .batch import _solve_chunk
+
+
+def _functions() -> list[str]:
+    """Return the qualified names of all the solve functions of the package, importing their modules."""
+    package = importlib.import_module(__package__)
+    names = []
+    for info in pkgutil.walk_packages(package.__path__, f"{__package__}."):
+        if info.name.rpartition(".")[2].startswith("_") or info.name.count(".") < 2:
+            continue
+        module = importlib.import_module(info.name)
+        names += [
+            f"{info.name.removeprefix(f'{__package__}.')}.{name}"
+            for name, func in vars(module).items()
+            if name.startswith(("solve_", "power_curve")) and getattr(func, "__module__", None) == info.name
+        ]
+    return sorted(names)
+
+
+def _error(error: BaseException) -> dict[str, Any]:
+    """Describe an exception in a reply."""
+    return {"error": {"type": type(error).__name__, "message": str(error)}}
+
+
+class _Batcher:
+    """Collects the scenarios submitted within a time window, and sends them to the workers in chunks per function."""
+
+    def __init__(self, executor: ProcessPoolExecutor, window: float, max_batch: int, metrics: "_Metrics") -> None:
+        self._executor = executor
+        self._window = window
+        self._max_batch = max_batch
+        self._metrics = metrics
+        self._queue: queue.SimpleQueue[tuple[str, Mapping[str, Any], Future[Result]] | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._collect, name="pystatpower-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, function: str, params: Mapping[str, Any]) -> Future[Result]:
+        """Submit a scenario, whose result is delivered to the returned future."""
+        future: Future[Result] = Future()
+        self._queue.put((function, params, future))
+        return future
+
+    def close(self) -> None:
+        """Stop collecting scenarios, once those already submitted are sent."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self) -> None:
+        while (item := self._queue.get()) is not None:
+            items = [item]
+            deadline = monotonic() + self._window
+            while len(items) < self._max_batch and (timeout := deadline - monotonic()) > 0:
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                items.append(item)
+
+            groups: dict[str, list[tuple[Mapping[str, Any], Future[Result]]]] = {}
+            for function, params, future in items:
+                groups.setdefault(function, []).append((params, future))
+            for function, group in groups.items():
+                self._metrics.add_batch(len(group))
+                self._send(function, group)
+
+    def _send(self, function: str, group: list[tuple[Mapping[str, Any], Future[Result]]]) -> None:
+        chunk = self._executor.submit(_solve_chunk, function, [params for params, _ in group])
+        chunk.add_done_callback(partial(self._deliver, function, group))
+
+    def _deliver(
+        self, function: str, group: list[tuple[Mapping[str, Any], Future[Result]]], chunk: Future[list[Result]]
+    ) -> None:
+        error = chunk.exception()
+        if error is None:
+            for (_, future), result in zip(group, chunk.result(), strict=True):
+                future.set_result(result)
+        elif len(group) > 1:
+            # An exception not captured per scenario, e.g. a `TypeError` for a misspelled parameter, aborted the chunk,
+            # so isolate the scenario raising it by sending each one on its own.
+            for item in group:
+                self._send(function, [item])
+        else:
+            group[0][1].set_exception(error)
+
+
+class _Metrics:
+    """Counters of the service, shared by the threads handling the requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._start = monotonic()
+        self.requests = 0
+        self.batches = 0
+        self.batched_scenarios = 0
+        self.functions: dict[str, dict[str, float]] = {}
+
+    def add_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def add_batch(self, size: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.batched_scenarios += size
+
+    def add_scenario(self, function: str, *, error: bool, cached: bool, wall_time: float) -> None:
+        with self._lock:
+            counters = self.functions.setdefault(
+                function, {"scenarios": 0, "errors": 0, "cache_hits": 0, "wall_time": 0.0}
+            )
+            counters["scenarios"] += 1
+            counters["errors"] += error
+            counters["cache_hits"] += cached
+            counters["wall_time"] += wall_time
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            functions = {name: dict(counters) for name, counters in self.functions.items()}
+            return {
+                "uptime": monotonic() - self._start,
+                "requests": self.requests,
+                "scenarios": sum(counters["scenarios"] for counters in functions.values()),
+                "errors": sum(counters["errors"] for counters in functions.values()),
+                "batches": self.batches,
+                "mean_batch_size": self.batched_scenarios / self.batches if self.batches else 0.0,
+                "functions": functions,
+            }
+
+
+class _Cache:
+    """An in-memory LRU cache of the results, shared by the threads handling the requests."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[Any, ...] | None) -> tuple[bool, Any]:
+        with self._lock:
+            if key is None or key not in self._entries:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def put(self, key: tuple[Any, ...] | None, value: Any) -> None:
+        if key is None or self.max_entries == 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def to_dict(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+def _warm_up() -> None:
+    """Import NumPy, SciPy and all the solve functions in a worker process."""
+    _functions()
+
+
+class Server:
+    """The HTTP/JSON service, see the module documentation.
+
+    Attributes:
+        address:
+            The host and port the service is bound to. Port 0 binds to a free port.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        *,
+        workers: int | None = None,
+        batch_window: float = 0.002,
+        max_batch: int = 256,
+        cache_size: int = 100_000,
+        verbose: bool = False,
+    ) -> None:
+        """Start the worker processes and bind the socket. Requests are only served by `serve_forever`.
+
+        Args:
+            host:
+                The host to bind to.
+            port:
+                The port to bind to, or 0 for a free port.
+            workers:
+                Number of worker processes. Defaults to the number of CPUs.
+            batch_window:
+                Time during which concurrent requests are collected into one batch, in seconds.
+            max_batch:
+                Maximum number of scenarios in a batch.
+            cache_size:
+                Maximum number of results in the cache. 0 disables the cache.
+            verbose:
+                Whether to log every request to the standard error.
+
+        Raises:
+            ValueError: If `workers` or `max_batch` is not a positive integer, or `batch_window` or `cache_size` is
+                negative.
+        """
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        if workers < 1 or max_batch < 1:
+            msg = "'workers' and 'max_batch' must be positive integers."
+            raise ValueError(msg)
+        if batch_window < 0 or cache_size < 0:
+            msg = "'batch_window' and 'cache_size' must not be negative."
+            raise ValueError(msg)
+
+        self.functions = _functions()
+        self.workers = workers
+        self.verbose = verbose
+        self.metrics = _Metrics()
+        self.cache = _Cache(cache_size)
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        for future in [self._executor.submit(_warm_up) for _ in range(workers)]:
+            future.result()
+        self._batcher = _Batcher(self._executor, batch_window, max_batch, self.metrics)
+
+        self._http = _HTTPServer((host, port), _Handler)
+        self._http.app = self
+        bound_host, bound_port = self._http.server_address[:2]
+        self.address = (str(bound_host), int(bound_port))
+
+    def solve(self, function: str, rows: Sequence[Any]) -> list[tuple[HTTPStatus, dict[str, Any]]]:
+        """Solve the scenarios of a request, returning the status and reply of each one."""
+        start = perf_counter()
+        replies: list[Any] = [None] * len(rows)
+        pending = []
+        for i, row in enumerate(rows):
+            if not isinstance(row, dict):
+                replies[i] = HTTPStatus.BAD_REQUEST, _error(TypeError("Scenarios must be JSON objects."))
+                continue
+            key = _key(function, row)
+            found, value = self.cache.get(key)
+            if found:
+                replies[i] = HTTPStatus.OK, {"value": value}
+                self.metrics.add_scenario(function, error=False, cached=True, wall_time=perf_counter() - start)
+            else:
+                pending.append((i, key, self._batcher.submit(function, row)))
+
+        for i, key, future in pending:
+            error = future.exception()
+            if error is not None:
+                replies[i] = HTTPStatus.BAD_REQUEST, _error(error)
+            elif (result := future.result()).ok:
+                value = _jsonable(result.value)
+                self.cache.put(key, value)
+                replies[i] = HTTPStatus.OK, {"value": value}
+            else:
+                replies[i] = HTTPStatus.UNPROCESSABLE_ENTITY, _error(result.error)
+            status = replies[i][0]
+            self.metrics.add_scenario(
+                function, error=status != HTTPStatus.OK, cached=False, wall_time=perf_counter() - start
+            )
+        return replies
+
+    def stats(self) -> dict[str, Any]:
+        """Return the metrics of the service."""
+        return self.metrics.to_dict() | {"workers": self.workers, "cache": self.cache.to_dict()}
+
+    def serve_forever(self) -> None:
+        """Serve requests until `shutdown` is called."""
+        self._http.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serving requests from another thread than `serve_forever`, and stop the worker processes."""
+        self._http.shutdown()
+        self.close()
+
+    def close(self) -> None:
+        """Close the socket and stop the worker processes."""
+        self._http.server_close()
+        self._batcher.close()
+        self._executor.shutdown(cancel_futures=True)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """The HTTP server of a `Server`, handling each request in a thread."""
+
+    daemon_threads = True
+    app: Server
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handles the requests of a `Server`."""
+
+    server_version = "pystatpower"
+
+    server: "_HTTPServer"
+
+    @property
+    def app(self) -> Server:
+        return self.server.app
+
+    def do_GET(self) -> None:
+        self.app.metrics.add_request()
+        path = self.path.partition("?")[0].rstrip("/")
+        if path == "/metrics":
+            self._reply(HTTPStatus.OK, self.app.stats())
+        elif path == "/functions":
+            self._reply(HTTPStatus.OK, self.app.functions)
+        elif path in {"", "/health"}:
+            self._reply(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, _error(LookupError(f"No resource at '{path}'.")))
+
+    def do_POST(self) -> None:
+        self.app.metrics.add_request()
+        function = self.path.partition("?")[0].strip("/").replace("/", ".")
+        try:
+            _resolve(function)
+        except ValueError as e:
+            self._reply(HTTPStatus.NOT_FOUND, _error(e))
+            return
+
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        except ValueError as e:
+            self._reply(HTTPStatus.BAD_REQUEST, _error(e))
+            return
+
+        if isinstance(payload, list):
+            self._reply(HTTPStatus.OK, [reply for _, reply in self.app.solve(function, payload)])
+        else:
+            self._reply(*self.app.solve(function, [payload])[0])
+
+    def _reply(self, status: HTTPStatus, body: Any) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: Any) -> None:
+        if self.app.verbose:
+            super().log_message(*args)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the service until interrupted.
+
+    Args:
+        argv:
+            The command line arguments. Defaults to `sys.argv[1:]`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m pystatpower.serve", description="Serve the solve functions.")
+    parser.add_argument("--host", default="127.0.0.1", help="host to bind to (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8000, help="port to bind to (default: %(default)s)")
+    parser.add_argument("--workers", type=int, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument(
+        "--batch-window", type=float, default=2.0, help="batching window in milliseconds (default: %(default)s)"
+    )
+    parser.add_argument("--max-batch", type=int, default=256, help="maximum batch size (default: %(default)s)")
+    parser.add_argument(
+        "--cache-size", type=int, default=100_000, help="maximum number of cached results (default: %(default)s)"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    args = parser.parse_args(argv)
+
+    server = Server(
+        args.host,
+        args.port,
+        workers=args.workers,
+        batch_window=args.batch_window / 1000,
+        max_batch=args.max_batch,
+        cache_size=args.cache_size,
+        verbose=args.verbose,
+    )
+    host, port = server.address
+    print(f"Serving {len(server.functions)} functions on http://{host}:{port} with {server.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Monte Carlo verification of the analytic power.
+
+`simulate_power` estimates the power of the test behind an analytic power function by simulating the test many times,
+and reports it with its Monte Carlo standard error next to the analytic value:
+
+```python
+from pystatpower import simulation
+
+result = simulation.simulate_power(
+    "mean.independent",
+    diff=0.5,
+    margin=0,
+    treatment_std=1,
+    reference_std=1.5,
+    treatment_size=40,
+    reference_size=60,
+    alternative="two-sided",
+    alpha=0.05,
+    dist="t",
+    equal_var=False,
+    approx_t_method="satterthwaite",
+    replicates=1_000_000,
+    seed=2024,
+)
+result.power, result.mcse, result.analytic
+```
+
+The analytic power functions are the kernels shared by the solve functions of a family, which take the parameters of
+the test itself, e.g. the offset of the mean from the null bound rather than the mean and the margin:
+
+- `'mean.single'`: `offset`, `std`, `size`, `alternative`, `alpha`, `dist`;
+- `'mean.independent'`: `diff`, `margin`, `std` or `treatment_std` and `reference_std`, `treatment_size`,
+  `reference_size`, `alternative`, `alpha`, `dist`, `equal_var`, `approx_t_method`;
+- `'proportion.single'`: `proportion`, `proportion_threshold`, `size`, `alternative`, `alpha`, `method`,
+  `continuity_correction`;
+- `'proportion.independent'`: `treatment_proportion`, `reference_proportion`, `proportion_threshold`,
+  `treatment_size`, `reference_size`, `alternative`, `alpha`, `method`, `continuity_correction`;
+- `'correlation'`: `null_correlation`, `correlation`, `alternative`, `size`, `alpha`.
+
+`alternative` is one of `'two-sided'`, `'greater'` and `'less'`.
+
+Each replicate draws the sufficient statistics of a sample, which have the same distribution as those of simulated
+observations, and applies the test statistic to them: the sample means and variances of normal observations, the
+event counts of Bernoulli observations, and the Wishart-distributed cross-products of bivariate normal observations.
+The replicates are simulated with NumPy in chunks of `chunksize`, each with its own random generator spawned from a
+`SeedSequence`, so that the result only depends on `seed`, `replicates` and `chunksize`, and not on the number of
+worker processes.
+"""
+
+import importlib
+import os
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from math import sqrt
+from numbers import Real
+from typing import Any
+
+import numpy as np
+
+from scipy.special import ndtr
+from scipy.special import stdtr
+
+_KERNELS = {
+    "mean.single": "mean.single._power",
+    "mean.independent": "mean.independent._power",
+    "proportion.single": "proportion.single._power",
+    "proportion.independent": "proportion.independent._power",
+    "correlation": "correlation.inequality",
+}
+"""The module of the analytic power function `_power` of each family."""
+
+
+@dataclass(frozen=True)
+class Simulation:
+    """The simulated and analytic power of a test.
+
+    Attributes:
+        family:
+            The family of the analytic power function, e.g. `'mean.single'`.
+        params:
+            The parameters of the test.
+        replicates:
+            Number of simulated tests.
+        rejections:
+            Number of simulated tests rejecting the null hypothesis.
+        analytic:
+            The analytic power.
+        seed:
+            The entropy of the `SeedSequence` of the simulation, which reproduces it.
+    """
+
+    family: str
+    params: dict[str, Any]
+    replicates: int
+    rejections: int
+    analytic: float
+    seed: int
+
+    @property
+    def power(self) -> float:
+        """The simulated power."""
+        return self.rejections / self.replicates
+
+    @property
+    def mcse(self) -> float:
+        """The Monte Carlo standard error of the simulated power."""
+        return sqrt(self.power * (1 - self.power) / self.replicates)
+
+    @property
+    def z(self) -> float:
+        """The difference between the simulated and analytic power, in Monte Carlo standard errors."""
+        # Use the standard error at the analytic power, which is not zero when no simulated test rejects.
+        se = sqrt(self.analytic * (1 - self.analytic) / self.replicates)
+        return (self.power - self.analytic) / se if se > 0 else 0.0 if self.power == self.analytic else np.inf
+
+
+def _size(value: Any, name: str) -> int:
+    """Check that a sample size is a positive integer."""
+    if not isinstance(value, Real) or value < 2 or value != int(value):
+        msg = f"'{name}' must be an integer greater than 1 to be simulated."
+        raise ValueError(msg)
+    return int(value)
+
+
+def _rejections(lower: np.ndarray, alternative: str, alpha: float, upper: np.ndarray | None = None) -> int:
+    """Count the tests rejecting the null hypothesis, given the lower tail probabilities of their statistics.
+
+    With a continuity correction, the statistics compared with the upper and lower critical values differ, in which
+    case `upper` holds the lower tail probabilities of the former.
+    """
+    upper = lower if upper is None else upper
+    match alternative:
+        case "two-sided":
+            rejected = (upper >= 1 - alpha / 2) | (lower <= alpha / 2)
+        case "greater":
+            rejected = upper >= 1 - alpha
+        case "less":
+            rejected = lower <= alpha
+    return int(np.count_nonzero(rejected))
+
+
+def _simulate_mean_single(
+    rng: np.random.Generator,
+    count: int,
+    *,
+    offset: float,
+    std: float,
+    size: int,
+    alternative: str,
+    alpha: float,
+    dist: str = "t",
+) -> int:
+    """Simulate the one-sample z or t test of normal observations."""
+    n = _size(size, "size")
+    mean = rng.normal(offset, std / sqrt(n), count)
+    if dist == "z":
+        return _rejections(ndtr(mean / (std / sqrt(n))), alternative, alpha)
+
+    sd = std * np.sqrt(rng.chisquare(n - 1, count) / (n - 1))
+    return _rejections(stdtr(n - 1, mean / (sd / sqrt(n))), alternative, alpha)
+
+
+def _simulate_mean_independent(
+    rng: np.random.Generator,
+    count: int,
+    *,
+    diff: float,
+    margin: float,
+    treatment_std: float | None = None,
+    reference_std: float | None = None,
+    std: float | None = None,
+    treatment_size: int,
+    reference_size: int,
+    alternative: str,
+    alpha: float,
+    dist: str,
+    equal_var: bool,
+    approx_t_method: str,
+) -> int:
+    """Simulate the two-sample z, t, Welch or Satterthwaite test of normal observations.
+
+    The degrees of freedom of the Welch and Satterthwaite tests are computed from the sample variances of each
+    replicate, as the tests do, while the analytic power computes them once from the population variances. The two
+    therefore differ slightly with unequal variances and small samples, beyond the Monte Carlo error, e.g. 0.1700
+    simulated versus 0.1710 analytic for the Satterthwaite test with standard deviations 1 and 2 and sizes 10 and 30.
+    """
+    n1, n2 = _size(treatment_size, "treatment_size"), _size(reference_size, "reference_size")
+    sd1, sd2 = (std, std) if dist == "z" and equal_var else (treatment_std, reference_std)
+    effect = rng.normal(diff, sqrt(sd1**2 / n1 + sd2**2 / n2), count) - margin
+    if dist == "z":
+        se = std * sqrt(1 / n1 + 1 / n2) if equal_var else sqrt(sd1**2 / n1 + sd2**2 / n2)
+        return _rejections(ndtr(effect / se), alternative, alpha)
+
+    var1 = sd1**2 * rng.chisquare(n1 - 1, count) / (n1 - 1)
+    var2 = sd2**2 * rng.chisquare(n2 - 1, count) / (n2 - 1)
+    if equal_var:
+        df = n1 + n2 - 2
+        se = np.sqrt(((n1 - 1) * var1 + (n2 - 1) * var2) / df * (1 / n1 + 1 / n2))
+    else:
+        se = np.sqrt(var1 / n1 + var2 / n2)
+        if approx_t_method == "welch":
+            df = se**4 / (var1**2 / (n1**2 * (n1 + 1)) + var2**2 / (n2**2 * (n2 + 1))) - 2
+        else:
+            df = se**4 / (var1**2 / (n1**2 * (n1 - 1)) + var2**2 / (n2**2 * (n2 - 1)))
+    return _rejections(stdtr(df, effect / se), alternative, alpha)
+
+
+def _simulate_proportion_single(
+    rng: np.random.Generator,
+    count: int,
+    *,
+    proportion: float,
+    proportion_threshold: float,
+    size: int,
+    alternative: str,
+    alpha: float,
+    method: str,
+    continuity_correction: bool,
+) -> int:
+    """Simulate the exact binomial test, or the z test with the variance at the null or estimated proportion."""
+    from .proportion.single._power import _critical_counts
+
+    n = _size(size, "size")
+    events = rng.binomial(n, proportion, count)
+    if method == "exact":
+        reject_L, reject_U = _critical_counts(proportion_threshold, n, alternative, alpha)
+        return int(np.count_nonzero((events <= reject_L) | (events > reject_U)))
+
+    offset = events / n - proportion_threshold
+    if method == "z-p0":
+        se = sqrt(proportion_threshold * (1 - proportion_threshold) / n)
+    else:
+        se = np.sqrt(events / n * (1 - events / n) / n)
+    c = np.where(np.abs(offset) > 1 / (2 * n), 1 / (2 * n), 0) if continuity_correction else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _rejections(ndtr((offset + c) / se), alternative, alpha, upper=ndtr((offset - c) / se))
+
+
+def _simulate_proportion_independent(
+    rng: np.random.Generator,
+    count: int,
+    *,
+    treatment_proportion: float,
+    reference_proportion: float,
+    proportion_threshold: float,
+    treatment_size: int,
+    reference_size: int,
+    alternative: str,
+    alpha: float,
+    method: str,
+    continuity_correction: bool,
+) -> int:
+    """Simulate the exact unconditional test, or the z test with pooled or unpooled variance, of two proportions."""
+    from .proportion.independent._power import _exact_region
+
+    n1, n2 = _size(treatment_size, "treatment_size"), _size(reference_size, "reference_size")
+    events1 = rng.binomial(n1, treatment_proportion, count)
+    events2 = rng.binomial(n2, reference_proportion, count)
+    if method == "exact":
+        return int(np.count_nonzero(_exact_region(n1, n2, alternative, alpha)[events1, events2]))
+
+    p1, p2 = events1 / n1, events2 / n2
+    effect = p1 - p2 - (proportion_threshold - reference_proportion)
+    if method == "z-pooled":
+        pooled = (n1 * p1 + n2 * p2) / (n1 + n2)
+        se = np.sqrt(pooled * (1 - pooled) * (1 / n1 + 1 / n2))
+    else:
+        se = np.sqrt(p1 * (1 - p1) / n1 + p2 * (1 - p2) / n2)
+    c = (1 / n1 + 1 / n2) / 2 if continuity_correction else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _rejections(ndtr((effect + c) / se), alternative, alpha, upper=ndtr((effect - c) / se))
+
+
+def _simulate_correlation(
+    rng: np.random.Generator,
+    count: int,
+    *,
+    null_correlation: float,
+    correlation: float,
+    alternative: str,
+    size: int,
+    alpha: float,
+) -> int:
+    """Simulate Fisher's z test of the correlation of bivariate normal observations."""
+    n = _size(size, "size")
+    if n < 4:
+        msg = "'size' must be greater than 3 to be simulated."
+        raise ValueError(msg)
+
+    # Bartlett decomposition of the Wishart-distributed matrix of cross-products of the centered observations.
+    a11 = np.sqrt(rng.chisquare(n - 1, count))
+    a21 = rng.standard_normal(count)
+    a22 = np.sqrt(rng.chisquare(n - 2, count))
+    s = sqrt(1 - correlation**2)
+    sxx = a11**2
+    sxy = correlation * a11**2 + s * a11 * a21
+    syy = correlation**2 * a11**2 + 2 * correlation * s * a11 * a21 + s**2 * (a21**2 + a22**2)
+    r = sxy / np.sqrt(sxx * syy)
+    z = (np.arctanh(r) - np.arctanh(null_correlation)) * sqrt(n - 3)
+    return _rejections(ndtr(z), alternative, alpha)
+
+
+_SIMULATORS: dict[str, Callable[..., int]] = {
+    "mean.single": _simulate_mean_single,
+    "mean.independent": _simulate_mean_independent,
+    "proportion.single": _simulate_proportion_single,
+    "proportion.independent": _simulate_proportion_independent,
+    "correlation": _simulate_correlation,
+}
+
+
+def _simulate_chunk(family: str, params: dict[str, Any], seed: np.random.SeedSequence, count: int) -> int:
+    """Simulate a chunk of replicates, returning the number of rejections."""
+    return _SIMULATORS[family](np.random.default_rng(seed), count, **params)
+
+
+def simulate_power(
+    family: str,
+    /,
+    *,
+    replicates: int = 1_000_000,
+    seed: int | None = None,
+    workers: int | None = 1,
+    chunksize: int = 250_000,
+    **params: Any,
+) -> Simulation:
+    """Simulate the power of a test, and compare it with the analytic power.
+
+    Args:
+        family:
+            The family of the analytic power function, one of `'mean.single'`, `'mean.independent'`,
+            `'proportion.single'`, `'proportion.independent'` and `'correlation'`.
+        replicates:
+            Number of simulated tests.
+        seed:
+            The entropy of the `SeedSequence` of the simulation. Defaults to fresh entropy, reported in the result.
+        workers:
+            Number of worker processes. `None` means the number of CPUs.
+        chunksize:
+            Number of replicates simulated at once.
+        **params:
+            The scalar parameters of the analytic power function of the family, see the module documentation.
+
+    Returns:
+        The simulated and analytic power.
+
+    Raises:
+        ValueError: If `family` is unknown, `replicates`, `workers` or `chunksize` is not a positive integer, a
+            parameter is not a scalar, or a sample size is not an integer greater than 1.
+    """
+    if family not in _SIMULATORS:
+        msg = f"'family' must be one of {', '.join(map(repr, _SIMULATORS))}."
+        raise ValueError(msg)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if replicates < 1 or workers < 1 or chunksize < 1:
+        msg = "'replicates', 'workers' and 'chunksize' must be positive integers."
+        raise ValueError(msg)
+    if any(np.ndim(value) != 0 for value in params.values()):
+        msg = "The parameters must be scalars."
+        raise ValueError(msg)
+
+    kernel = importlib.import_module(f"{__package__}.{_KERNELS[family]}")._power
+    analytic = float(kernel(**params))
+
+    sequence = np.random.SeedSequence(seed)
+    counts = [chunksize] * (replicates // chunksize) + ([replicates % chunksize] if replicates % chunksize else [])
+    seeds = sequence.spawn(len(counts))
+    families, chunk_params = [family] * len(counts), [params] * len(counts)
+    if workers == 1 or len(counts) == 1:
+        rejections = sum(map(_simulate_chunk, families, chunk_params, seeds, counts))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(counts))) as executor:
+            rejections = sum(executor.map(_simulate_chunk, families, chunk_params, seeds, counts))
+
+    return Simulation(
+        family=family,
+        params=params,
+        replicates=replicates,
+        rejections=rejections,
+        analytic=analytic,
+        seed=sequence.entropy,
+    )
@@ -0,0 +1,257 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Precomputed sample size tables, for instant answers over standard grids.
+
+A table holds, for every point of a grid of parameters, the solutions of the sample size searches of a `solve_size`
+function. It is built once with `build`, and saved with `Table.save` as a `.npy` file, together with a `.json` file
+beside it describing the grid. `load` memory-maps the `.npy` file, so that only the grid points used by the queries are
+ever read.
+
+A query interpolates the solutions at the surrounding grid points, and runs `solve_size` starting its searches from
+the interpolation, which confirms the exact integer answer within a few evaluations. Answers are therefore always those
+of `solve_size` itself. Queries outside the grid, or with parameters the table was not built with, are solved from
+scratch.
+
+```python
+import numpy as np
+from pystatpower import tables
+
+axes = {
+    "diff": np.geomspace(0.05, 2, 128),
+    "alpha": tables.STANDARD_AXES["alpha"],
+    "power": tables.STANDARD_AXES["power"],
+}
+table = tables.build("mean.independent.inequality.solve_size", axes, treatment_std=1, reference_std=1)
+table.save("t-test.npy")
+
+table = tables.load("t-test.npy")
+table.solve(diff=0.42, alpha=0.05, power=0.85)
+```
+"""
+
+import json
+import os
+
+from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import partial
+from itertools import product
+from math import prod
+from numbers import Real
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ._solver import _Continuation
+from ._solver import _continue
+from .batch import CAPTURED_ERRORS
+from .batch import _name
+from .batch import _resolve
+
+STANDARD_AXES: dict[str, tuple[float, ...]] = {
+    "alpha": (0.01, 0.025, 0.05, 0.1),
+    "conf_level": (0.8, 0.9, 0.95, 0.99),
+    "power": (0.5, 0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 0.99),
+    "ratio": (0.25, 0.5, 1, 1.5, 2, 3, 4),
+}
+"""Standard grids of the parameters shared by most `solve_size` functions, to be completed with an effect axis."""
+
+
+@dataclass(frozen=True)
+class Table:
+    """A sample size table of a `solve_size` function.
+
+    Attributes:
+        function:
+            Qualified name of the function relative to the package, e.g. `'mean.independent.inequality.solve_size'`.
+        axes:
+            The grid, as the increasing values of each varying parameter.
+        params:
+            The other keyword arguments of the function, fixed for the whole table.
+        solutions:
+            The solutions of the sample size searches at each grid point, with the shape of the grid followed by the
+            number of searches, in their order in `solve_size`. Failed solves are `NaN`.
+    """
+
+    function: str
+    axes: dict[str, np.ndarray]
+    params: dict[str, Any]
+    solutions: np.ndarray
+
+    def _guesses(self, params: Mapping[str, Any]) -> list[float] | None:
+        """Interpolate the solutions at `params`, or return `None` if they are not covered by the table."""
+        if set(params) - set(self.axes) - set(self.params) or set(self.axes) - set(params):
+            return None
+        if any(self.params[name] != value for name, value in params.items() if name in self.params):
+            return None
+
+        # Locate the cell of the grid containing the query, and the weights of its corners along each axis.
+        cell, weights = [], []
+        for name, axis in self.axes.items():
+            value = params[name]
+            if not isinstance(value, Real) or not axis[0] <= value <= axis[-1]:
+                return None
+            if axis.size == 1:
+                cell.append((0,))
+                weights.append((1.0,))
+                continue
+            i = min(int(np.searchsorted(axis, value, side="right")) - 1, axis.size - 2)
+            t = (value - axis[i]) / (axis[i + 1] - axis[i])
+            cell.append((i, i + 1))
+            weights.append((1 - t, t))
+
+        corners = [
+            (prod(w), self.solutions[index])
+            for index, w in zip(product(*cell), product(*weights), strict=True)
+            if prod(w) > 0
+        ]
+        values = np.array([solution for _, solution in corners], dtype=float)
+        w = np.array([weight for weight, _ in corners])[:, np.newaxis]
+        # The solutions are interpolated on a logarithmic scale, where they are closer to linear in the parameters.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            guesses = np.where(np.all(values > 0, axis=0), np.exp(w.T @ np.log(values)), w.T @ values)[0]
+        return guesses.tolist()
+
+    def solve(self, **params: Any) -> Any:
+        """Solve the sample size, starting from the interpolation of the table.
+
+        Args:
+            **params:
+                The values of the axes, and optionally of the fixed parameters of the table, which must then match.
+
+        Returns:
+            The return value of the `solve_size` function for the fixed parameters of the table and `params`.
+        """
+        func = _resolve(self.function)
+        guesses = self._guesses(params)
+        state = _Continuation()
+        if guesses is not None:
+            state.seed(guesses)
+        state.advance(state.position)
+        with _continue(state):
+            return func(**(self.params | params))
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save the table as a `.npy` file of the solutions, and a `.json` file of the grid and parameters beside it."""
+        path = Path(path).with_suffix(".npy")
+        np.save(path, np.asarray(self.solutions, dtype=np.float32))
+        meta = {
+            "function": self.function,
+            "axes": {name: axis.tolist() for name, axis in self.axes.items()},
+            "params": self.params,
+        }
+        path.with_suffix(".json").write_text(json.dumps(meta, indent=2) + "\n", encoding="utf-8")
+
+
+def load(path: str | os.PathLike[str]) -> Table:
+    """Load a table saved by `Table.save`, memory-mapping its solutions.
+
+    Args:
+        path:
+            Path of the `.npy` file of the table.
+
+    Returns:
+        The table.
+
+    Raises:
+        ValueError: If the solutions do not match the grid.
+    """
+    path = Path(path).with_suffix(".npy")
+    meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+    axes = {name: np.asarray(axis, dtype=float) for name, axis in meta["axes"].items()}
+    solutions = np.load(path, mmap_mode="r")
+    if solutions.shape[:-1] != tuple(axis.size for axis in axes.values()):
+        msg = f"The solutions of shape {solutions.shape} in '{path}' do not match the grid."
+        raise ValueError(msg)
+    return Table(function=meta["function"], axes=axes, params=meta["params"], solutions=solutions)
+
+
+def _solve_line(function: str, row: Mapping[str, Any], axis: str, values: Sequence[float]) -> list[dict[int, float]]:
+    """Solve the sample size along a line of the grid, continuing each solve from the previous ones."""
+    func = _resolve(function)
+    state = _Continuation()
+    lines = []
+    with _continue(state):
+        for value in values:
+            state.advance(float(value))
+            with suppress(CAPTURED_ERRORS):
+                func(**row, **{axis: value})
+            lines.append(state.solutions)
+    return lines
+
+
+def build(
+    function: str | Callable[..., Any],
+    axes: Mapping[str, Sequence[float]],
+    *,
+    workers: int | None = 1,
+    **params: Any,
+) -> Table:
+    """Build the sample size table of a `solve_size` function over a grid.
+
+    The grid is solved line by line along its last axis, each solve continuing from the previous ones as in
+    `batch.sweep`. The lines are solved on a `ProcessPoolExecutor` if `workers` is not 1.
+
+    Args:
+        function:
+            The `solve_size` function, or its qualified name relative to the package, e.g.
+            `'mean.independent.inequality.solve_size'`.
+        axes:
+            The grid, as the strictly increasing values of each varying parameter.
+        workers:
+            Number of worker processes. `None` means the number of CPUs.
+        **params:
+            The other keyword arguments of the function, fixed for the whole table.
+
+    Returns:
+        The table.
+
+    Raises:
+        ValueError: If `function` is not a `solve_size` function of the package, an axis is empty or not strictly
+            increasing, or a parameter is given both as an axis and as a fixed parameter.
+    """
+    name = _name(function)
+    _resolve(name)
+    if not name.endswith(".solve_size"):
+        msg = f"'{name}' is not a solve_size function."
+        raise ValueError(msg)
+
+    grid = {key: np.asarray(values, dtype=float) for key, values in axes.items()}
+    for key, axis in grid.items():
+        if axis.ndim != 1 or axis.size == 0 or np.any(np.diff(axis) <= 0):
+            msg = f"The axis '{key}' must be a non-empty, strictly increasing sequence."
+            raise ValueError(msg)
+        if key in params:
+            msg = f"The parameter '{key}' must not be both an axis and a fixed parameter."
+            raise ValueError(msg)
+    if not grid:
+        msg = "At least one axis is required."
+        raise ValueError(msg)
+
+    *outer, last = grid
+    rows = [
+        dict(zip(outer, values, strict=True)) | params for values in product(*(grid[key].tolist() for key in outer))
+    ]
+    solve_line = partial(_solve_line, name, axis=last, values=grid[last].tolist())
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers == 1 or len(rows) == 1:
+        lines = [solve_line(row) for row in rows]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            lines = list(executor.map(solve_line, rows))
+
+    solved = [solution for line in lines for solution in line]
+    searches = max((max(solution) + 1 for solution in solved if solution), default=1)
+    solutions = np.full((len(solved), searches), np.nan)
+    for i, solution in enumerate(solved):
+        for j, root in solution.items():
+            solutions[i, j] = root
+
+    shape = tuple(axis.size for axis in grid.values())
+    return Table(function=name, axes=grid, params=params, solutions=solutions.reshape(*shape, searches))
@@ -0,0 +1,128 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import asyncio
+import time
+
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from pystatpower import aio
+from pystatpower.exceptions import SolutionNotFoundError
+from pystatpower.mean.independent import inequality
+from pystatpower.proportion.single.inequality import solve_size
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the solves run by the workers, each taking at least 0.2 seconds."""
+    calls = []
+
+    def slow_call(function: str, params: Mapping[str, Any]) -> Any:
+        calls.append(function)
+        time.sleep(0.2)
+        return aio._resolve(function)(**params)
+
+    monkeypatch.setattr(aio, "_call", slow_call)
+    return calls
+
+
+def test_solve() -> None:
+    params = {"diff": 1, "treatment_std": 2, "reference_std": 2}
+
+    async def main() -> list[Any]:
+        async with aio.Solver(max_workers=2) as solver:
+            return await asyncio.gather(
+                aio.mean.independent.inequality.solve_size(**params),
+                aio.solve(inequality.solve_size, **params, alpha=0.01),
+                solver.solve("mean.independent.inequality.solve_size", **params, power=0.9),
+            )
+
+    try:
+        assert asyncio.run(main()) == [
+            inequality.solve_size(**params),
+            inequality.solve_size(**params, alpha=0.01),
+            inequality.solve_size(**params, power=0.9),
+        ]
+    finally:
+        aio.shutdown()
+    assert aio.mean.independent.inequality.solve_size.__doc__ == inequality.solve_size.__doc__
+
+
+def test_solve_errors() -> None:
+    async def main() -> None:
+        solver = aio.Solver(max_workers=1, processes=False)
+        with pytest.raises(SolutionNotFoundError):
+            await solver.solve(solve_size, proportion=0.5, null_proportion=0.5)
+        with pytest.raises(TypeError):
+            await solver.solve(solve_size, proportion=0.6, null=0.5)
+        with pytest.raises(ValueError):
+            await solver.solve("mean.single.unknown.solve_size", diff=1)
+        solver.close()
+
+    asyncio.run(main())
+
+    with pytest.raises(AttributeError):
+        aio.mean.single.unknown.solve_size  # noqa: B018
+    with pytest.raises(AttributeError):
+        aio.unknown  # noqa: B018
+    with pytest.raises(ValueError):
+        aio.Solver(max_workers=0)
+
+
+def test_coalescing(calls: list[str]) -> None:
+    solver = aio.Solver(max_workers=2, processes=False)
+
+    async def main() -> list[Any]:
+        return await asyncio.gather(
+            solver.solve(solve_size, proportion=0.6, null_proportion=0.5),
+            solver.solve(solve_size, proportion=0.6, null_proportion=0.5, alpha=0.05),
+            solver.solve(solve_size, proportion=0.7, null_proportion=0.5),
+        )
+
+    results = asyncio.run(main())
+    assert results[0] == results[1] == solve_size(proportion=0.6, null_proportion=0.5)
+    assert len(calls) == 2
+
+    asyncio.run(main())
+    assert len(calls) == 4
+    solver.close()
+
+
+def test_timeout_and_cancellation(calls: list[str]) -> None:
+    solver = aio.Solver(max_workers=1, processes=False)
+
+    async def main() -> None:
+        running = asyncio.create_task(solver.solve(solve_size, proportion=0.6, null_proportion=0.5))
+        waiting = asyncio.create_task(solver.solve(solve_size, proportion=0.7, null_proportion=0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await solver.solve(solve_size, proportion=0.7, null_proportion=0.5, timeout=0.05)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert await running == solve_size(proportion=0.6, null_proportion=0.5)
+
+    asyncio.run(main())
+    # The cancelled call was still waiting for the worker, so it never started.
+    assert len(calls) == 1
+    solver.close()
+
+
+def test_solve_raising_timeout_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    def timing_out_call(function: str, params: Mapping[str, Any]) -> Any:
+        msg = "raised by the solve"
+        raise TimeoutError(msg)
+
+    monkeypatch.setattr(aio, "_call", timing_out_call)
+    solver = aio.Solver(max_workers=1, processes=False)
+
+    async def main() -> None:
+        # The error of the solve is passed on as is, rather than reported as a timeout of the call.
+        with pytest.raises(TimeoutError, match="raised by the solve"):
+            await solver.solve(solve_size, proportion=0.6, null_proportion=0.5, timeout=10)
+
+    asyncio.run(main())
+    solver.close()
@@ -0,0 +1,159 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections.abc import Iterator
+
+import pytest
+
+from pystatpower import batch
+from pystatpower import diagnostics
+from pystatpower.exceptions import SolutionNotFoundError
+from pystatpower.mean.single import inequality
+from pystatpower.proportion.independent import inequality as independent_inequality
+from pystatpower.proportion.single.inequality import solve_size
+
+
+def test_run() -> None:
+    scenarios = [{"diff": diff, "std": 2, "dist": "z"} for diff in (0.5, 1, 2, 3, 0.8, 1.5)]
+    expected = [inequality.solve_size(**scenario) for scenario in scenarios]
+
+    results = batch.run("mean.single.inequality.solve_size", scenarios, workers=2, chunksize=2)
+    assert [result.value for result in results] == expected
+    assert all(result.ok for result in results)
+
+    results = batch.run(inequality.solve_size, scenarios, workers=1)
+    assert [result.value for result in results] == expected
+
+
+def test_run_columns() -> None:
+    columns = {"diff": [0.5, 1, 2], "std": [2, 2, 2]}
+    results = batch.run("mean.single.inequality.solve_power", {**columns, "size": [10, 20, 30]}, workers=2)
+    assert [result.value for result in results] == [
+        inequality.solve_power(diff=diff, std=std, size=size)
+        for diff, std, size in zip(columns["diff"], columns["std"], [10, 20, 30], strict=True)
+    ]
+
+    with pytest.raises(ValueError):
+        batch.run("mean.single.inequality.solve_power", {"diff": [1, 2], "std": [2]})
+
+
+def test_run_captured_errors() -> None:
+    scenarios = [
+        {"proportion": 0.6, "null_proportion": 0.5},
+        {"proportion": 0.5, "null_proportion": 0.5},
+        {"proportion": 0.7, "null_proportion": 0.5},
+    ]
+    for workers in (1, 2):
+        results = batch.run(solve_size, scenarios, workers=workers)
+        assert [result.ok for result in results] == [True, False, True]
+        assert results[1].value is None
+        assert isinstance(results[1].error, SolutionNotFoundError)
+        assert results[2].value == solve_size(proportion=0.7, null_proportion=0.5)
+
+    with pytest.raises(TypeError):
+        batch.run(solve_size, [{"proportion": 0.6, "null": 0.5}], workers=1)
+
+
+def test_run_captured_errors_vectorized() -> None:
+    # The scenarios are solved in one vectorized call, and the one without a solution gets its own error.
+    scenarios = {"diff": [0.5, 1e-9, 1], "std": [1, 1, 1]}
+    results = batch.run(inequality.solve_size, scenarios, workers=1)
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, SolutionNotFoundError)
+    assert [results[0].value, results[2].value] == [
+        inequality.solve_size(diff=0.5, std=1),
+        inequality.solve_size(diff=1, std=1),
+    ]
+    # The other sample sizes are integers, as in scalar calls, although the array of the call holds NaN.
+    assert type(results[0].value) is int
+    assert type(results[2].value) is int
+
+
+def test_run_vectorized_two_groups() -> None:
+    # The pairs of sample sizes of a vectorized call are split into one tuple per scenario.
+    scenarios = [
+        {"treatment_proportion": p, "reference_proportion": 0.5, "alternative": "two-sided"} for p in (0.6, 0.5, 0.7)
+    ]
+    with diagnostics.record() as recorder:
+        results = batch.run(independent_inequality.solve_size, scenarios, workers=1)
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, SolutionNotFoundError)
+    for scenario, result in zip(scenarios, results, strict=True):
+        if result.ok:
+            assert result.value == independent_inequality.solve_size(**scenario)
+            assert all(type(size) is int for size in result.value)
+    # One vectorized call, and one more for the error of the scenario without a solution.
+    assert len(recorder.calls) == 2
+
+
+def test_run_illegal_argument() -> None:
+    with pytest.raises(ValueError):
+        batch.run("mean.single.unknown.solve_size", [])
+    with pytest.raises(ValueError):
+        batch.run("mean.single.inequality._power", [])
+    with pytest.raises(ValueError):
+        batch.run(lambda: None, [])
+    with pytest.raises(ValueError):
+        batch.run(solve_size, [], workers=0)
+
+
+def test_stream() -> None:
+    scenarios = [{"diff": diff, "std": std, "dist": "z"} for diff in (0.5, 1, 2) for std in (1, 2)]
+    scenarios += [{"diff": 1, "std": 2, "alternative": "greater", "dist": "z"}, {"mean": 1, "null_mean": 0, "std": 2}]
+    expected = [inequality.solve_size(**scenario) for scenario in scenarios]
+    assert [result.value for result in batch.stream(inequality.solve_size, scenarios, batchsize=4)] == expected
+    assert [result.value for result in batch.stream(inequality.solve_size, scenarios)] == expected
+
+
+def test_stream_is_lazy() -> None:
+    consumed = []
+
+    def scenarios() -> Iterator[dict[str, float]]:
+        for size in range(10, 1000):
+            consumed.append(size)
+            yield {"diff": 1, "std": 2, "size": size}
+
+    results = batch.stream("mean.single.inequality.solve_power", scenarios(), batchsize=8)
+    assert consumed == []
+    assert next(results).value == inequality.solve_power(diff=1, std=2, size=10)
+    assert consumed == list(range(10, 18))
+
+
+def test_stream_captured_errors() -> None:
+    scenarios = [{"proportion": proportion, "null_proportion": 0.5} for proportion in (0.6, 0.5, 0.7, 0.5)]
+    results = list(batch.stream(solve_size, scenarios))
+    assert [result.ok for result in results] == [True, False, True, False]
+    assert isinstance(results[3].error, SolutionNotFoundError)
+    assert results[2].value == solve_size(proportion=0.7, null_proportion=0.5)
+
+    with pytest.raises(ValueError):
+        batch.stream(solve_size, scenarios, batchsize=0)
+    with pytest.raises(ValueError):
+        batch.stream("mean.single.unknown.solve_size", scenarios)
+
+
+def test_sweep() -> None:
+    proportions = [0.62, 0.58, 0.7, 0.5, 0.66, 0.6, 0.64]
+    for method in ("z-p0", "exact"):
+        with diagnostics.record() as warm:
+            results = batch.sweep(solve_size, "proportion", proportions, null_proportion=0.5, method=method)
+        assert [result.ok for result in results] == [True, True, True, False, True, True, True]
+        assert isinstance(results[3].error, SolutionNotFoundError)
+
+        with diagnostics.record() as cold:
+            expected = [solve_size(proportion=p, null_proportion=0.5, method=method) for p in proportions if p != 0.5]
+        assert [result.value for result in results if result.ok] == expected
+        warm_evaluations = sum(call.evaluations for call in warm.calls if call.error is None)
+        assert warm_evaluations <= sum(call.evaluations for call in cold.calls)
+
+    sizes = [40, 10, 30, 20]
+    results = batch.sweep("mean.single.inequality.solve_std", "size", sizes, diff=1)
+    for size, result in zip(sizes, results, strict=True):
+        assert result.value == pytest.approx(inequality.solve_std(diff=1, size=size), rel=1e-9)
+
+    diffs = [0.5, 0.2, 0.8]
+    results = batch.sweep(inequality.solve_size, "diff", diffs, std=1)
+    assert [result.value for result in results] == [inequality.solve_size(diff=diff, std=1) for diff in diffs]
+
+    with pytest.raises(ValueError):
+        batch.sweep(solve_size, "proportion", [0.6], proportion=0.7, null_proportion=0.5)
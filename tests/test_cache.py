@@ -0,0 +1,111 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pystatpower import batch
+from pystatpower import cache
+from pystatpower import diagnostics
+from pystatpower.exceptions import SolutionNotFoundError
+from pystatpower.mean.independent import inequality
+from pystatpower.proportion.single.inequality import solve_size
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[cache.Cache]:
+    with cache.enable(tmp_path, max_entries=100) as store:
+        yield store
+    assert cache.active() is None
+
+
+def test_hits_and_misses(store: cache.Cache) -> None:
+    params = {"diff": 1, "treatment_std": 2, "reference_std": 2}
+    with diagnostics.record() as recorder:
+        expected = inequality.solve_size(**params)
+        assert inequality.solve_size(**params) == expected
+        assert inequality.solve_size(**{**params, "diff": 1.0, "alpha": 0.05}) == expected
+    assert isinstance(expected, tuple)
+    assert store.stats() == {"hits": 2, "misses": 1, "entries": 1}
+    assert [call.evaluations > 0 for call in recorder.calls] == [True, False, False]
+
+    power = inequality.solve_power(diff=1, treatment_std=2, reference_std=2, treatment_size=20, reference_size=20)
+    assert (
+        inequality.solve_power(diff=1, treatment_std=2, reference_std=2, treatment_size=20, reference_size=20) == power
+    )
+    assert isinstance(power, float)
+    assert store.stats()["entries"] == 2
+
+    cache.disable()
+    assert inequality.solve_size(**params) == expected
+    assert store.stats()["hits"] == 3
+
+
+def test_hit_recorded(store: cache.Cache) -> None:
+    # The cache is applied below the instrumentation, so a hit is recorded as a call without any search.
+    params = {"proportion": 0.6, "null_proportion": 0.5}
+    with diagnostics.record() as recorder:
+        expected = solve_size(**params)
+        assert solve_size(**params) == expected
+    assert store.stats()["hits"] == 1
+    miss, hit = recorder.calls
+    assert miss.function == hit.function == "proportion.single.inequality.solve_size"
+    assert miss.evaluations > 0
+    assert (hit.evaluations, hit.brackets, hit.distribution_calls, hit.error) == (0, [], 0, None)
+
+
+def test_not_cached(store: cache.Cache) -> None:
+    powers = inequality.solve_power(
+        diff=1, treatment_std=2, reference_std=2, treatment_size=np.array([10, 20]), reference_size=20
+    )
+    assert isinstance(powers, np.ndarray)
+    with pytest.raises(SolutionNotFoundError):
+        solve_size(proportion=0.5, null_proportion=0.5)
+    with pytest.raises(SolutionNotFoundError):
+        solve_size(proportion=0.5, null_proportion=0.5)
+    with pytest.raises(TypeError):
+        solve_size(0.6, 0.5)
+    assert store.stats() == {"hits": 0, "misses": 2, "entries": 0}
+
+    results = batch.sweep(solve_size, "proportion", [0.6, 0.7], null_proportion=0.5)
+    assert [result.value for result in results] == [solve_size(proportion=p, null_proportion=0.5) for p in (0.6, 0.7)]
+    assert store.stats()["hits"] == 0
+
+
+def test_versions(store: cache.Cache, tmp_path: Path) -> None:
+    solve_size(proportion=0.6, null_proportion=0.5)
+    other = cache.Cache(tmp_path)
+    other._versions = ("0.0.0", *other._versions[1:])
+    assert other.key("f", [1]) != store.key("f", [1])
+    assert store.key("f", [1]) == store.key("f", [1.0])
+    assert other.stats()["entries"] == 1
+    other.close()
+
+
+def test_eviction(store: cache.Cache) -> None:
+    keys = [store.key("f", [i]) for i in range(150)]
+    for i, key in enumerate(keys):
+        store.put(key, i)
+    store.evict()
+    assert store.stats()["entries"] == 100
+    assert store.get(keys[0]) == (False, None)
+    assert store.get(keys[-1]) == (True, 149)
+
+    store.clear()
+    assert store.stats() == {"hits": 0, "misses": 0, "entries": 0}
+
+
+def test_processes(store: cache.Cache) -> None:
+    scenarios = [{"proportion": p, "null_proportion": 0.5} for p in (0.55, 0.6, 0.65, 0.7, 0.75, 0.8)]
+    results = batch.run(solve_size, scenarios, workers=2, chunksize=1)
+    assert store.stats()["entries"] == len(scenarios)
+    assert [solve_size(**scenario) for scenario in scenarios] == [result.value for result in results]
+    assert store.stats()["hits"] == len(scenarios)
+
+
+def test_illegal_argument(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        cache.Cache(tmp_path, max_entries=0)
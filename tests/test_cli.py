@@ -0,0 +1,99 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import csv
+import io
+import json
+
+from pathlib import Path
+
+import pytest
+
+from pystatpower.cli import main
+from pystatpower.mean.independent import inequality
+from pystatpower.proportion.single.inequality import solve_size
+
+PROPORTIONS = [0.6, 0.5, 0.7, 0.55, 0.65, 0.8]
+
+
+@pytest.fixture
+def scenarios(tmp_path: Path) -> Path:
+    path = tmp_path / "scenarios.csv"
+    path.write_text("proportion,null_proportion,alpha\n" + "".join(f"{p},0.5,\n" for p in PROPORTIONS))
+    return path
+
+
+def test_csv(scenarios: Path, tmp_path: Path) -> None:
+    output = tmp_path / "sizes.csv"
+    assert main(["proportion.single.inequality.solve_size", str(scenarios), "-o", str(output), "--chunksize", "4"]) == 0
+    with output.open(newline="") as stream:
+        rows = list(csv.DictReader(stream))
+    assert [row["row"] for row in rows] == [str(i) for i in range(len(PROPORTIONS))]
+    assert list(rows[0]) == ["row", "proportion", "null_proportion", "alpha", "value", "error"]
+    for p, row in zip(PROPORTIONS, rows, strict=True):
+        if p == 0.5:
+            assert row["value"] == ""
+            assert row["error"].startswith("SolutionNotFoundError")
+        else:
+            assert row["value"] == str(solve_size(proportion=p, null_proportion=0.5))
+            assert row["error"] == ""
+
+
+def test_csv_columns(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    # A column left empty in the first row is still written, with the values of the later rows.
+    scenarios = tmp_path / "scenarios.csv"
+    scenarios.write_text("diff,std,alternative\n1,2,\n1,2,greater\n")
+    assert main(["mean.single.inequality.solve_size", str(scenarios)]) == 0
+    rows = list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+    assert list(rows[0]) == ["row", "diff", "std", "alternative", "value", "error"]
+    assert [row["alternative"] for row in rows] == ["", "greater"]
+
+    # The columns of a JSONL input are those of its first row, and a later row with another key fails.
+    lines = [{"diff": 1, "std": 2}, {"diff": 1, "std": 2, "alternative": "greater"}]
+    monkeypatch.setattr("sys.stdin", io.StringIO("".join(json.dumps(line) + "\n" for line in lines)))
+    assert main(["mean.single.inequality.solve_size", "-f", "jsonl", "--output-format", "csv"]) == 1
+    assert "ValueError: Row 1 has columns not in the CSV header: alternative." in capsys.readouterr().err
+
+
+def test_jsonl_jobs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    scenarios = [{"diff": diff, "treatment_std": 2, "reference_std": 2} for diff in (0.5, 1, 1.5, 2, 2.5)]
+    monkeypatch.setattr("sys.stdin", io.StringIO("".join(json.dumps(s) + "\n" for s in scenarios)))
+    args = ["mean.independent.inequality.solve_size", "-f", "jsonl", "-j", "2", "--chunksize", "2"]
+    assert main(args) == 0
+    rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [row["value"] for row in rows] == [list(inequality.solve_size(**s)) for s in scenarios]
+    assert [row["row"] for row in rows] == list(range(len(scenarios)))
+
+
+def test_resume(scenarios: Path, tmp_path: Path) -> None:
+    for fmt in ("csv", "jsonl"):
+        output = tmp_path / f"sizes.{fmt}"
+        args = ["proportion.single.inequality.solve_size", str(scenarios), "-o", str(output)]
+        assert main(args) == 0
+        expected = output.read_text()
+
+        # Keep the first two rows and a part of the third, as left by an interrupted run.
+        lines = expected.splitlines(keepends=True)
+        header = 1 if fmt == "csv" else 0
+        output.write_text("".join(lines[: header + 2]) + lines[header + 2][:5])
+        assert main([*args, "--resume"]) == 0
+        assert output.read_text() == expected
+
+        assert main([*args, "--resume"]) == 0
+        assert output.read_text() == expected
+
+
+def test_errors(scenarios: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    bad = tmp_path / "bad.csv"
+    bad.write_text("proportion,null\n0.6,0.5\n")
+    assert main(["proportion.single.inequality.solve_size", str(bad), "-o", str(tmp_path / "out.csv")]) == 1
+    assert "TypeError" in capsys.readouterr().err
+
+    for args in (
+        ["mean.single.unknown.solve_size", str(scenarios)],
+        ["proportion.single.inequality.solve_size", str(scenarios), "-j", "0"],
+        ["proportion.single.inequality.solve_size", str(scenarios), "--resume"],
+    ):
+        with pytest.raises(SystemExit) as e:
+            main(args)
+        assert e.value.code == 2
@@ -4,8 +4,10 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
+from pystatpower.correlation.inequality import power_curve
 from pystatpower.correlation.inequality import solve_correlation
 from pystatpower.correlation.inequality import solve_null_correlation
 from pystatpower.correlation.inequality import solve_power
@@ -110,6 +112,20 @@ def test_solve_power(case: TestCase) -> None:
     )
 
 
+@pytest.mark.parametrize("alternative", ["two-sided", "greater", "less"])
+def test_power_curve(alternative: Literal["two-sided", "greater", "less"]) -> None:
+    sizes = np.arange(4, 300)
+    correlation = -0.3 if alternative == "less" else 0.3
+
+    result = power_curve(null_correlation=0, correlation=correlation, sizes=sizes, alternative=alternative)
+    expected = [
+        solve_power(null_correlation=0, correlation=correlation, size=size, alternative=alternative) for size in sizes
+    ]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
 def test_solve_size(case: TestCase) -> None:
     assert (
         solve_size(
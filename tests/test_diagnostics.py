@@ -0,0 +1,84 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+
+import pytest
+
+from pystatpower import diagnostics
+from pystatpower.exceptions import SolutionNotFoundError
+from pystatpower.mean.single.inequality import solve_diff
+from pystatpower.mean.single.inequality import solve_power
+from pystatpower.mean.single.inequality import solve_size
+from pystatpower.proportion.single.inequality import solve_size as solve_size_exact
+
+
+def test_record() -> None:
+    with diagnostics.record() as recorder:
+        assert solve_size(diff=1, std=2) == 34
+        solve_size(diff=[0.5, 1], std=2, dist="z")
+        solve_diff(std=2, size=34, direction="greater")
+        solve_power(diff=1, std=2, size=34)
+        solve_size_exact(proportion=0.6, null_proportion=0.5, method="exact")
+
+    assert [call.function for call in recorder.calls] == [
+        "mean.single.inequality.solve_size",
+        "mean.single.inequality.solve_size",
+        "mean.single.inequality.solve_diff",
+        "mean.single.inequality.solve_power",
+        "proportion.single.inequality.solve_size",
+    ]
+    for call in recorder.calls:
+        assert call.wall_time >= call.distribution_time > 0
+        assert call.distribution_calls > 0
+        assert call.error is None
+
+    scalar, vectorized, root, power, exact = recorder.calls
+    assert scalar.brackets == [(33, 34)]
+    assert scalar.evaluations >= 2
+    assert vectorized.brackets == [(2, 1e12)]
+    # Both ends of the range and of the bracket are evaluated besides the iterations, then the roots on the integers.
+    assert 0 < vectorized.iterations <= vectorized.evaluations - 6
+    # The bracket is found in steps of the standard error, 2 / sqrt(34), away from zero.
+    [(lb, ub)] = root.brackets
+    assert 0 < lb < 1 < ub <= 8 / 34**0.5
+    assert root.iterations > 0
+    assert root.evaluations > root.iterations
+    assert power.brackets == []
+    assert power.evaluations == 0
+    assert exact.evaluations > 0
+
+    summary = recorder.summary()
+    assert summary["mean.single.inequality.solve_size"]["calls"] == 2
+    assert summary["mean.single.inequality.solve_size"]["evaluations"] == scalar.evaluations + vectorized.evaluations
+    assert json.loads(recorder.to_json()) == json.loads(json.dumps(recorder.to_dict()))
+
+    recorder.reset()
+    assert recorder.calls == []
+    assert recorder.summary() == {}
+
+
+def test_record_errors() -> None:
+    with diagnostics.record(keep_calls=False) as recorder:
+        solve_size(diff=1, std=2)
+        with pytest.raises(SolutionNotFoundError):
+            solve_size(diff=0, std=2)
+
+    assert recorder.calls == []
+    summary = recorder.summary()["mean.single.inequality.solve_size"]
+    assert summary["calls"] == 2
+    assert summary["errors"] == 1
+
+
+def test_record_inactive() -> None:
+    with diagnostics.record() as recorder:
+        pass
+    solve_size(diff=1, std=2)
+    assert recorder.calls == []
+
+    with diagnostics.record() as outer:
+        with diagnostics.record() as inner:
+            solve_size(diff=1, std=2)
+        solve_power(diff=1, std=2, size=34)
+    assert [call.function for call in inner.calls] == ["mean.single.inequality.solve_size"]
+    assert [call.function for call in outer.calls] == ["mean.single.inequality.solve_power"]
@@ -0,0 +1,80 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+
+from scipy.stats import binom
+from scipy.stats import nct
+from scipy.stats import norm
+from scipy.stats import t
+
+from pystatpower._distributions import _binom_pmfs
+from pystatpower._distributions import _binom_ppf
+from pystatpower._distributions import _nct_cdf
+from pystatpower._distributions import _norm_ppf
+from pystatpower._distributions import _ppf_cache_clear
+from pystatpower._distributions import _ppf_cache_info
+from pystatpower._distributions import _t_ppf
+
+
+def test_ppf() -> None:
+    for q in [0.005, 0.025, 0.5, 0.95, 0.975]:
+        assert _norm_ppf(q) == norm.ppf(q)
+        assert _t_ppf(q, 17) == t.ppf(q, 17)
+        assert _t_ppf(q, 23.4) == t.ppf(q, 23.4)
+        assert _binom_ppf(q, 40, 0.3) == binom.ppf(q, 40, 0.3)
+
+    q = np.array([0.025, 0.5, 0.975])
+    assert np.array_equal(_norm_ppf(q), norm.ppf(q))
+    assert np.array_equal(_t_ppf(0.975, [5, 10, 20]), t.ppf(0.975, [5, 10, 20]))
+
+
+def test_binom_pmfs() -> None:
+    p = np.array([0, 1e-9, 0.3, 0.5, 0.99, 1])
+    for n in [1, 7, 40, 1000]:
+        result = _binom_pmfs(n, p)
+        assert result.shape == (6, n + 1)
+        assert np.allclose(result, binom.pmf(np.arange(n + 1), n, p[:, np.newaxis]), rtol=1e-10, atol=1e-300)
+        assert np.allclose(result.sum(axis=1), 1)
+
+
+def test_ppf_cache() -> None:
+    _ppf_cache_clear()
+    assert _ppf_cache_info().currsize == 0
+
+    for _ in range(10):
+        _norm_ppf(1 - 0.05 / 2)
+        _t_ppf(1 - 0.05 / 2, 29)
+    info = _ppf_cache_info()
+    assert info.misses == 2
+    assert info.hits == 18
+
+    # numpy scalars share the cache entries of Python floats
+    _norm_ppf(np.float64(0.975))
+    assert _ppf_cache_info().hits == 19
+
+    # array inputs bypass the cache
+    _norm_ppf(np.array([0.975, 0.975]))
+    assert _ppf_cache_info()[:2] == (19, 2)
+
+
+def test_nct_cdf() -> None:
+    df = np.geomspace(1, 1e6, 60)[:, None]
+    nc = np.linspace(-40, 40, 81)
+    for q in [0.025, 0.05, 0.95, 0.975]:
+        x = t.ppf(q, df)
+        result = _nct_cdf(x, df, nc)
+        expected = nct.cdf(x, df, nc)
+        finite = ~np.isnan(expected)
+        assert not np.any(np.isnan(result))
+        assert np.array_equal(result[finite], expected[finite])
+        assert np.all((result >= 0) & (result <= 1 + 1e-15))
+
+    assert _nct_cdf(1.7, 30, 2.5) == nct.cdf(1.7, 30, 2.5)
+    assert isinstance(_nct_cdf(1.7, 30, 2.5), float)
+
+    # the lower tail far below a large noncentrality, where scipy returns NaN
+    assert 0 <= _nct_cdf(-2.0, 50, 30) < 1e-100
+    # small degrees of freedom, where even the reflection returns NaN
+    assert 1 - 1e-12 < _nct_cdf(12.706204736174694, 1, -14.6) <= 1
+    assert 0 <= _nct_cdf(-12.706204736174694, 1, 14.6) < 1e-12
@@ -0,0 +1,30 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+import pystatpower
+
+
+def test_import_is_lazy() -> None:
+    code = (
+        "import sys, pystatpower; "
+        "assert not {'numpy', 'scipy', 'pystatpower.mean', 'pystatpower.proportion'} & set(sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_attach() -> None:
+    assert isinstance(pystatpower.__version__, str)
+    assert {"correlation", "mean", "misc", "proportion", "__version__"} <= set(dir(pystatpower))
+    assert pystatpower.mean.single.inequality.solve_power(diff=1, std=2, size=20, dist="z") > 0
+    assert pystatpower.misc.observe_at_least_one_event.solve_size(proportion=0.01) == 299
+    assert "inequality" in dir(pystatpower.proportion.single)
+
+    with pytest.raises(AttributeError):
+        pystatpower.unknown  # noqa: B018
+    with pytest.raises(AttributeError):
+        pystatpower.mean.unknown  # noqa: B018
@@ -11,10 +11,13 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
 from pystatpower.mean.independent.inequality import _verify_mean_and_get_diff
 from pystatpower.mean.independent.inequality import _verify_std_and_get_std
+from pystatpower.mean.independent.inequality import power_curve
+from pystatpower.mean.independent.inequality import solve_allocation
 from pystatpower.mean.independent.inequality import solve_diff
 from pystatpower.mean.independent.inequality import solve_power
 from pystatpower.mean.independent.inequality import solve_reference_mean
@@ -646,43 +649,40 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
-def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (
-        case.treatment_mean in [42, 47, 54, 55]
-        and case.alternative == "greater"
-        and case.dist == "t"
-        and case.equal_var
-    ) or (
-        case.treatment_mean in [41, 46, 52, 53]
-        and case.alternative == "greater"
-        and case.dist == "t"
-        and not case.equal_var
-        and case.approx_t_method == "satterthwaite"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if case.treatment_mean in range(40, 61) and (
-        (case.alternative == "two-sided" and case.dist == "t" and case.equal_var)
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "satterthwaite"
-        )
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "welch"
-        )
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+@pytest.mark.parametrize("ratio", [0.5, 1, 1.5, 2])
+@pytest.mark.parametrize(
+    ("dist", "equal_var", "approx_t_method"),
+    [
+        ("z", True, "welch"),
+        ("z", False, "welch"),
+        ("t", True, "welch"),
+        ("t", False, "welch"),
+        ("t", False, "satterthwaite"),
+    ],
+)
+def test_power_curve(
+    dist: Literal["z", "t"], equal_var: bool, approx_t_method: Literal["welch", "satterthwaite"], ratio: float
+) -> None:
+    sizes = np.arange(4, 120)
+    params = {
+        "diff": 5,
+        "treatment_std": 12,
+        "reference_std": 12 if equal_var else 9,
+        "alternative": "two-sided",
+        "dist": dist,
+        "equal_var": equal_var,
+        "approx_t_method": approx_t_method,
+    }
+
+    result = power_curve(sizes=sizes, ratio=ratio, **params)
+    # The sample sizes in the treatment group are rounded up, as in `solve_size`.
+    expected = [solve_power(treatment_size=np.ceil(size * ratio), reference_size=size, **params) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_solve_size(case: TestCase) -> None:
     ratio = case.treatment_size / case.reference_size
     assert solve_size(
         treatment_mean=case.treatment_mean,
@@ -701,38 +701,34 @@ def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
     ) == (case.treatment_size, case.reference_size)
 
 
-def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize(("treatment_cost", "reference_cost"), [(1, 1), (4, 1), (1, 2.5)])
+def test_solve_allocation(treatment_cost: float, reference_cost: float) -> None:
+    params = {"diff": 0.5, "treatment_std": 2, "reference_std": 1, "alternative": "two-sided"}
+    treatment_size, reference_size = solve_allocation(
+        **params, treatment_cost=treatment_cost, reference_cost=reference_cost
+    )
+    cost = treatment_cost * treatment_size + reference_cost * reference_size
 
-    if (case.treatment_mean in [55, 56] and case.alternative == "greater" and case.dist == "t" and case.equal_var) or (
-        case.treatment_mean in [42, 55]
-        and case.alternative == "greater"
-        and case.dist == "t"
-        and not case.equal_var
-        and case.approx_t_method == "satterthwaite"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+    # The design reaches the power, and no group can be reduced by one subject.
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size) >= 0.8
+    assert solve_power(**params, treatment_size=treatment_size - 1, reference_size=reference_size) < 0.8
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size - 1) < 0.8
+
+    # No fixed allocation ratio is cheaper.
+    for ratio in np.geomspace(0.25, 4, 17):
+        sizes = solve_size(**params, ratio=ratio)
+        assert cost <= treatment_cost * sizes[0] + reference_cost * sizes[1]
+
+
+def test_solve_allocation_raise_error() -> None:
+    params = {"diff": 0.5, "treatment_std": 2, "reference_std": 1, "alternative": "two-sided"}
+    with pytest.raises(ValueError):
+        solve_allocation(**params, treatment_cost=0)
+    with pytest.raises(ValueError):
+        solve_allocation(**params, reference_cost=-1)
 
-    if case.treatment_mean in range(40, 61) and (
-        (case.alternative == "two-sided" and case.dist == "t" and case.equal_var)
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "satterthwaite"
-        )
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "welch"
-        )
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
 
+def test_solve_diff(case: TestCase) -> None:
     case.direction = "greater" if case.diff > 0 else "less"
     assert (
         round(
@@ -760,38 +756,7 @@ def test_solve_diff_raise_error() -> None:
         solve_diff(std=30, treatment_size=20, reference_size=30, alternative="two-sided")
 
 
-def test_solve_treatment_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (case.treatment_mean in [55, 56] and case.alternative == "greater" and case.dist == "t" and case.equal_var) or (
-        case.treatment_mean in [42, 55]
-        and case.alternative == "greater"
-        and case.dist == "t"
-        and not case.equal_var
-        and case.approx_t_method == "satterthwaite"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if case.treatment_mean in range(40, 61) and (
-        (case.alternative == "two-sided" and case.dist == "t" and case.equal_var)
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "satterthwaite"
-        )
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "welch"
-        )
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_treatment_mean(case: TestCase) -> None:
     case.direction = "greater" if case.treatment_mean > case.reference_mean else "less"
     assert (
         round(
@@ -821,38 +786,7 @@ def test_solve_treatment_mean_raise_error() -> None:
         solve_treatment_mean(reference_mean=20, std=30, treatment_size=20, reference_size=30, alternative="two-sided")
 
 
-def test_solve_reference_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (case.treatment_mean in [55, 56] and case.alternative == "greater" and case.dist == "t" and case.equal_var) or (
-        case.treatment_mean in [42, 55]
-        and case.alternative == "greater"
-        and case.dist == "t"
-        and not case.equal_var
-        and case.approx_t_method == "satterthwaite"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if case.treatment_mean in range(40, 61) and (
-        (case.alternative == "two-sided" and case.dist == "t" and case.equal_var)
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "satterthwaite"
-        )
-        or (
-            case.alternative == "two-sided"
-            and case.dist == "t"
-            and not case.equal_var
-            and case.approx_t_method == "welch"
-        )
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_reference_mean(case: TestCase) -> None:
     case.direction = "greater" if case.reference_mean > case.treatment_mean else "less"
     assert (
         round(
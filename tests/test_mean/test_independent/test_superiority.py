@@ -6,10 +6,13 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
 from pystatpower.mean.independent._verify import _verify_mean_and_get_diff
 from pystatpower.mean.independent._verify import _verify_std_and_get_std
+from pystatpower.mean.independent.superiority import power_curve
+from pystatpower.mean.independent.superiority import solve_allocation
 from pystatpower.mean.independent.superiority import solve_diff
 from pystatpower.mean.independent.superiority import solve_margin
 from pystatpower.mean.independent.superiority import solve_power
@@ -392,363 +395,41 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 4)
 
 
-def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (
-        request.config.is_linux
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=10,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=49,
-                reference_size=98,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8076,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=19,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=157,
-                reference_size=314,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8009,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_linux
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=10,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=49,
-                reference_size=98,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8076,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=19,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=157,
-                reference_size=314,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8009,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=10,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=49,
-                reference_size=98,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8076,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=19,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=157,
-                reference_size=314,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8009,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=19,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=157,
-                reference_size=314,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8009,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_windows
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=10,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=49,
-                reference_size=98,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8076,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=19,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=157,
-                reference_size=314,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8009,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_windows
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=10,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=49,
-                reference_size=98,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8076,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=19,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=157,
-                reference_size=314,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8009,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+@pytest.mark.parametrize("ratio", [0.5, 1, 1.5, 2])
+@pytest.mark.parametrize(
+    ("dist", "equal_var", "approx_t_method"),
+    [
+        ("z", True, "welch"),
+        ("z", False, "welch"),
+        ("t", True, "welch"),
+        ("t", False, "welch"),
+        ("t", False, "satterthwaite"),
+    ],
+)
+def test_power_curve(
+    dist: Literal["z", "t"], equal_var: bool, approx_t_method: Literal["welch", "satterthwaite"], ratio: float
+) -> None:
+    sizes = np.arange(4, 120)
+    params = {
+        "diff": 7,
+        "margin": 2,
+        "treatment_std": 12,
+        "reference_std": 12 if equal_var else 9,
+        "alternative": "greater",
+        "dist": dist,
+        "equal_var": equal_var,
+        "approx_t_method": approx_t_method,
+    }
+
+    result = power_curve(sizes=sizes, ratio=ratio, **params)
+    # The sample sizes in the treatment group are rounded up, as in `solve_size`.
+    expected = [solve_power(treatment_size=np.ceil(size * ratio), reference_size=size, **params) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_solve_size(case: TestCase) -> None:
     ratio = case.treatment_size / case.reference_size
     assert solve_size(
         treatment_mean=case.treatment_mean,
@@ -768,148 +449,34 @@ def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
     ) == (case.treatment_size, case.reference_size)
 
 
-def test_solve_treatment_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize(("treatment_cost", "reference_cost"), [(1, 1), (4, 1), (1, 2.5)])
+def test_solve_allocation(treatment_cost: float, reference_cost: float) -> None:
+    params = {"diff": 1, "margin": 0.3, "treatment_std": 1, "reference_std": 1, "alternative": "greater"}
+    treatment_size, reference_size = solve_allocation(
+        **params, treatment_cost=treatment_cost, reference_cost=reference_cost
+    )
+    cost = treatment_cost * treatment_size + reference_cost * reference_size
 
-    if (
-        request.config.is_linux
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+    # The design reaches the power, and no group can be reduced by one subject.
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size) >= 0.8
+    assert solve_power(**params, treatment_size=treatment_size - 1, reference_size=reference_size) < 0.8
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size - 1) < 0.8
 
-    if (
-        request.config.is_linux
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+    # No fixed allocation ratio is cheaper.
+    for ratio in np.geomspace(0.25, 4, 17):
+        sizes = solve_size(**params, ratio=ratio)
+        assert cost <= treatment_cost * sizes[0] + reference_cost * sizes[1]
 
-    if (
-        request.config.is_macos
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
 
-    if (
-        request.config.is_macos
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+def test_solve_allocation_raise_error() -> None:
+    params = {"diff": 1, "margin": 0.3, "treatment_std": 1, "reference_std": 1, "alternative": "greater"}
+    with pytest.raises(ValueError):
+        solve_allocation(**params, treatment_cost=0)
+    with pytest.raises(ValueError):
+        solve_allocation(**params, reference_cost=-1)
 
-    if (
-        request.config.is_windows
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
 
+def test_solve_treatment_mean(case: TestCase) -> None:
     assert (
         round(
             solve_treatment_mean(
@@ -933,148 +500,7 @@ def test_solve_treatment_mean(case: TestCase, request: pytest.FixtureRequest) ->
     )
 
 
-def test_solve_reference_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (
-        request.config.is_linux
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_linux
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_windows
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_reference_mean(case: TestCase) -> None:
     assert (
         round(
             solve_reference_mean(
@@ -1098,148 +524,7 @@ def test_solve_reference_mean(case: TestCase, request: pytest.FixtureRequest) ->
     )
 
 
-def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (
-        request.config.is_linux
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            )
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_linux
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            )
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            )
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            )
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_windows
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            )
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_diff(case: TestCase) -> None:
     assert (
         round(
             solve_diff(
@@ -1262,148 +547,7 @@ def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
     )
 
 
-def test_solve_margin(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (
-        request.config.is_linux
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_linux
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py310
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8014,
-                dist="t",
-                equal_var=False,
-                approx_t_method="satterthwaite",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_macos
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        request.config.is_windows
-        and request.config.is_py311
-        and case
-        in [
-            TestCase(
-                treatment_mean=40,
-                reference_mean=10,
-                diff=30,
-                margin=15,
-                treatment_std=40,
-                reference_std=40,
-                treatment_size=85,
-                reference_size=170,
-                alternative="greater",
-                alpha=0.025,
-                power=0.8,
-                actual_power=0.8015,
-                dist="t",
-                equal_var=False,
-                approx_t_method="welch",
-            ),
-        ]
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_margin(case: TestCase) -> None:
     assert (
         round(
             solve_margin(
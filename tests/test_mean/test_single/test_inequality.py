@@ -7,9 +7,11 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
 from pystatpower.mean.single.inequality import _ParamsValidator
+from pystatpower.mean.single.inequality import power_curve
 from pystatpower.mean.single.inequality import solve_diff
 from pystatpower.mean.single.inequality import solve_mean
 from pystatpower.mean.single.inequality import solve_null_mean
@@ -232,7 +234,6 @@ case_group = case_group_z + case_group_t
 
 
 def test_solve_power(case: TestCase) -> None:
-
     assert round(
         solve_power(
             null_mean=case.null_mean,
@@ -247,22 +248,45 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
-def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize("dist", ["z", "t"])
+@pytest.mark.parametrize("alternative", ["two-sided", "greater", "less"])
+def test_solve_power_broadcast(alternative: Literal["two-sided", "greater", "less"], dist: Literal["z", "t"]) -> None:
+    diffs = [-12, -5, 8, 15]
+    sizes = [[10], [25], [60]]
+    alphas = [0.01, 0.05, 0.1, 0.2]
 
-    if (
-        case.mean in (30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40)
-        and case.alternative == "two-sided"
-        and case.dist == "t"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+    result = solve_power(diff=diffs, std=20, size=sizes, alternative=alternative, alpha=alphas, dist=dist)
+    expected = [
+        [
+            solve_power(diff=diff, std=20, size=size[0], alternative=alternative, alpha=alpha, dist=dist)
+            for diff, alpha in zip(diffs, alphas, strict=True)
+        ]
+        for size in sizes
+    ]
+
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (3, 4)
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+    result = solve_power(mean=np.array([30, 35]), null_mean=20, std=20, size=20, alternative=alternative, dist=dist)
+    assert result.shape == (2,)
+    assert isinstance(solve_power(mean=30, null_mean=20, std=20, size=20, alternative=alternative, dist=dist), float)
 
-    if case.mean in (30, 34, 40) and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
 
+@pytest.mark.parametrize("dist", ["z", "t"])
+@pytest.mark.parametrize("alternative", ["two-sided", "greater", "less"])
+def test_power_curve(alternative: Literal["two-sided", "greater", "less"], dist: Literal["z", "t"]) -> None:
+    sizes = np.arange(2, 120)
+    diff = -4 if alternative == "less" else 4
+
+    result = power_curve(diff=diff, std=15, sizes=sizes, alternative=alternative, dist=dist)
+    expected = [solve_power(diff=diff, std=15, size=size, alternative=alternative, dist=dist) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_solve_size(case: TestCase) -> None:
     assert (
         solve_size(
             null_mean=case.null_mean,
@@ -277,22 +301,36 @@ def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
     )
 
 
-def test_solve_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize("alternative", ["two-sided", "greater", "less"])
+def test_solve_size_vectorized(alternative: Literal["two-sided", "greater", "less"]) -> None:
+    cases = [case for case in case_group_z if case.alternative == alternative]
 
-    if (
-        case.mean in (30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40)
-        and case.alternative == "two-sided"
-        and case.dist == "t"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+    result = solve_size(
+        diff=[case.diff for case in cases],
+        std=[case.std for case in cases],
+        alternative=alternative,
+        alpha=[case.alpha for case in cases],
+        power=[case.power for case in cases],
+        dist="z",
+    )
+    assert np.array_equal(result, [case.size for case in cases])
 
-    if case.mean in (30, 33) and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
 
+def test_solve_size_vectorized_elementwise() -> None:
+    # The elements solved at the lower limit agree with the scalar calls.
+    params = {"std": 0.5, "alternative": "two-sided", "dist": "z"}
+    result = solve_size(diff=[2, 0.5], **params)
+    assert result.dtype == int
+    assert np.array_equal(result, [solve_size(diff=2, **params), solve_size(diff=0.5, **params)])
+
+    # An element without a solution is NaN, and the others are still solved.
+    params = {"std": 0.5, "alternative": "two-sided"}
+    result = solve_size(diff=[0.5, 1e-9], **params)
+    assert result[0] == solve_size(diff=0.5, **params)
+    assert np.isnan(result[1])
+
+
+def test_solve_mean(case: TestCase) -> None:
     case.direction = "greater" if case.mean > case.null_mean else "less"
     assert (
         round(
@@ -317,22 +355,7 @@ def test_solve_mean_raise_error() -> None:
         solve_mean(null_mean=20, std=20, size=17, alternative="two-sided", alpha=0.05, power=0.8, dist="t")
 
 
-def test_solve_null_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (
-        case.mean in (30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40)
-        and case.alternative == "two-sided"
-        and case.dist == "t"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if case.mean in (33,) and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_null_mean(case: TestCase) -> None:
     case.direction = "greater" if case.null_mean > case.mean else "less"
     assert (
         round(
@@ -357,22 +380,7 @@ def test_solve_null_mean_raise_error() -> None:
         solve_null_mean(mean=20, std=20, size=17, alternative="two-sided", alpha=0.05, power=0.8, dist="t")
 
 
-def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if (
-        case.mean in (30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40)
-        and case.alternative == "two-sided"
-        and case.dist == "t"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if case.mean in (30, 33) and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_diff(case: TestCase) -> None:
     direction = "greater" if case.mean > case.null_mean else "less"
     assert (
         round(
@@ -396,7 +404,7 @@ def test_solve_diff_raise_error() -> None:
         solve_diff(std=20, size=17, alternative="two-sided", alpha=0.05, power=0.8, dist="t")
 
 
-def test_solve_std(case: TestCase, request: pytest.FixtureRequest) -> None:
+def test_solve_std(case: TestCase) -> None:
     assert (
         round(
             solve_std(
@@ -8,10 +8,12 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
 from pystatpower.mean.single.noninferiority import _margin
 from pystatpower.mean.single.noninferiority import _ParamsValidator
+from pystatpower.mean.single.noninferiority import power_curve
 from pystatpower.mean.single.noninferiority import solve_diff
 from pystatpower.mean.single.noninferiority import solve_margin
 from pystatpower.mean.single.noninferiority import solve_mean
@@ -362,7 +364,6 @@ case_group = case_group_z + case_group_t
 
 
 def test_solve_power(case: TestCase) -> None:
-
     assert round(
         solve_power(
             mean=case.mean,
@@ -381,13 +382,22 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
-def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize("dist", ["z", "t"])
+@pytest.mark.parametrize("alternative", ["greater", "less"])
+def test_power_curve(alternative: Literal["greater", "less"], dist: Literal["z", "t"]) -> None:
+    sizes = np.arange(2, 120)
+    diff = 1 if alternative == "greater" else -1
 
-    if case.margin in [-18.0, -12.0, -8.0, -5.0, -3.0] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+    result = power_curve(diff=diff, margin=4, std=15, sizes=sizes, alternative=alternative, dist=dist)
+    expected = [
+        solve_power(diff=diff, margin=4, std=15, size=size, alternative=alternative, dist=dist) for size in sizes
+    ]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
 
+
+def test_solve_size(case: TestCase) -> None:
     assert (
         solve_size(
             mean=case.mean,
@@ -406,13 +416,7 @@ def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
     )
 
 
-def test_solve_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [-12.5, -5.0] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_mean(case: TestCase) -> None:
     assert round(
         solve_mean(
             null_mean=case.null_mean,
@@ -429,13 +433,7 @@ def test_solve_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
     ) == round(case.mean, 2)
 
 
-def test_solve_null_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [-12.5, -5.0] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_null_mean(case: TestCase) -> None:
     assert round(
         solve_null_mean(
             mean=case.mean,
@@ -451,13 +449,7 @@ def test_solve_null_mean(case: TestCase, request: pytest.FixtureRequest) -> None
     ) == round(case.null_mean, 2)
 
 
-def test_solve_margin(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [-12.5, -5.0] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_margin(case: TestCase) -> None:
     assert (
         round(
             solve_margin(
@@ -477,13 +469,7 @@ def test_solve_margin(case: TestCase, request: pytest.FixtureRequest) -> None:
     )
 
 
-def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [-9.5, -9.0, -3.5] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_diff(case: TestCase) -> None:
     assert (
         round(
             solve_diff(
@@ -501,13 +487,7 @@ def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
     )
 
 
-def test_solve_noninferiority_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [-12.0, -11.5] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_noninferiority_mean(case: TestCase) -> None:
     assert round(
         solve_noninferiority_mean(
             mean=case.mean,
@@ -522,22 +502,7 @@ def test_solve_noninferiority_mean(case: TestCase, request: pytest.FixtureReques
     ) == round(case.noninferiority_mean, 2)
 
 
-def test_solve_offset(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [-15.5, -7.5] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        case.margin in [3.0, 3.5, 4.0, 4.5, 6.5, 7.5, 8.5, 9.5, 10.5, 11.0, 11.5, 13.0, 14.0, 14.5, 15.0, 16.0, 18.0]
-        and case.alternative == "less"
-        and case.dist == "t"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_offset(case: TestCase) -> None:
     assert round(
         solve_offset(
             std=case.std,
@@ -9,10 +9,12 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
 from pystatpower.mean.single.superiority import _margin
 from pystatpower.mean.single.superiority import _ParamsValidator
+from pystatpower.mean.single.superiority import power_curve
 from pystatpower.mean.single.superiority import solve_diff
 from pystatpower.mean.single.superiority import solve_margin
 from pystatpower.mean.single.superiority import solve_mean
@@ -363,7 +365,6 @@ case_group = case_group_z + case_group_t
 
 
 def test_solve_power(case: TestCase) -> None:
-
     assert round(
         solve_power(
             mean=case.mean,
@@ -382,13 +383,22 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
-def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
+@pytest.mark.parametrize("dist", ["z", "t"])
+@pytest.mark.parametrize("alternative", ["greater", "less"])
+def test_power_curve(alternative: Literal["greater", "less"], dist: Literal["z", "t"]) -> None:
+    sizes = np.arange(2, 120)
+    diff = 6 if alternative == "greater" else -6
 
-    if case.margin in [2.0, 8.0, 12.0, 17.0] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
+    result = power_curve(diff=diff, margin=2, std=15, sizes=sizes, alternative=alternative, dist=dist)
+    expected = [
+        solve_power(diff=diff, margin=2, std=15, size=size, alternative=alternative, dist=dist) for size in sizes
+    ]
 
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_solve_size(case: TestCase) -> None:
     assert (
         solve_size(
             mean=case.mean,
@@ -407,13 +417,7 @@ def test_solve_size(case: TestCase, request: pytest.FixtureRequest) -> None:
     )
 
 
-def test_solve_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [7.5, 15.0] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_mean(case: TestCase) -> None:
     assert round(
         solve_mean(
             null_mean=case.null_mean,
@@ -430,13 +434,7 @@ def test_solve_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
     ) == round(case.mean, 2)
 
 
-def test_solve_null_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [7.5, 15.0] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_null_mean(case: TestCase) -> None:
     assert round(
         solve_null_mean(
             mean=case.mean,
@@ -453,7 +451,6 @@ def test_solve_null_mean(case: TestCase, request: pytest.FixtureRequest) -> None
 
 
 def test_solve_margin(case: TestCase) -> None:
-
     assert (
         round(
             solve_margin(
@@ -473,13 +470,7 @@ def test_solve_margin(case: TestCase) -> None:
     )
 
 
-def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [10.5, 11.0, 16.5] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_diff(case: TestCase) -> None:
     assert (
         round(
             solve_diff(
@@ -497,13 +488,7 @@ def test_solve_diff(case: TestCase, request: pytest.FixtureRequest) -> None:
     )
 
 
-def test_solve_superiority_mean(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [8.0, 8.5] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_superiority_mean(case: TestCase) -> None:
     assert round(
         solve_superiority_mean(
             mean=case.mean,
@@ -518,41 +503,7 @@ def test_solve_superiority_mean(case: TestCase, request: pytest.FixtureRequest)
     ) == round(case.superiority_mean, 2)
 
 
-def test_solve_offset(case: TestCase, request: pytest.FixtureRequest) -> None:
-
-    if case.margin in [4.5, 12.5] and case.alternative == "greater" and case.dist == "t":
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
-    if (
-        case.margin
-        in [
-            -17.0,
-            -16.5,
-            -16.0,
-            -15.5,
-            -13.5,
-            -12.5,
-            -11.5,
-            -10.5,
-            -9.5,
-            -9.0,
-            -8.5,
-            -7.0,
-            -6.0,
-            -5.5,
-            -5.0,
-            -4.0,
-            -2.0,
-        ]
-        and case.alternative == "less"
-        and case.dist == "t"
-    ):
-        request.node.add_marker(
-            pytest.mark.xfail(reason="SciPy upstream bug: https://github.com/scipy/scipy/issues/25470")
-        )
-
+def test_solve_offset(case: TestCase) -> None:
     assert round(
         solve_offset(
             std=case.std,
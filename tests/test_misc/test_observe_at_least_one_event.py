@@ -4,6 +4,10 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+import pytest
+
+from pystatpower.misc.observe_at_least_one_event import power_curve
 from pystatpower.misc.observe_at_least_one_event import solve_power
 from pystatpower.misc.observe_at_least_one_event import solve_proportion
 from pystatpower.misc.observe_at_least_one_event import solve_size
@@ -98,6 +102,17 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
+@pytest.mark.parametrize("dist", ["bin", "poisson"])
+def test_power_curve(dist: Literal["bin", "poisson"]) -> None:
+    sizes = np.arange(1, 300)
+
+    result = power_curve(proportion=0.01, sizes=sizes, dist=dist)
+    expected = [solve_power(proportion=0.01, size=size, dist=dist) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
 def test_solve_size(case: TestCase) -> None:
 
     assert (
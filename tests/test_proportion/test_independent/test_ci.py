@@ -7,7 +7,11 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import pytest
+
 from pystatpower.exceptions import SolutionNotFoundError
+from pystatpower.proportion.independent.ci import _distance
+from pystatpower.proportion.independent.ci import _distance_function
 from pystatpower.proportion.independent.ci import solve_distance
 from pystatpower.proportion.independent.ci import solve_reference_proportion
 from pystatpower.proportion.independent.ci import solve_size
@@ -914,3 +918,13 @@ def test_solve_reference_proportion(case: TestCase) -> None:
         pass
 
     assert case.reference_proportion in [round(x, 2) for x in reference_proportion_solutions]
+
+
+@pytest.mark.parametrize("method", ["fm", "mn"])
+@pytest.mark.parametrize("interval_type", ["two-sided", "lower", "upper"])
+def test_distance_function_warm_start(method: str, interval_type: str) -> None:
+    distance_of = _distance_function(0.3, 0.15, 0.95, interval_type, method)
+    for size in (10, 2000, 35, 36, 1e6, 7, 500):
+        assert distance_of(size, 1.5 * size) == pytest.approx(
+            _distance(0.3, 0.15, size, 1.5 * size, 0.95, interval_type, method), rel=1e-9
+        )
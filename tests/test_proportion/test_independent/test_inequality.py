@@ -7,6 +7,15 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+import pytest
+
+from scipy.stats import barnard_exact
+
+from pystatpower.exceptions import SolutionNotFoundError
+from pystatpower.proportion.independent._power import _exact_region
+from pystatpower.proportion.independent.inequality import power_curve
+from pystatpower.proportion.independent.inequality import solve_allocation
 from pystatpower.proportion.independent.inequality import solve_power
 from pystatpower.proportion.independent.inequality import solve_reference_proportion
 from pystatpower.proportion.independent.inequality import solve_size
@@ -461,6 +470,29 @@ def test_size_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
+@pytest.mark.parametrize("ratio", [0.5, 1, 1.5, 2])
+@pytest.mark.parametrize(
+    ("method", "continuity_correction"),
+    [("z-pooled", False), ("z-pooled", True), ("z-unpooled", False), ("z-unpooled", True)],
+)
+def test_power_curve(method: Literal["z-pooled", "z-unpooled"], continuity_correction: bool, ratio: float) -> None:
+    sizes = np.arange(2, 300)
+    params = {
+        "treatment_proportion": 0.6,
+        "reference_proportion": 0.45,
+        "alternative": "two-sided",
+        "method": method,
+        "continuity_correction": continuity_correction,
+    }
+
+    result = power_curve(sizes=sizes, ratio=ratio, **params)
+    # The sample sizes in the treatment group are rounded up, as in `solve_size`.
+    expected = [solve_power(treatment_size=np.ceil(size * ratio), reference_size=size, **params) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
 def test_solve_size(case: TestCase) -> None:
     assert solve_size(
         treatment_proportion=case.treatment_proportion,
@@ -474,6 +506,62 @@ def test_solve_size(case: TestCase) -> None:
     ) == (case.treatment_size, case.reference_size)
 
 
+@pytest.mark.parametrize(("treatment_cost", "reference_cost"), [(1, 1), (4, 1), (1, 2.5)])
+def test_solve_allocation(treatment_cost: float, reference_cost: float) -> None:
+    params = {"treatment_proportion": 0.6, "reference_proportion": 0.4, "alternative": "two-sided"}
+    treatment_size, reference_size = solve_allocation(
+        **params, treatment_cost=treatment_cost, reference_cost=reference_cost
+    )
+    cost = treatment_cost * treatment_size + reference_cost * reference_size
+
+    # The design reaches the power, and no group can be reduced by one subject.
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size) >= 0.8
+    assert solve_power(**params, treatment_size=treatment_size - 1, reference_size=reference_size) < 0.8
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size - 1) < 0.8
+
+    # No fixed allocation ratio is cheaper.
+    for ratio in np.geomspace(0.25, 4, 17):
+        sizes = solve_size(**params, ratio=ratio)
+        assert cost <= treatment_cost * sizes[0] + reference_cost * sizes[1]
+
+
+def test_solve_allocation_raise_error() -> None:
+    params = {"treatment_proportion": 0.6, "reference_proportion": 0.4, "alternative": "two-sided"}
+    with pytest.raises(ValueError):
+        solve_allocation(**params, treatment_cost=0)
+    with pytest.raises(ValueError):
+        solve_allocation(**params, reference_cost=-1)
+
+
+@pytest.mark.parametrize(
+    "group", [case_group_pooled, case_group_pooled_cc, case_group_unpooled, case_group_unpooled_cc]
+)
+def test_solve_size_vectorized(group: list[TestCase]) -> None:
+    for alternative in ("one-sided", "two-sided"):
+        cases = [case for case in group if case.alternative == alternative]
+        treatment_size, reference_size = solve_size(
+            treatment_proportion=[case.treatment_proportion for case in cases],
+            reference_proportion=[case.reference_proportion for case in cases],
+            alternative=alternative,
+            ratio=[case.ratio for case in cases],
+            alpha=[case.alpha for case in cases],
+            power=[case.power for case in cases],
+            method=cases[0].method,
+            continuity_correction=cases[0].continuity_correction,
+        )
+        assert np.array_equal(treatment_size, [case.treatment_size for case in cases])
+        assert np.array_equal(reference_size, [case.reference_size for case in cases])
+
+
+def test_solve_size_vectorized_elementwise() -> None:
+    # An element without a solution is NaN, and the others are still solved.
+    params = {"reference_proportion": 0.5, "alternative": "two-sided", "ratio": 2}
+    treatment_size, reference_size = solve_size(treatment_proportion=[0.6, 0.5], **params)
+    assert (treatment_size[0], reference_size[0]) == solve_size(treatment_proportion=0.6, **params)
+    assert np.isnan(treatment_size[1])
+    assert np.isnan(reference_size[1])
+
+
 def test_solve_treatment_proportion(case: TestCase) -> None:
     direction = "greater" if case.treatment_proportion > case.reference_proportion else "less"
     assert (
@@ -514,3 +602,123 @@ def test_solve_reference_proportion(case: TestCase) -> None:
         )
         == case.reference_proportion
     )
+
+
+@pytest.mark.parametrize(
+    ("treatment_size", "reference_size", "alternative"),
+    [(10, 12, "greater"), (15, 15, "two-sided"), (8, 14, "less")],
+)
+def test_exact_region(
+    treatment_size: int, reference_size: int, alternative: Literal["two-sided", "greater", "less"]
+) -> None:
+    # The exact unconditional test rejects the outcomes whose p-value of Barnard's test with pooled variance is at most
+    # the significance level.
+    region = _exact_region(treatment_size, reference_size, alternative, 0.05)
+    for x1 in range(treatment_size + 1):
+        for x2 in range(reference_size + 1):
+            table = [[x1, x2], [treatment_size - x1, reference_size - x2]]
+            assert region[x1, x2] == (barnard_exact(table, alternative=alternative).pvalue <= 0.05)
+
+
+@pytest.mark.parametrize("alternative", ["one-sided", "two-sided"])
+def test_exact_power(alternative: Literal["one-sided", "two-sided"]) -> None:
+    params = {"alternative": alternative, "alpha": 0.05, "method": "exact"}
+
+    # The size of the test stays below the significance level at every common proportion.
+    for proportion in np.linspace(0.05, 0.95, 19):
+        for treatment_size, reference_size in [(20, 20), (35, 50), (120, 80)]:
+            size = solve_power(
+                treatment_proportion=proportion + 1e-9,
+                reference_proportion=proportion,
+                treatment_size=treatment_size,
+                reference_size=reference_size,
+                **params,
+            )
+            assert size <= 0.05
+
+    # The exact power is close to the power of the z-test with pooled variance in large samples, and vectorized.
+    proportions = {"treatment_proportion": [0.6, 0.3], "reference_proportion": 0.45}
+    exact_power = solve_power(**proportions, treatment_size=[150, 200], reference_size=150, **params)
+    pooled_power = solve_power(
+        **proportions, treatment_size=[150, 200], reference_size=150, **(params | {"method": "z-pooled"})
+    )
+    assert exact_power.shape == (2,)
+    assert np.allclose(exact_power, pooled_power, rtol=0, atol=0.03)
+
+    curve = power_curve(treatment_proportion=0.6, reference_proportion=0.45, sizes=np.arange(2, 60), ratio=2, **params)
+    expected = [
+        solve_power(
+            treatment_proportion=0.6, reference_proportion=0.45, treatment_size=2 * size, reference_size=size, **params
+        )
+        for size in np.arange(2, 60)
+    ]
+    assert np.array_equal(curve, expected)
+
+    # With a fractional ratio, the sample sizes in the treatment group are rounded up, as in `solve_size`.
+    curve = power_curve(treatment_proportion=0.6, reference_proportion=0.4, sizes=[10, 11], ratio=1.5, **params)
+    expected = [
+        solve_power(treatment_proportion=0.6, reference_proportion=0.4, treatment_size=t, reference_size=r, **params)
+        for t, r in [(15, 10), (17, 11)]
+    ]
+    assert np.array_equal(curve, expected)
+
+
+@pytest.mark.parametrize(
+    ("treatment_proportion", "reference_proportion", "alternative", "ratio", "power"),
+    [
+        (0.6, 0.4, "two-sided", 1, 0.8),
+        (0.3, 0.15, "one-sided", 2, 0.8),
+        (0.5, 0.65, "two-sided", 0.5, 0.9),
+        (0.1, 0.02, "one-sided", 1, 0.8),
+    ],
+)
+def test_exact_solve_size(
+    treatment_proportion: float,
+    reference_proportion: float,
+    alternative: Literal["one-sided", "two-sided"],
+    ratio: float,
+    power: float,
+) -> None:
+    params = {"treatment_proportion": treatment_proportion, "reference_proportion": reference_proportion}
+    params |= {"alternative": alternative, "alpha": 0.05, "method": "exact"}
+    treatment_size, reference_size = solve_size(**params, ratio=ratio, power=power)
+
+    # The design reaches the power, and the design one subject smaller in the smaller group does not.
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size) >= power
+    if ratio >= 1:
+        smaller = (int(np.ceil((reference_size - 1) * ratio)), reference_size - 1)
+    else:
+        smaller = (treatment_size - 1, int(np.ceil((treatment_size - 1) / ratio)))
+    assert solve_power(**params, treatment_size=smaller[0], reference_size=smaller[1]) < power
+
+    # The exact test needs a few more subjects than the z-test with pooled variance.
+    pooled_sizes = solve_size(**(params | {"method": "z-pooled"}), ratio=ratio, power=power)
+    assert 0.9 <= reference_size / pooled_sizes[1] <= 1.25
+
+
+def test_exact_solve_size_vectorized() -> None:
+    params = {"reference_proportion": 0.4, "alternative": "two-sided", "method": "exact"}
+    treatment_size, reference_size = solve_size(**params, treatment_proportion=[0.6, 0.2], ratio=[1, 2])
+    assert np.array_equal(
+        treatment_size,
+        [solve_size(**params, treatment_proportion=0.6)[0], solve_size(**params, treatment_proportion=0.2, ratio=2)[0]],
+    )
+    assert np.array_equal(
+        reference_size,
+        [solve_size(**params, treatment_proportion=0.6)[1], solve_size(**params, treatment_proportion=0.2, ratio=2)[1]],
+    )
+
+    # The elements without a solution are NaN, rather than failing the whole array.
+    treatment_size, reference_size = solve_size(**params, treatment_proportion=[0.6, 0.4])
+    assert np.isnan(treatment_size[1]) and np.isnan(reference_size[1])
+    assert (treatment_size[0], reference_size[0]) == solve_size(**params, treatment_proportion=0.6)
+
+
+def test_exact_raise_error() -> None:
+    params = {"treatment_proportion": 0.6, "reference_proportion": 0.4, "alternative": "two-sided", "method": "exact"}
+    with pytest.raises(ValueError):
+        solve_power(**params, treatment_size=20.5, reference_size=20)
+    with pytest.raises(ValueError):
+        solve_power(**params, treatment_size=20, reference_size=0)
+    with pytest.raises(SolutionNotFoundError):
+        solve_size(**(params | {"treatment_proportion": 0.4}))
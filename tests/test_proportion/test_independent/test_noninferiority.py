@@ -7,6 +7,11 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+import pytest
+
+from pystatpower.proportion.independent.noninferiority import power_curve
+from pystatpower.proportion.independent.noninferiority import solve_allocation
 from pystatpower.proportion.independent.noninferiority import solve_margin
 from pystatpower.proportion.independent.noninferiority import solve_power
 from pystatpower.proportion.independent.noninferiority import solve_reference_proportion
@@ -329,6 +334,30 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
+@pytest.mark.parametrize("ratio", [0.5, 1, 1.5, 2])
+@pytest.mark.parametrize(
+    ("method", "continuity_correction"),
+    [("z-pooled", False), ("z-pooled", True), ("z-unpooled", False), ("z-unpooled", True)],
+)
+def test_power_curve(method: Literal["z-pooled", "z-unpooled"], continuity_correction: bool, ratio: float) -> None:
+    sizes = np.arange(2, 300)
+    params = {
+        "treatment_proportion": 0.6,
+        "reference_proportion": 0.6,
+        "margin": 0.1,
+        "alternative": "greater",
+        "method": method,
+        "continuity_correction": continuity_correction,
+    }
+
+    result = power_curve(sizes=sizes, ratio=ratio, **params)
+    # The sample sizes in the treatment group are rounded up, as in `solve_size`.
+    expected = [solve_power(treatment_size=np.ceil(size * ratio), reference_size=size, **params) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
 def test_solve_size(case: TestCase) -> None:
     assert solve_size(
         treatment_proportion=case.treatment_proportion,
@@ -343,6 +372,43 @@ def test_solve_size(case: TestCase) -> None:
     ) == (case.treatment_size, case.reference_size)
 
 
+@pytest.mark.parametrize(("treatment_cost", "reference_cost"), [(1, 1), (4, 1), (1, 2.5)])
+def test_solve_allocation(treatment_cost: float, reference_cost: float) -> None:
+    params = {
+        "treatment_proportion": 0.6,
+        "reference_proportion": 0.6,
+        "margin": 0.1,
+        "alternative": "greater",
+    }
+    treatment_size, reference_size = solve_allocation(
+        **params, treatment_cost=treatment_cost, reference_cost=reference_cost
+    )
+    cost = treatment_cost * treatment_size + reference_cost * reference_size
+
+    # The design reaches the power, and no group can be reduced by one subject.
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size) >= 0.8
+    assert solve_power(**params, treatment_size=treatment_size - 1, reference_size=reference_size) < 0.8
+    assert solve_power(**params, treatment_size=treatment_size, reference_size=reference_size - 1) < 0.8
+
+    # No fixed allocation ratio is cheaper.
+    for ratio in np.geomspace(0.25, 4, 17):
+        sizes = solve_size(**params, ratio=ratio)
+        assert cost <= treatment_cost * sizes[0] + reference_cost * sizes[1]
+
+
+def test_solve_allocation_raise_error() -> None:
+    params = {
+        "treatment_proportion": 0.6,
+        "reference_proportion": 0.6,
+        "margin": 0.1,
+        "alternative": "greater",
+    }
+    with pytest.raises(ValueError):
+        solve_allocation(**params, treatment_cost=0)
+    with pytest.raises(ValueError):
+        solve_allocation(**params, reference_cost=-1)
+
+
 def test_solve_treatment_proportion(case: TestCase) -> None:
     assert (
         round(
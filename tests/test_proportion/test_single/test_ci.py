@@ -7,6 +7,9 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+import pytest
+
 from pystatpower.proportion.single.ci import solve_distance
 from pystatpower.proportion.single.ci import solve_proportion
 from pystatpower.proportion.single.ci import solve_size
@@ -539,3 +542,33 @@ def test_solve_proportion_exact_eq_0_5() -> None:
     assert (
         solve_proportion(size=402, distance=0.099930088, conf_level=0.95, interval_type="two-sided", method="cp") == 0.5
     )
+
+
+@pytest.mark.parametrize(
+    ("proportion", "distance", "interval_type", "size", "strict_size"),
+    [
+        (0.1, 0.05, "two-sided", 592, 596),
+        (0.02, 0.05, "two-sided", 160, 180),
+        (0.1, 0.05, "lower", 65, 85),
+        (0.1, 0.02, "upper", 704, 786),
+        (0.97, 0.05, "lower", 77, 95),
+        (0.5, 0.1, "two-sided", 402, 402),
+    ],
+)
+def test_solve_size_integer_count(
+    proportion: float,
+    distance: float,
+    interval_type: Literal["two-sided", "lower", "upper"],
+    size: int,
+    strict_size: int,
+) -> None:
+    params = {"proportion": proportion, "distance": distance, "interval_type": interval_type, "integer_count": True}
+    assert solve_size(**params) == size
+    assert solve_size(**params, strict=True) == strict_size
+
+    # the distance is achieved from the strict sample size onwards, but not just before it, nor before the first one
+    del params["distance"]
+    actual_distance = np.array([solve_distance(**params, size=size) for size in range(1, 5 * strict_size)])
+    achieved = actual_distance <= distance
+    assert np.flatnonzero(achieved)[0] + 1 == size
+    assert np.flatnonzero(~achieved)[-1] + 2 == strict_size
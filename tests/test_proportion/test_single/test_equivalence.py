@@ -7,6 +7,10 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+import pytest
+
+from pystatpower.proportion.single.equivalence import power_curve
 from pystatpower.proportion.single.equivalence import solve_power
 from pystatpower.proportion.single.equivalence import solve_size
 from tests.models import BaseTestCase
@@ -193,6 +197,27 @@ def test_size_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
+@pytest.mark.parametrize(
+    ("method", "continuity_correction"), [("z-p0", False), ("z-p0", True), ("z-phat", False), ("z-phat", True)]
+)
+def test_power_curve(method: Literal["z-p0", "z-phat"], continuity_correction: bool) -> None:
+    sizes = np.arange(1, 300)
+    params = {
+        "proportion": 0.52,
+        "null_proportion": 0.5,
+        "margin_lower": -0.15,
+        "margin_upper": 0.15,
+        "method": method,
+        "continuity_correction": continuity_correction,
+    }
+
+    result = power_curve(sizes=sizes, **params)
+    expected = [solve_power(size=size, **params) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
 def test_solve_size(case: TestCase) -> None:
     assert (
         solve_size(
@@ -8,8 +8,11 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
+from pystatpower.exceptions import SolutionNotFoundError
+from pystatpower.proportion.single.inequality import power_curve
 from pystatpower.proportion.single.inequality import solve_null_proportion
 from pystatpower.proportion.single.inequality import solve_power
 from pystatpower.proportion.single.inequality import solve_proportion
@@ -603,6 +606,32 @@ def test_solve_power(case: TestCase) -> None:
     ) == round(case.actual_power, 6)
 
 
+@pytest.mark.parametrize(
+    ("method", "continuity_correction"),
+    [("exact", False), ("z-p0", False), ("z-p0", True), ("z-phat", False), ("z-phat", True)],
+)
+@pytest.mark.parametrize("alternative", ["two-sided", "greater", "less"])
+def test_power_curve(
+    alternative: Literal["two-sided", "greater", "less"],
+    method: Literal["exact", "z-p0", "z-phat"],
+    continuity_correction: bool,
+) -> None:
+    sizes = np.arange(1, 300)
+    params = {
+        "proportion": 0.35 if alternative == "less" else 0.65,
+        "null_proportion": 0.5,
+        "alternative": alternative,
+        "method": method,
+        "continuity_correction": continuity_correction,
+    }
+
+    result = power_curve(sizes=sizes, **params)
+    expected = [solve_power(size=size, **params) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
 def test_solve_size(case: TestCase) -> None:
     assert (
         solve_size(
@@ -618,6 +647,38 @@ def test_solve_size(case: TestCase) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("proportion", "null_proportion", "alternative", "size", "strict_size"),
+    [
+        (0.70, 0.80, "two-sided", 144, 155),
+        (0.90, 0.80, "greater", 82, 94),
+        (0.40, 0.50, "less", 158, 169),
+        (0.12, 0.05, "greater", 94, 112),
+    ],
+)
+def test_solve_size_strict(
+    proportion: float,
+    null_proportion: float,
+    alternative: Literal["two-sided", "greater", "less"],
+    size: int,
+    strict_size: int,
+) -> None:
+    params = {"proportion": proportion, "null_proportion": null_proportion, "alternative": alternative}
+    assert solve_size(**params, method="exact") == size
+    assert solve_size(**params, method="exact", strict=True) == strict_size
+
+    # the power stays above the target from the strict sample size onwards, but not just before it
+    sizes = np.arange(strict_size - 1, 10 * strict_size)
+    actual_power = np.array([solve_power(**params, size=size, method="exact") for size in sizes])
+    assert actual_power[0] < 0.8
+    assert np.all(actual_power[1:] >= 0.8)
+
+
+def test_solve_size_raise_error() -> None:
+    with pytest.raises(SolutionNotFoundError):
+        solve_size(proportion=0.5, null_proportion=0.5, alternative="two-sided", method="exact")
+
+
 def test_solve_proportion(case: TestCase) -> None:
     direction = "greater" if case.proportion > case.null_proportion else "less"
     assert (
@@ -7,9 +7,11 @@
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 import pytest
 
 from pystatpower.proportion.single.noninferiority import _verify_and_get_noninf_proportion
+from pystatpower.proportion.single.noninferiority import power_curve
 from pystatpower.proportion.single.noninferiority import solve_margin
 from pystatpower.proportion.single.noninferiority import solve_noninferiority_proportion
 from pystatpower.proportion.single.noninferiority import solve_null_proportion
@@ -339,6 +341,30 @@ def test_size_solve_power(case: TestCase) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("method", "continuity_correction"), [("z-p0", False), ("z-p0", True), ("z-phat", False), ("z-phat", True)]
+)
+@pytest.mark.parametrize("alternative", ["greater", "less"])
+def test_power_curve(
+    alternative: Literal["greater", "less"], method: Literal["z-p0", "z-phat"], continuity_correction: bool
+) -> None:
+    sizes = np.arange(1, 300)
+    params = {
+        "proportion": 0.55 if alternative == "greater" else 0.45,
+        "null_proportion": 0.5,
+        "margin": 0.1,
+        "alternative": alternative,
+        "method": method,
+        "continuity_correction": continuity_correction,
+    }
+
+    result = power_curve(sizes=sizes, **params)
+    expected = [solve_power(size=size, **params) for size in sizes]
+
+    assert result.shape == sizes.shape
+    assert np.allclose(result, expected, rtol=0, atol=1e-12)
+
+
 def test_solve_size(case: TestCase) -> None:
     assert (
         solve_size(
@@ -0,0 +1,115 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+import threading
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+from typing import Any
+
+import pytest
+
+from pystatpower import serve
+from pystatpower.mean.single import inequality
+from pystatpower.proportion.single.inequality import solve_size
+
+
+@pytest.fixture(scope="module")
+def server() -> Iterator[serve.Server]:
+    server = serve.Server(port=0, workers=2, batch_window=0.05)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+
+
+def request(server: serve.Server, method: str, path: str, body: Any = None) -> tuple[int, Any]:
+    connection = HTTPConnection(*server.address, timeout=60)
+    try:
+        connection.request(method, path, body=None if body is None else json.dumps(body))
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_solve(server: serve.Server) -> None:
+    assert request(server, "POST", "/mean/single/inequality/solve_size", {"diff": 1, "std": 2}) == (
+        200,
+        {"value": inequality.solve_size(diff=1, std=2)},
+    )
+    status, reply = request(server, "POST", "/mean.single.inequality.solve_power", {"diff": 1, "std": 2, "size": 20})
+    assert status == 200
+    assert reply["value"] == pytest.approx(inequality.solve_power(diff=1, std=2, size=20))
+
+    status, reply = request(
+        server,
+        "POST",
+        "/proportion/single/inequality/solve_size",
+        [{"proportion": 0.6, "null_proportion": 0.5}, {"proportion": 0.5, "null_proportion": 0.5}, {"proportion": 0.6}],
+    )
+    assert status == 200
+    assert reply[0] == {"value": solve_size(proportion=0.6, null_proportion=0.5)}
+    assert reply[1]["error"]["type"] == "SolutionNotFoundError"
+    assert reply[2]["error"]["type"] == "TypeError"
+
+
+def test_batching_and_cache(server: serve.Server) -> None:
+    diffs = [0.5 + 0.05 * i for i in range(16)]
+    before = server.stats()
+    with ThreadPoolExecutor(max_workers=len(diffs)) as executor:
+        replies = list(
+            executor.map(
+                lambda diff: request(server, "POST", "/mean/single/inequality/solve_size", {"diff": diff, "std": 1}),
+                diffs,
+            )
+        )
+    assert replies == [(200, {"value": inequality.solve_size(diff=diff, std=1)}) for diff in diffs]
+    after = server.stats()
+    assert after["batches"] - before["batches"] < len(diffs)
+
+    assert request(server, "POST", "/mean/single/inequality/solve_size", {"diff": 0.5, "std": 1.0}) == replies[0]
+    assert server.stats()["cache"]["hits"] == after["cache"]["hits"] + 1
+    assert server.stats()["batches"] == after["batches"]
+
+
+def test_errors(server: serve.Server) -> None:
+    status, reply = request(server, "POST", "/proportion/single/inequality/solve_size", {"proportion": 0.5})
+    assert status == 400
+    assert reply["error"]["type"] == "TypeError"
+    status, reply = request(
+        server, "POST", "/proportion/single/inequality/solve_size", {"proportion": 0.5, "null_proportion": 0.5}
+    )
+    assert status == 422
+    assert reply["error"]["type"] == "SolutionNotFoundError"
+    assert request(server, "POST", "/mean/single/unknown/solve_size", {})[0] == 404
+    assert request(server, "GET", "/unknown")[0] == 404
+
+    connection = HTTPConnection(*server.address, timeout=60)
+    connection.request("POST", "/mean/single/inequality/solve_size", body="{")
+    assert connection.getresponse().status == 400
+    connection.close()
+
+
+def test_endpoints(server: serve.Server) -> None:
+    assert request(server, "GET", "/health") == (200, {"status": "ok"})
+    status, functions = request(server, "GET", "/functions")
+    assert status == 200
+    assert "mean.single.inequality.solve_size" in functions
+    assert all(".solve_" in name or ".power_curve" in name for name in functions)
+
+    status, metrics = request(server, "GET", "/metrics")
+    assert status == 200
+    assert metrics["workers"] == 2
+    assert metrics["requests"] >= 1
+    assert set(metrics["cache"]) == {"hits", "misses", "entries"}
+
+
+def test_illegal_argument() -> None:
+    with pytest.raises(ValueError):
+        serve.Server(port=0, workers=0)
+    with pytest.raises(ValueError):
+        serve.Server(port=0, batch_window=-1)
@@ -0,0 +1,188 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any
+
+import pytest
+
+from pystatpower.simulation import simulate_power
+
+
+@pytest.mark.parametrize(
+    ("family", "params"),
+    [
+        ("mean.single", {"offset": 0.5, "std": 1, "size": 20, "alternative": "two-sided", "alpha": 0.05, "dist": "t"}),
+        ("mean.single", {"offset": -0.3, "std": 2, "size": 50, "alternative": "less", "alpha": 0.05, "dist": "z"}),
+        (
+            "mean.independent",
+            {
+                "diff": 0.5,
+                "margin": 0,
+                "treatment_std": 1,
+                "reference_std": 1,
+                "treatment_size": 30,
+                "reference_size": 30,
+                "alternative": "two-sided",
+                "alpha": 0.05,
+                "dist": "t",
+                "equal_var": True,
+                "approx_t_method": "welch",
+            },
+        ),
+        (
+            "mean.independent",
+            {
+                "diff": 0.5,
+                "margin": 0.1,
+                "std": 1,
+                "treatment_size": 30,
+                "reference_size": 50,
+                "alternative": "greater",
+                "alpha": 0.025,
+                "dist": "z",
+                "equal_var": True,
+                "approx_t_method": "welch",
+            },
+        ),
+        (
+            "proportion.single",
+            {
+                "proportion": 0.6,
+                "proportion_threshold": 0.5,
+                "size": 100,
+                "alternative": "two-sided",
+                "alpha": 0.05,
+                "method": "exact",
+                "continuity_correction": False,
+            },
+        ),
+        (
+            "proportion.single",
+            {
+                "proportion": 0.2,
+                "proportion_threshold": 0.3,
+                "size": 80,
+                "alternative": "less",
+                "alpha": 0.05,
+                "method": "exact",
+                "continuity_correction": False,
+            },
+        ),
+        (
+            "proportion.independent",
+            {
+                "treatment_proportion": 0.35,
+                "reference_proportion": 0.2,
+                "proportion_threshold": 0.2,
+                "treatment_size": 80,
+                "reference_size": 120,
+                "alternative": "two-sided",
+                "alpha": 0.05,
+                "method": "exact",
+                "continuity_correction": False,
+            },
+        ),
+    ],
+)
+def test_exact_power(family: str, params: dict[str, Any]) -> None:
+    # The analytic power of these tests is exact, so the simulated power matches it within the Monte Carlo error.
+    result = simulate_power(family, replicates=200_000, seed=12345, **params)
+    assert result.replicates == 200_000
+    assert result.mcse == pytest.approx((result.power * (1 - result.power) / 200_000) ** 0.5)
+    assert abs(result.z) < 4
+
+
+@pytest.mark.parametrize(
+    ("family", "params"),
+    [
+        (
+            "mean.independent",
+            {
+                "diff": 0.5,
+                "margin": 0,
+                "treatment_std": 1,
+                "reference_std": 2,
+                "treatment_size": 30,
+                "reference_size": 50,
+                "alternative": "two-sided",
+                "alpha": 0.05,
+                "dist": "t",
+                "equal_var": False,
+                "approx_t_method": "satterthwaite",
+            },
+        ),
+        (
+            "proportion.single",
+            {
+                "proportion": 0.6,
+                "proportion_threshold": 0.5,
+                "size": 100,
+                "alternative": "greater",
+                "alpha": 0.05,
+                "method": "z-p0",
+                "continuity_correction": True,
+            },
+        ),
+        (
+            "proportion.independent",
+            {
+                "treatment_proportion": 0.6,
+                "reference_proportion": 0.45,
+                "proportion_threshold": 0.45,
+                "treatment_size": 100,
+                "reference_size": 120,
+                "alternative": "two-sided",
+                "alpha": 0.05,
+                "method": "z-pooled",
+                "continuity_correction": False,
+            },
+        ),
+        (
+            "correlation",
+            {"null_correlation": 0.2, "correlation": 0.5, "alternative": "greater", "size": 40, "alpha": 0.05},
+        ),
+    ],
+)
+def test_approximate_power(family: str, params: dict[str, Any]) -> None:
+    # The analytic power of these tests is a large-sample approximation, within a few percent of the simulated power.
+    result = simulate_power(family, replicates=100_000, seed=2024, **params)
+    assert result.power == pytest.approx(result.analytic, abs=0.03)
+
+
+def test_satterthwaite_degrees_of_freedom() -> None:
+    # The simulation computes the degrees of freedom from the sample variances, and the analytic power from the
+    # population variances, so with unequal variances and small samples they differ by about 0.001, beyond the Monte
+    # Carlo error at this number of replicates. The difference is expected, and bounded here.
+    params = {"diff": 0.5, "margin": 0, "treatment_std": 1, "reference_std": 2, "treatment_size": 10}
+    params |= {"reference_size": 30, "alternative": "two-sided", "alpha": 0.05, "dist": "t", "equal_var": False}
+    result = simulate_power("mean.independent", replicates=2_000_000, seed=5, approx_t_method="satterthwaite", **params)
+    assert result.analytic == pytest.approx(0.17102, abs=1e-5)
+    assert result.z < -2
+    assert result.power == pytest.approx(result.analytic, abs=0.003)
+
+
+def test_reproducible() -> None:
+    params = {"proportion": 0.6, "proportion_threshold": 0.5, "size": 60, "alternative": "two-sided", "alpha": 0.05}
+    params |= {"method": "z-phat", "continuity_correction": False}
+    first = simulate_power("proportion.single", replicates=50_000, seed=7, chunksize=10_000, **params)
+    second = simulate_power("proportion.single", replicates=50_000, seed=7, chunksize=10_000, workers=2, **params)
+    assert first == second
+    assert first.seed == 7
+
+    other = simulate_power("proportion.single", replicates=50_000, chunksize=10_000, **params)
+    assert other.seed != 7
+    assert simulate_power("proportion.single", replicates=50_000, seed=other.seed, chunksize=10_000, **params) == other
+
+
+def test_illegal_argument() -> None:
+    params = {"offset": 0.5, "std": 1, "size": 20, "alternative": "two-sided", "alpha": 0.05}
+    with pytest.raises(ValueError):
+        simulate_power("mean.paired", **params)
+    with pytest.raises(ValueError):
+        simulate_power("mean.single", replicates=0, **params)
+    with pytest.raises(ValueError):
+        simulate_power("mean.single", **(params | {"size": 20.5}))
+    with pytest.raises(ValueError):
+        simulate_power("mean.single", **(params | {"offset": [0.5, 1]}))
+    with pytest.raises(TypeError):
+        simulate_power("mean.single", **(params | {"sd": 1}))
@@ -0,0 +1,149 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from math import floor
+
+import numpy as np
+import pytest
+
+from scipy.optimize import brentq
+
+from pystatpower._solver import _chandrupatla
+from pystatpower._solver import _min_cost_sizes
+from pystatpower._solver import _min_size
+from pystatpower._solver import _min_sizes
+from pystatpower._solver import _root
+from pystatpower.exceptions import SolutionNotFoundError
+
+
+def test_chandrupatla() -> None:
+    c = np.linspace(0.5, 50, 25)
+    p = np.linspace(0.5, 3, 25)
+
+    roots = _chandrupatla(lambda x, c, p: x**p - c, 0, 100, args=(c, p))
+    expected = [brentq(lambda x, c=c, p=p: x**p - c, 0, 100) for c, p in zip(c, p, strict=True)]
+    assert np.allclose(roots, expected, rtol=1e-12, atol=1e-12)
+
+    # exact roots at the bracket ends
+    assert np.array_equal(_chandrupatla(lambda x: x, [0, -1], [1, 0]), [0, 0])
+
+    # broadcast shape
+    assert _chandrupatla(lambda x, c: x - c, 0, 10, args=(np.ones((2, 3)),)).shape == (2, 3)
+
+
+def test_chandrupatla_raise_error() -> None:
+    with pytest.raises(SolutionNotFoundError):
+        _chandrupatla(lambda x, c: x - c, 0, 1, args=([0.5, 2],))
+    with pytest.raises(SolutionNotFoundError):
+        _chandrupatla(lambda x: x**3 - 0.3, 0, 1, maxiter=2)
+    with pytest.raises(SolutionNotFoundError):
+        _chandrupatla(lambda x: np.where(x > 0.25, np.nan, x - 0.5), 0, 1)
+
+
+def test_chandrupatla_not_strict() -> None:
+    roots = _chandrupatla(lambda x, c: np.where(c < 0, np.nan, x - c), 0, 1, args=([0.5, 2, -1, 0.25],), strict=False)
+    assert np.allclose(roots[[0, 3]], [0.5, 0.25])
+    assert np.all(np.isnan(roots[[1, 2]]))
+
+
+def test_min_sizes() -> None:
+    c = np.geomspace(1, 1e6, 13)
+    evaluations = []
+
+    def f(size: np.ndarray, c: np.ndarray) -> np.ndarray:
+        evaluations.append(size.size)
+        return np.log(size) - np.log(c)
+
+    assert np.array_equal(_min_sizes(f, 1e-12, 1e12, args=(c,)), np.ceil(c))
+    assert len(evaluations) < 30
+
+    # The same sizes as the scalar search, including the lower end and integer roots.
+    c = np.array([0.5, 2, 2.5, 17, 1e4 + 0.1])
+    assert np.array_equal(_min_sizes(f, 2, args=(c,)), [_min_size(lambda x, c=c: f(np.array(x), c), 2) for c in c])
+
+    # The elements without a solution within the search range are NaN.
+    result = _min_sizes(f, 2, 1e6, args=([10, 1e7, np.nan],))
+    assert result[0] == 10
+    assert np.all(np.isnan(result[1:]))
+
+
+def test_min_size() -> None:
+    calls = []
+
+    def f(x: int) -> float:
+        calls.append(x)
+        return x - 100.5
+
+    for guess in [None, 1, 50, 100, 100.5, 101, 200, 1e12, float("inf")]:
+        calls.clear()
+        assert _min_size(f, 1.1, 1e12, guess=guess) == 101
+        assert all(isinstance(x, int) for x in calls)
+    assert len(calls) < 2 * 40
+
+    # a good guess isolates the solution in a few evaluations
+    calls.clear()
+    assert _min_size(f, 1.1, 1e12, guess=100.7) == 101
+    assert len(calls) <= 3
+
+    assert _min_size(lambda x: 100.5 - x, 1.1, 1e12, decreasing=True) == 101
+    assert _min_size(f, 1.1, 1e12, guess=150) == 101
+
+    # solutions at the lower end of the search range
+    assert _min_size(lambda x: x - 1, 1e-12, 1e12) == 1
+    assert _min_size(lambda x: x + 1, 1.1, 1e12, guess=50) == 2
+
+
+def test_min_size_raise_error() -> None:
+    with pytest.raises(SolutionNotFoundError):
+        _min_size(lambda x: x - 100.5, 1.1, 60)
+    with pytest.raises(SolutionNotFoundError):
+        _min_size(lambda x: -1, 1.1, 1e12, guess=100)
+
+
+def test_root() -> None:
+    # bounded search range
+    assert _root(lambda x: x**2 - 2, 0, 2) == pytest.approx(2**0.5, abs=1e-12)
+
+    # expansion towards an infinite end, from the finite end or from a starting point
+    assert _root(lambda x: x - 1e6, 0) == pytest.approx(1e6, abs=1e-6)
+    assert _root(lambda x: x + 3, ub=5, step=0.1) == pytest.approx(-3, abs=1e-12)
+    assert _root(lambda x: np.tanh(x - 7)) == pytest.approx(7, abs=1e-12)
+    assert _root(lambda x: 5 - x, start=100, step=1) == pytest.approx(5, abs=1e-12)
+
+    # expansion towards a finite end, which is never evaluated
+    def f(x: float) -> float:
+        assert x > 0
+        return 1 - 1e-3 / x
+
+    assert _root(f, 0, start=1) == pytest.approx(1e-3, abs=1e-12)
+
+    # exact roots found while expanding
+    assert _root(lambda x: x - 4, 0, step=1) == 4
+    assert _root(lambda x: x - 4, start=4) == 4
+
+
+def test_root_raise_error() -> None:
+    with pytest.raises(SolutionNotFoundError):
+        _root(lambda x: x**2 + 1, -1, 1)
+    with pytest.raises(SolutionNotFoundError):
+        _root(lambda x: x**2 + 1)
+    with pytest.raises(SolutionNotFoundError):
+        _root(lambda x: x - 1e13, 0)
+    with pytest.raises(SolutionNotFoundError):
+        _root(lambda x: np.nan, 0, 1)
+
+
+@pytest.mark.parametrize(("treatment_cost", "reference_cost"), [(1, 1), (3, 1), (1, 7.5)])
+@pytest.mark.parametrize(("a", "b"), [(40, 10), (10, 10), (3000, 500)])
+def test_min_cost_sizes(a: float, b: float, treatment_cost: float, reference_cost: float) -> None:
+    def f(treatment_size: np.ndarray, reference_size: np.ndarray) -> np.ndarray:
+        return 1 - a / treatment_size - b / reference_size
+
+    treatment_size, reference_size = _min_cost_sizes(f, treatment_cost, reference_cost, 1)
+    assert f(treatment_size, reference_size) >= 0
+
+    # For each reference size, the smallest treatment size is a / (1 - b / reference_size), rounded up.
+    reference_sizes = np.arange(floor(b) + 1, 100000)
+    treatment_sizes = np.ceil(a / (1 - b / reference_sizes) - 1e-9)
+    costs = treatment_cost * treatment_sizes + reference_cost * reference_sizes
+    assert treatment_cost * treatment_size + reference_cost * reference_size == pytest.approx(costs.min())
@@ -0,0 +1,78 @@
+# Copyright (C) 2024-present The Package Authors
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pystatpower import diagnostics
+from pystatpower import tables
+from pystatpower.proportion.independent import ci
+from pystatpower.proportion.single.inequality import solve_size
+
+
+def test_build_save_load(tmp_path: Path) -> None:
+    axes = {"proportion": np.linspace(0.55, 0.95, 17), "power": tables.STANDARD_AXES["power"]}
+    table = tables.build(solve_size, axes, null_proportion=0.5, method="z-p0")
+    assert table.function == "proportion.single.inequality.solve_size"
+    assert table.solutions.shape == (17, 9, 1)
+    assert table.solutions[4, 4, 0] == solve_size(proportion=0.65, null_proportion=0.5, power=0.8, method="z-p0")
+
+    table.save(tmp_path / "table.npy")
+    loaded = tables.load(tmp_path / "table.npy")
+    assert isinstance(loaded.solutions, np.memmap)
+    assert loaded.function == table.function
+    assert loaded.params == table.params
+    assert np.array_equal(loaded.solutions, table.solutions)
+    for name, axis in table.axes.items():
+        assert np.array_equal(loaded.axes[name], axis)
+
+    assert tables.build(solve_size, axes, workers=2, null_proportion=0.5, method="z-p0").solutions.tolist() == (
+        table.solutions.tolist()
+    )
+
+
+def test_solve(tmp_path: Path) -> None:
+    axes = {"proportion": np.linspace(0.55, 0.95, 17), "power": tables.STANDARD_AXES["power"]}
+    tables.build(solve_size, axes, null_proportion=0.5, method="z-p0").save(tmp_path / "table.npy")
+    table = tables.load(tmp_path / "table.npy")
+
+    queries = [{"proportion": p, "power": power} for p in (0.613, 0.7, 0.77, 0.949) for power in (0.8, 0.83, 0.99)]
+    with diagnostics.record() as cold:
+        expected = [solve_size(**query, null_proportion=0.5, method="z-p0") for query in queries]
+    with diagnostics.record() as warm:
+        assert [table.solve(**query) for query in queries] == expected
+    assert sum(call.evaluations for call in warm.calls) < sum(call.evaluations for call in cold.calls) / 2
+
+    # queries not covered by the table are solved from scratch
+    assert table.solve(proportion=0.52, power=0.8) == solve_size(proportion=0.52, null_proportion=0.5, method="z-p0")
+    assert table.solve(proportion=0.7, power=0.8, null_proportion=0.4) == solve_size(
+        proportion=0.7, null_proportion=0.4, method="z-p0"
+    )
+    assert table.solve(proportion=0.7, power=0.8, alpha=0.01) == solve_size(
+        proportion=0.7, null_proportion=0.5, alpha=0.01, method="z-p0"
+    )
+
+
+def test_solve_two_groups() -> None:
+    axes = {"distance": np.geomspace(0.05, 0.4, 12), "conf_level": tables.STANDARD_AXES["conf_level"]}
+    params = {"treatment_proportion": 0.6, "reference_proportion": 0.4, "method": "mn"}
+    table = tables.build(ci.solve_size, axes, **params)
+    for distance in (0.061, 0.2, 0.37):
+        assert table.solve(distance=distance, conf_level=0.93) == ci.solve_size(
+            distance=distance, conf_level=0.93, **params
+        )
+
+
+def test_build_illegal_argument() -> None:
+    with pytest.raises(ValueError):
+        tables.build("proportion.single.inequality.solve_power", {"proportion": [0.6, 0.7]}, null_proportion=0.5)
+    with pytest.raises(ValueError):
+        tables.build(solve_size, {"proportion": [0.7, 0.6]}, null_proportion=0.5)
+    with pytest.raises(ValueError):
+        tables.build(solve_size, {"proportion": []}, null_proportion=0.5)
+    with pytest.raises(ValueError):
+        tables.build(solve_size, {"proportion": [0.6, 0.7]}, proportion=0.6, null_proportion=0.5)
+    with pytest.raises(ValueError):
+        tables.build(solve_size, {}, proportion=0.6, null_proportion=0.5)